@@ -0,0 +1,155 @@
+import os
+import socket
+import threading
+import uuid
+from datetime import timedelta
+
+from django.db import connections
+from django.utils import timezone
+
+from .models import SelfStudyAIDraftJob
+from .self_study_ai import augment_self_study_payload_with_ai
+from .views import _build_self_study_payload, _ensure_cycle, _persist_self_study_ai_fields
+
+
+AI_DRAFT_JOB_LEASE_SECONDS = int(os.environ.get('AI_DRAFT_JOB_LEASE_SECONDS', '120'))
+
+
+def new_worker_id():
+    return f'{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}'
+
+
+def _lease_expiry():
+    return timezone.now() + timedelta(seconds=AI_DRAFT_JOB_LEASE_SECONDS)
+
+
+def requeue_interrupted_jobs():
+    """Put running jobs whose worker stopped renewing the lease back in the queue."""
+    expired = SelfStudyAIDraftJob.objects.filter(status=SelfStudyAIDraftJob.STATUS_RUNNING).exclude(
+        lease_expires_at__gte=timezone.now(),
+    )
+    return expired.update(
+        status=SelfStudyAIDraftJob.STATUS_QUEUED,
+        started_at=None,
+        completed_fields=0,
+        worker_id='',
+        lease_expires_at=None,
+    )
+
+
+def claim_next_job(worker_id):
+    """Atomically move the oldest queued job to running under `worker_id` and return it, or None."""
+    queued = SelfStudyAIDraftJob.objects.filter(status=SelfStudyAIDraftJob.STATUS_QUEUED).order_by('created_at', 'id')
+    for job_id in queued.values_list('id', flat=True)[:10]:
+        claimed = SelfStudyAIDraftJob.objects.filter(pk=job_id, status=SelfStudyAIDraftJob.STATUS_QUEUED).update(
+            status=SelfStudyAIDraftJob.STATUS_RUNNING,
+            started_at=timezone.now(),
+            worker_id=worker_id,
+            lease_expires_at=_lease_expiry(),
+        )
+        if claimed:
+            return SelfStudyAIDraftJob.objects.get(pk=job_id)
+    return None
+
+
+def _owned(job):
+    return SelfStudyAIDraftJob.objects.filter(
+        pk=job.pk,
+        status=SelfStudyAIDraftJob.STATUS_RUNNING,
+        worker_id=job.worker_id,
+    )
+
+
+def renew_lease(job):
+    """Extend the job's lease; False if another worker has taken the job over."""
+    return bool(_owned(job).update(lease_expires_at=_lease_expiry()))
+
+
+def _renew_until(job, stop):
+    try:
+        while not stop.wait(AI_DRAFT_JOB_LEASE_SECONDS / 3):
+            if not renew_lease(job):
+                return
+    finally:
+        connections.close_all()
+
+
+def _finish(job, status, result=None, error=''):
+    _owned(job).update(
+        status=status,
+        result=result,
+        error=error,
+        finished_at=timezone.now(),
+        lease_expires_at=None,
+    )
+
+
+def run_job(job):
+    stop = threading.Event()
+    heartbeat = threading.Thread(target=_renew_until, args=(job, stop), daemon=True)
+    heartbeat.start()
+    try:
+        _run_job(job)
+    finally:
+        stop.set()
+        heartbeat.join()
+
+
+def _run_job(job):
+    cycle = _ensure_cycle(job.cycle_id)
+    if not cycle:
+        _finish(job, SelfStudyAIDraftJob.STATUS_FAILED, error='Accreditation cycle not found.')
+        return
+
+    def progress(completed_fields, total_fields):
+        _owned(job).update(
+            completed_fields=completed_fields,
+            total_fields=total_fields,
+        )
+
+    try:
+        augmented_payload, applied_fields, invalid_fields, failed_fields, error = augment_self_study_payload_with_ai(
+            _build_self_study_payload(cycle),
+            job.selected_fields,
+            progress=progress,
+        )
+        if error:
+            _finish(
+                job,
+                SelfStudyAIDraftJob.STATUS_FAILED,
+                result={'invalidFields': invalid_fields, 'failedFields': failed_fields},
+                error=error,
+            )
+            return
+
+        response_payload = augmented_payload
+        if not renew_lease(job):
+            # The lease ran out and the job was requeued; its new run saves the fields.
+            return
+        if job.save_to_backend:
+            _persist_self_study_ai_fields(cycle, augmented_payload, applied_fields)
+            response_payload = _build_self_study_payload(cycle)
+    except Exception as exc:  # noqa: BLE001 - a failed job must not stop the worker
+        _finish(job, SelfStudyAIDraftJob.STATUS_FAILED, error=str(exc) or exc.__class__.__name__)
+        return
+
+    _finish(job, SelfStudyAIDraftJob.STATUS_SUCCEEDED, result={
+        'payload': response_payload,
+        'appliedFields': applied_fields,
+        'invalidFields': invalid_fields,
+        'failedFields': failed_fields,
+        'savedToBackend': job.save_to_backend,
+        'message': (
+            f'AI drafted {len(applied_fields)} field{"s" if len(applied_fields) != 1 else ""}'
+            f'{" and saved them to the cycle records" if job.save_to_backend else ""}'
+            f'{f"; {len(failed_fields)} could not be drafted" if failed_fields else ""}.'
+        ),
+    })
+
+
+def run_job_in_thread(job):
+    # Worker threads open their own connections; release them when the job ends.
+    try:
+        run_job(job)
+    finally:
+        connections.close_all()
@@ -0,0 +1,230 @@
+"""
+Shared HTTP client for the AI provider APIs (OpenAI, Gemini).
+
+Connections are kept alive and pooled per host, concurrent requests to a host
+are bounded, 429 and 5xx responses are retried with jittered exponential
+backoff, and every call is timed per provider. A POST is only sent again when
+its connection could not be opened; once any of it went out it is never
+repeated, so a completion is not paid for twice. HTTP(S)_PROXY and NO_PROXY
+are honoured the way urlopen honours them.
+"""
+import base64
+import http.client
+import os
+import random
+import select
+import threading
+import time
+from io import BytesIO
+from urllib import error as urllib_error
+from urllib.parse import unquote, urlsplit
+from urllib.request import getproxies, proxy_bypass
+
+
+AI_HTTP_POOL_SIZE = int(os.environ.get('AI_HTTP_POOL_SIZE', '4'))
+AI_HTTP_MAX_CONCURRENCY = int(os.environ.get('AI_HTTP_MAX_CONCURRENCY', '8'))
+AI_HTTP_MAX_RETRIES = int(os.environ.get('AI_HTTP_MAX_RETRIES', '2'))
+AI_HTTP_BACKOFF_SECONDS = float(os.environ.get('AI_HTTP_BACKOFF_SECONDS', '0.5'))
+AI_HTTP_MAX_BACKOFF_SECONDS = 8.0
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+_pools = {}
+_pools_lock = threading.Lock()
+_stats = {}
+_stats_lock = threading.Lock()
+
+
+class _NotSent(Exception):
+    """The connection could not be opened, so no part of the request went out."""
+
+
+class _HostPool:
+    def __init__(self, scheme, host, port, proxy):
+        self.scheme = scheme
+        self.host = host
+        self.port = port
+        self.proxy = urlsplit(proxy) if proxy else None
+        self.idle = []
+        self.lock = threading.Lock()
+        self.slots = threading.BoundedSemaphore(AI_HTTP_MAX_CONCURRENCY)
+
+    def _proxy_headers(self):
+        if not self.proxy.username:
+            return {}
+        credentials = f'{unquote(self.proxy.username)}:{unquote(self.proxy.password or "")}'
+        return {'Proxy-Authorization': f'Basic {base64.b64encode(credentials.encode()).decode("ascii")}'}
+
+    def _connect(self, timeout):
+        if self.proxy is None:
+            connection_class = http.client.HTTPSConnection if self.scheme == 'https' else http.client.HTTPConnection
+            return connection_class(self.host, self.port, timeout=timeout)
+        proxy_port = self.proxy.port or (443 if self.proxy.scheme == 'https' else 80)
+        if self.scheme == 'https':
+            connection = http.client.HTTPSConnection(self.proxy.hostname, proxy_port, timeout=timeout)
+            connection.set_tunnel(self.host, self.port, headers=self._proxy_headers())
+            return connection
+        return http.client.HTTPConnection(self.proxy.hostname, proxy_port, timeout=timeout)
+
+    def request_target(self, path):
+        # Plain HTTP through a proxy names the absolute URL; tunnels and direct connections use the path.
+        if self.proxy is not None and self.scheme == 'http':
+            return f'http://{self.host}{f":{self.port}" if self.port else ""}{path}'
+        return path
+
+    def request_headers(self):
+        if self.proxy is not None and self.scheme == 'http':
+            return self._proxy_headers()
+        return {}
+
+    def acquire(self, timeout):
+        while True:
+            with self.lock:
+                connection = self.idle.pop() if self.idle else None
+            if connection is None:
+                return self._connect(timeout)
+            if _dropped(connection):
+                connection.close()
+                continue
+            connection.timeout = timeout
+            connection.sock.settimeout(timeout)
+            return connection
+
+    def release(self, connection):
+        with self.lock:
+            if len(self.idle) < AI_HTTP_POOL_SIZE:
+                self.idle.append(connection)
+                return
+        connection.close()
+
+
+def _dropped(connection):
+    # An idle keep-alive socket that is readable has been closed by the server
+    # (or sent something unasked); it must not carry the next request.
+    if connection.sock is None:
+        return True
+    try:
+        return bool(select.select([connection.sock], [], [], 0)[0])
+    except (OSError, ValueError):
+        return True
+
+
+def _proxy_for(parts):
+    if proxy_bypass(parts.hostname or ''):
+        return None
+    return getproxies().get(parts.scheme)
+
+
+def _host_pool(url):
+    parts = urlsplit(url)
+    key = (parts.scheme, parts.hostname, parts.port, _proxy_for(parts))
+    with _pools_lock:
+        if key not in _pools:
+            _pools[key] = _HostPool(*key)
+        return _pools[key]
+
+
+def close_connections():
+    """Close every pooled connection."""
+    with _pools_lock:
+        pools = list(_pools.values())
+        _pools.clear()
+    for pool in pools:
+        with pool.lock:
+            idle, pool.idle = pool.idle, []
+        for connection in idle:
+            connection.close()
+
+
+def _record(provider, seconds, retries, failed):
+    with _stats_lock:
+        entry = _stats.setdefault(provider, {'calls': 0, 'errors': 0, 'retries': 0, 'total_seconds': 0.0, 'max_seconds': 0.0})
+        entry['calls'] += 1
+        entry['errors'] += int(failed)
+        entry['retries'] += retries
+        entry['total_seconds'] += seconds
+        entry['max_seconds'] = max(entry['max_seconds'], seconds)
+
+
+def provider_stats():
+    """Return {provider: {calls, errors, retries, total_seconds, max_seconds, mean_seconds}}."""
+    with _stats_lock:
+        return {
+            provider: {**entry, 'mean_seconds': entry['total_seconds'] / entry['calls'] if entry['calls'] else 0.0}
+            for provider, entry in _stats.items()
+        }
+
+
+def reset_provider_stats():
+    with _stats_lock:
+        _stats.clear()
+
+
+def _backoff(attempt, retry_after=None):
+    if retry_after:
+        try:
+            return min(float(retry_after), AI_HTTP_MAX_BACKOFF_SECONDS)
+        except ValueError:
+            pass
+    return random.uniform(0, min(AI_HTTP_MAX_BACKOFF_SECONDS, AI_HTTP_BACKOFF_SECONDS * (2 ** attempt)))
+
+
+def _send(pool, method, path, body, headers, timeout):
+    connection = pool.acquire(timeout)
+    if connection.sock is None:
+        try:
+            connection.connect()
+        except OSError as exc:
+            connection.close()
+            raise _NotSent() from exc
+    try:
+        connection.request(method, pool.request_target(path), body=body, headers={**pool.request_headers(), **headers})
+        response = connection.getresponse()
+        payload = response.read()
+    except Exception:
+        connection.close()
+        raise
+    if response.will_close:
+        connection.close()
+    else:
+        pool.release(connection)
+    return response, payload
+
+
+def post(url, body, headers=None, timeout=60, provider='ai', max_retries=None):
+    """
+    POST `body` (bytes) to `url` and return the response body.
+
+    Non-2xx responses that are not retried, or still fail after
+    `max_retries` (default AI_HTTP_MAX_RETRIES), raise urllib.error.HTTPError
+    so callers can read the error body the same way they would from urlopen.
+    """
+    if max_retries is None:
+        max_retries = AI_HTTP_MAX_RETRIES
+    pool = _host_pool(url)
+    parts = urlsplit(url)
+    path = parts.path or '/'
+    if parts.query:
+        path = f'{path}?{parts.query}'
+    headers = {'Connection': 'keep-alive', **(headers or {})}
+
+    started = time.perf_counter()
+    attempt = 0
+    failed = True
+    try:
+        while True:
+            with pool.slots:
+                try:
+                    response, payload = _send(pool, 'POST', path, body, headers, timeout)
+                except _NotSent as exc:
+                    if attempt >= max_retries:
+                        raise exc.__cause__
+                    response = None
+            if response is not None and 200 <= response.status < 300:
+                failed = False
+                return payload
+            if response is not None and (response.status not in RETRY_STATUSES or attempt >= max_retries):
+                raise urllib_error.HTTPError(url, response.status, response.reason, response.headers, BytesIO(payload))
+            time.sleep(_backoff(attempt, response.headers.get('Retry-After') if response is not None else None))
+            attempt += 1
+    finally:
+        _record(provider, time.perf_counter() - started, attempt, failed)
@@ -0,0 +1,472 @@
+import re
+
+from django.db import NotSupportedError, connection
+
+from .db_setup import SUPPORTS_PEO_SQL, SYLLABUS_CLO_SO_MAP_SQL
+from .models import (
+    AcademicSupportUnit,
+    AccreditationCycle,
+    AdditionalInformation,
+    AppendixA,
+    AppendixB,
+    AppendixCEquipment,
+    AppendixDInstitution,
+    AssignedTo,
+    Assesment,
+    BackgroundInfo,
+    ChecklistItem,
+    CiActionRow,
+    Classrooms,
+    ComputingResources,
+    Corequisite,
+    Course,
+    CourseDiscription,
+    Criterion1Students,
+    Criterion2Peos,
+    Criterion3SoPeo,
+    Criterion4,
+    Criterion5Curriculum,
+    Criterion6Faculty,
+    Criterion7Facilities,
+    Criterion8InstitutionalSupport,
+    CurriculumCourseRow,
+    CycleChecklist,
+    DesignProjectRow,
+    EnrollmentRecord,
+    EquipmentItem,
+    EvidenceFile,
+    FacultyQualificationRow,
+    FacultyWorkloadRow,
+    HasClo,
+    InstructorSyllabus,
+    Laboratories,
+    MapsTo,
+    NonacademicSupportUnit,
+    OutcomeAttainmentRow,
+    Peo,
+    PersonnelRecord,
+    Prerequisite,
+    ProfessionalDevelopment,
+    Program,
+    ResponsibleFor,
+    SelfStudySectionVersion,
+    StaffingRow,
+    StudentOutcome,
+    SupplementMaterial,
+    SupportsPeo,
+    Teaches,
+    Textbook,
+    UnifiedSyllabus,
+    UpgradingFacilities,
+    WeeklyTopicOutline,
+    Workload,
+)
+
+
+
+
+# Row filters name the id sets they select by with `{placeholders}`; callers
+# bind each one to SQL (a subquery or an id list) before running them. Parents
+# come before the rows that reference them, so deletes walk the lists reversed.
+_CRITERION4_ROWS = 'criterion4_id IN (SELECT criterion4_id FROM CRITERION_4 WHERE Cycle_ID IN ({cycles}))'
+_CRITERION6_ROWS = 'criterion6_id IN (SELECT criterion6_id FROM CRITERION_6_FACULTY WHERE Cycle_ID IN ({cycles}))'
+_CRITERION7_ROWS = 'criterion7_id IN (SELECT criterion7_id FROM CRITERION_7_FACILITIES WHERE Cycle_ID IN ({cycles}))'
+_APPENDIX_D_ROWS = 'appendix_d_id IN (SELECT appendix_d_id FROM APPENDIX_D_INSTITUTION WHERE Cycle_ID IN ({cycles}))'
+_SECTION_COLUMN = 'SELECT {column} FROM INSTRUCTOR_SYLLABUS WHERE Course_ID IN ({{courses}})'
+
+COURSE_GRAPH = [
+    (
+        UnifiedSyllabus,
+        'unified_syllabus_id IN (SELECT unified_syllabus_id FROM COURSE WHERE Course_ID IN ({courses}) '
+        f'UNION {_SECTION_COLUMN.format(column="unified_syllabus_id")})',
+    ),
+    (Course, 'Course_ID IN ({courses})'),
+    (CourseDiscription, f'description_id IN ({_SECTION_COLUMN.format(column="description_id")})'),
+    (WeeklyTopicOutline, f'outline_id IN ({_SECTION_COLUMN.format(column="outline_id")})'),
+    (AdditionalInformation, f'additional_info_id IN ({_SECTION_COLUMN.format(column="additional_info_id")})'),
+    (InstructorSyllabus, 'Course_ID IN ({courses})'),
+    (Textbook, 'syllabus_id IN ({syllabi})'),
+    (SupplementMaterial, 'syllabus_id IN ({syllabi})'),
+    (Prerequisite, 'syllabus_id IN ({syllabi})'),
+    (Corequisite, 'syllabus_id IN ({syllabi})'),
+    (Assesment, 'syllabus_id IN ({syllabi})'),
+    (HasClo, 'syllabus_id IN ({syllabi})'),
+    (Teaches, 'Course_ID IN ({courses})'),
+]
+
+CYCLE_GRAPH = [
+    (CycleChecklist, 'checklist_id IN ({checklists})'),
+    (Criterion2Peos, 'criterion2_id IN ({criterion2})'),
+    (Criterion3SoPeo, 'criterion3_id IN ({criterion3})'),
+    (Criterion5Curriculum, 'criterion5_id IN ({criterion5})'),
+    (AppendixA, 'appendixA_id IN ({appendixA})'),
+    (AccreditationCycle, 'Cycle_ID IN ({cycles})'),
+    (SelfStudySectionVersion, 'Cycle_ID IN ({cycles})'),
+    (Criterion7Facilities, 'Cycle_ID IN ({cycles})'),
+    (Classrooms, _CRITERION7_ROWS),
+    (Laboratories, _CRITERION7_ROWS),
+    (ComputingResources, _CRITERION7_ROWS),
+    (UpgradingFacilities, _CRITERION7_ROWS),
+    (Criterion6Faculty, 'Cycle_ID IN ({cycles})'),
+    (AppendixCEquipment, 'Cycle_ID IN ({cycles})'),
+    (EquipmentItem, 'appendix_c_id IN (SELECT appendix_c_id FROM APPENDIX_C_EQUIPMENT WHERE Cycle_ID IN ({cycles}))'),
+    (ChecklistItem, 'checklist_id IN ({checklists})'),
+    (AppendixB, 'item_id IN (SELECT item_id FROM CHECKLIST_ITEM WHERE checklist_id IN ({checklists}))'),
+    (BackgroundInfo, 'Cycle_ID IN ({cycles})'),
+    (Criterion1Students, 'Cycle_ID IN ({cycles})'),
+    (Criterion4, 'Cycle_ID IN ({cycles})'),
+    (OutcomeAttainmentRow, _CRITERION4_ROWS),
+    (CiActionRow, _CRITERION4_ROWS),
+    (CurriculumCourseRow, 'criterion5_id IN ({criterion5})'),
+    (DesignProjectRow, 'criterion5_id IN ({criterion5})'),
+    (Criterion8InstitutionalSupport, 'Cycle_ID IN ({cycles})'),
+    (StaffingRow, 'criterion8_id IN (SELECT criterion8_id FROM CRITERION_8_INSTITUTIONAL_SUPPORT WHERE Cycle_ID IN ({cycles}))'),
+    (AppendixDInstitution, 'Cycle_ID IN ({cycles})'),
+    (AcademicSupportUnit, _APPENDIX_D_ROWS),
+    (NonacademicSupportUnit, _APPENDIX_D_ROWS),
+    (EnrollmentRecord, _APPENDIX_D_ROWS),
+    (PersonnelRecord, _APPENDIX_D_ROWS),
+    (Workload, 'Cycle_ID IN ({cycles})'),
+    *COURSE_GRAPH,
+    (FacultyQualificationRow, _CRITERION6_ROWS),
+    (FacultyWorkloadRow, _CRITERION6_ROWS),
+    (ProfessionalDevelopment, _CRITERION6_ROWS),
+]
+
+# Program rows left once the program's cycles are gone.
+PROGRAM_GRAPH = [
+    (Program, 'program_id IN ({programs})'),
+    (StudentOutcome, 'program_id IN ({programs})'),
+    (Peo, 'program_id IN ({programs})'),
+    (MapsTo, 'so_id IN (SELECT so_id FROM STUDENT_OUTCOME WHERE program_id IN ({programs}))'),
+    (
+        SupportsPeo,
+        'so_id IN (SELECT so_id FROM STUDENT_OUTCOME WHERE program_id IN ({programs})) '
+        'OR peo_id IN (SELECT peo_id FROM PEO WHERE program_id IN ({programs}))',
+    ),
+    (AssignedTo, 'program_id IN ({programs})'),
+    (ResponsibleFor, 'program_id IN ({programs})'),
+    (EvidenceFile, 'program_id IN ({programs})'),
+]
+
+# Rows that point into a subtree without being copied along with it. Workload
+# rows name the course they cover; FacultyWorkloadRow.course cascades, as the
+# ORM deletes of cycles and programs always did.
+COURSE_REFERENCES = [
+    ('SYLLABUS_CLO_SO_MAP', 'syllabus_id IN ({syllabi})'),
+    ('FACULTY_WORKLOAD_ROW', 'Course_ID IN ({courses})'),
+]
+CYCLE_REFERENCES = [
+    *COURSE_REFERENCES,
+    ('EVIDENCE_FILE', 'Cycle_ID IN ({cycles})'),
+    ('SELF_STUDY_AI_DRAFT_JOB', 'Cycle_ID IN ({cycles})'),
+]
+
+# Syllabus parts shared by reference between sections and courses. Deletes
+# note the ids the doomed courses and sections point at, leave those rows
+# behind, and finally drop the ones nothing references any more.
+ORPHAN_SWEEPS = [
+    ('COURSE_DISCRIPTION', 'description_id', [('INSTRUCTOR_SYLLABUS', 'description_id')]),
+    ('WEEKLY_TOPIC_OUTLINE', 'outline_id', [('INSTRUCTOR_SYLLABUS', 'outline_id')]),
+    ('ADDITIONAL_INFORMATION', 'additional_info_id', [('INSTRUCTOR_SYLLABUS', 'additional_info_id')]),
+    (
+        'UNIFIED_SYLLABUS',
+        'unified_syllabus_id',
+        [('COURSE', 'unified_syllabus_id'), ('INSTRUCTOR_SYLLABUS', 'unified_syllabus_id')],
+    ),
+]
+_SWEPT_TABLES = {table for table, _, _ in ORPHAN_SWEEPS}
+
+# Rows a cycle points at rather than owns; cycles may share them.
+_CYCLE_PARENTS = {
+    'checklists': 'checklist_id',
+    'criterion2': 'criterion2_id',
+    'criterion3': 'criterion3_id',
+    'criterion5': 'criterion5_id',
+    'appendixA': 'appendixA_id',
+}
+
+_PLACEHOLDER = re.compile(r'\{(\w+)\}')
+
+
+def _qn(name):
+    return connection.ops.quote_name(name)
+
+
+def _bind(template, bindings):
+    sql_parts = []
+    params = []
+    position = 0
+    for match in _PLACEHOLDER.finditer(template):
+        bound_sql, bound_params = bindings[match.group(1)]
+        sql_parts.append(template[position:match.start()])
+        sql_parts.append(bound_sql)
+        params.extend(bound_params)
+        position = match.end()
+    sql_parts.append(template[position:])
+    return ''.join(sql_parts), params
+
+
+def _id_list(ids):
+    ids = [int(value) for value in ids]
+    return ', '.join(['%s'] * len(ids)), ids
+
+
+def _placeholders(row_filter):
+    return set(_PLACEHOLDER.findall(row_filter))
+
+
+def _cycle_bindings(cycles):
+    bindings = {'cycles': cycles}
+    for name, column in _CYCLE_PARENTS.items():
+        bindings[name] = _bind(f'SELECT {column} FROM ACCREDIATION_CYCLE WHERE Cycle_ID IN ({{cycles}})', bindings)
+    bindings['courses'] = _bind('SELECT Course_ID FROM COURSE WHERE Cycle_ID IN ({cycles})', bindings)
+    return _course_bindings(bindings)
+
+
+def _course_bindings(bindings):
+    bindings['syllabi'] = _bind('SELECT syllabus_id FROM INSTRUCTOR_SYLLABUS WHERE Course_ID IN ({courses})', bindings)
+    return bindings
+
+
+def _clone_rows(cursor, model, row_filter, remaps, overrides):
+    meta = model._meta
+    table = meta.db_table
+    pk_column = meta.pk.column
+    filter_sql, filter_params = row_filter
+
+    offset = None
+    # Join tables keyed by their foreign keys have no id of their own to shift.
+    if meta.pk.column and not meta.pk.is_relation:
+        cursor.execute(
+            f'SELECT (SELECT COALESCE(MAX({_qn(pk_column)}), 0) FROM {_qn(table)}), '
+            f'(SELECT MIN({_qn(pk_column)}) FROM {_qn(table)} WHERE {filter_sql})',
+            filter_params,
+        )
+        max_id, min_source_id = cursor.fetchone()
+        if min_source_id is None:
+            return 0
+        # Shifting every copied id by the same offset keeps the new ids unique
+        # and lets children find their new parent without a lookup table.
+        offset = int(max_id) - int(min_source_id) + 1
+
+    columns = []
+    expressions = []
+    params = []
+    for field in meta.concrete_fields:
+        column = _qn(field.column)
+        columns.append(column)
+        if field.column in overrides:
+            expressions.append('%s')
+            params.append(overrides[field.column])
+        elif field.primary_key and offset is not None:
+            expressions.append(f'{column} + %s')
+            params.append(offset)
+        elif field.is_relation and field.related_model._meta.db_table in remaps:
+            target = field.related_model._meta
+            target_offset, (target_sql, target_params) = remaps[target.db_table]
+            expressions.append(
+                f'CASE WHEN {column} IN (SELECT {_qn(target.pk.column)} FROM {_qn(target.db_table)} '
+                f'WHERE {target_sql}) THEN {column} + %s ELSE {column} END'
+            )
+            params.extend(target_params)
+            params.append(target_offset)
+        else:
+            expressions.append(column)
+
+    cursor.execute(
+        f'INSERT INTO {_qn(table)} ({", ".join(columns)}) '
+        f'SELECT {", ".join(expressions)} FROM {_qn(table)} WHERE {filter_sql}',
+        params + filter_params,
+    )
+    if offset is not None:
+        remaps[table] = (offset, row_filter)
+    return cursor.rowcount
+
+
+def lock_for_clone():
+    """
+    Take the lock clone_cycle holds while it picks ids, so callers can check
+    the cycle years under it first.
+
+    Must run inside a transaction. Raises NotSupportedError outside SQLite.
+    """
+    # New ids are taken past each table's MAX, not from a sequence. SQLite bumps
+    # AUTOINCREMENT counters on explicit ids; Postgres/MySQL sequences would not
+    # move and later inserts would collide.
+    if connection.vendor != 'sqlite':
+        raise NotSupportedError('Cycle cloning assigns ids itself and only supports SQLite.')
+    # A write that matches no rows still takes the database write lock, so a
+    # concurrent clone waits here instead of reading the same MAX ids.
+    with connection.cursor() as cursor:
+        cursor.execute(f'UPDATE {_qn(AccreditationCycle._meta.db_table)} SET Cycle_ID = Cycle_ID WHERE 0 = 1')
+
+
+def clone_cycle(source_cycle_id, start_year, end_year):
+    """
+    Copy a cycle and every row hanging off it with one INSERT ... SELECT per table.
+
+    SQLite only. Must run inside a transaction. Returns the new cycle id.
+    """
+    bindings = _cycle_bindings(_id_list([source_cycle_id]))
+    remaps = {}
+    lock_for_clone()
+    with connection.cursor() as cursor:
+        for model, row_filter in CYCLE_GRAPH:
+            overrides = {}
+            if model is AccreditationCycle:
+                overrides = {'Start_year': start_year, 'End_year': end_year}
+            _clone_rows(cursor, model, _bind(row_filter, bindings), remaps, overrides)
+
+        cursor.execute(SYLLABUS_CLO_SO_MAP_SQL)
+        syllabus_remap = remaps.get(InstructorSyllabus._meta.db_table)
+        if syllabus_remap:
+            syllabi_sql, syllabi_params = bindings['syllabi']
+            cursor.execute(
+                f'''
+                INSERT INTO SYLLABUS_CLO_SO_MAP (syllabus_id, clo_id, so_id)
+                SELECT syllabus_id + %s, clo_id, so_id FROM SYLLABUS_CLO_SO_MAP
+                WHERE syllabus_id IN ({syllabi_sql})
+                ''',
+                [syllabus_remap[0], *syllabi_params],
+            )
+
+    return source_cycle_id + remaps[AccreditationCycle._meta.db_table][0]
+
+
+def _delete_rows(cursor, table, row_filter, bindings):
+    filter_sql, filter_params = _bind(row_filter, bindings)
+    cursor.execute(f'DELETE FROM {_qn(table)} WHERE {filter_sql}', filter_params)
+    return cursor.rowcount
+
+
+def _delete_graph(cursor, graph, bindings):
+    deleted = 0
+    for model, row_filter in reversed(graph):
+        table = model._meta.db_table
+        if table in _SWEPT_TABLES or not _placeholders(row_filter) <= bindings.keys():
+            continue
+        deleted += _delete_rows(cursor, table, row_filter, bindings)
+    return deleted
+
+
+def _sweep_candidates(cursor, bindings):
+    """Return {table: ids} of the shared syllabus parts the rows about to be deleted point at."""
+    candidates = {}
+    for model, row_filter in COURSE_GRAPH:
+        table = model._meta.db_table
+        if table not in _SWEPT_TABLES:
+            continue
+        filter_sql, filter_params = _bind(row_filter, bindings)
+        cursor.execute(f'SELECT {_qn(model._meta.pk.column)} FROM {_qn(table)} WHERE {filter_sql}', filter_params)
+        candidates[table] = [int(row[0]) for row in cursor.fetchall()]
+    return candidates
+
+
+def _sweep_orphans(cursor, candidates):
+    deleted = 0
+    for table, pk_column, references in ORPHAN_SWEEPS:
+        ids = _id_list(candidates.get(table) or [])
+        if not ids[1]:
+            continue
+        conditions = ' AND '.join(
+            f'NOT EXISTS (SELECT 1 FROM {_qn(ref_table)} WHERE {_qn(ref_table)}.{_qn(ref_column)} = '
+            f'{_qn(table)}.{_qn(pk_column)})'
+            for ref_table, ref_column in references
+        )
+        cursor.execute(f'DELETE FROM {_qn(table)} WHERE {_qn(pk_column)} IN ({ids[0]}) AND {conditions}', ids[1])
+        deleted += cursor.rowcount
+    return deleted
+
+
+def _delete_cycles(cursor, cycle_ids):
+    cycles = _id_list(cycle_ids)
+    if not cycles[1]:
+        return 0
+
+    cursor.execute(
+        f'SELECT {", ".join(_CYCLE_PARENTS.values())} FROM ACCREDIATION_CYCLE WHERE Cycle_ID IN ({cycles[0]})',
+        cycles[1],
+    )
+    parent_ids = {name: set() for name in _CYCLE_PARENTS}
+    for row in cursor.fetchall():
+        for name, value in zip(_CYCLE_PARENTS, row):
+            if value is not None:
+                parent_ids[name].add(int(value))
+
+    cursor.execute(SYLLABUS_CLO_SO_MAP_SQL)
+    bindings = _cycle_bindings(cycles)
+    sweep_ids = _sweep_candidates(cursor, bindings)
+    deleted = sum(_delete_rows(cursor, table, row_filter, bindings) for table, row_filter in CYCLE_REFERENCES)
+
+    # Owned rows first; the shared parents are resolved once the cycles are gone.
+    owned = {key: value for key, value in bindings.items() if key not in _CYCLE_PARENTS}
+    deleted += _delete_graph(cursor, CYCLE_GRAPH, owned)
+
+    shared = {}
+    for name, column in _CYCLE_PARENTS.items():
+        if not parent_ids[name]:
+            continue
+        candidates = _id_list(sorted(parent_ids[name]))
+        cursor.execute(f'SELECT {column} FROM ACCREDIATION_CYCLE WHERE {column} IN ({candidates[0]})', candidates[1])
+        orphaned = parent_ids[name] - {int(row[0]) for row in cursor.fetchall()}
+        if orphaned:
+            shared[name] = _id_list(sorted(orphaned))
+    parent_graph = [entry for entry in CYCLE_GRAPH if _placeholders(entry[1]) & _CYCLE_PARENTS.keys()]
+    deleted += _delete_graph(cursor, parent_graph, shared)
+    deleted += _sweep_orphans(cursor, sweep_ids)
+    return deleted
+
+
+def delete_cycles(cycle_ids):
+    """
+    Delete cycles and everything hanging off them with set-based DELETE statements.
+
+    The statement count depends on the table graph, not on how many rows go.
+    Must run inside a transaction. Returns the number of rows deleted.
+    """
+    with connection.cursor() as cursor:
+        deleted = _delete_cycles(cursor, cycle_ids)
+    return deleted
+
+
+def delete_courses(course_ids):
+    """
+    Delete courses with their sections and syllabus rows.
+
+    Must run inside a transaction. Returns the number of rows deleted.
+    """
+    courses = _id_list(course_ids)
+    if not courses[1]:
+        return 0
+
+    bindings = _course_bindings({'courses': courses})
+    with connection.cursor() as cursor:
+        cursor.execute(SYLLABUS_CLO_SO_MAP_SQL)
+        sweep_ids = _sweep_candidates(cursor, bindings)
+        deleted = sum(_delete_rows(cursor, table, row_filter, bindings) for table, row_filter in COURSE_REFERENCES)
+        deleted += _delete_graph(cursor, COURSE_GRAPH, bindings)
+        deleted += _sweep_orphans(cursor, sweep_ids)
+    return deleted
+
+
+def delete_program(program_id):
+    """
+    Delete a program, its cycles and its outcome/objective rows.
+
+    Must run inside a transaction. Returns the number of rows deleted.
+    """
+    bindings = {'programs': _id_list([program_id])}
+    with connection.cursor() as cursor:
+        cursor.execute('SELECT Cycle_ID FROM ACCREDIATION_CYCLE WHERE program_id = %s', [program_id])
+        deleted = _delete_cycles(cursor, [row[0] for row in cursor.fetchall()])
+
+        cursor.execute(SUPPORTS_PEO_SQL)
+        deleted += _delete_rows(
+            cursor,
+            'SYLLABUS_CLO_SO_MAP',
+            'so_id IN (SELECT so_id FROM STUDENT_OUTCOME WHERE program_id IN ({programs}))',
+            bindings,
+        )
+        deleted += _delete_graph(cursor, PROGRAM_GRAPH, bindings)
+    return deleted
@@ -0,0 +1,129 @@
+"""
+Streaming DOCX text extraction.
+
+Only the parts that hold document text are read (the main document, headers,
+footers and footnotes); styles, fonts, numbering and settings are never
+opened. Each part is streamed with iterparse and cleared as it is consumed.
+Every paragraph becomes one block and every table row becomes one block with
+its cells joined by " | ". Work stops once the character budget is reached.
+"""
+import re
+import zipfile
+import xml.etree.ElementTree as ET
+from io import BytesIO
+
+
+DOCX_TEXT_MAX_CHARS = 64000
+
+_DOCUMENT_PART = 'word/document.xml'
+_EXTRA_PART = re.compile(r'word/(header|footer|footnotes)(\d*)\.xml')
+_EXTRA_PART_ORDER = ('header', 'footer', 'footnotes')
+_BREAKS = {'tab', 'br', 'cr'}
+
+
+def _local_name(tag):
+    return tag[tag.rfind('}') + 1:]
+
+
+def _text_parts(archive):
+    names = archive.namelist()
+    parts = [_DOCUMENT_PART] if _DOCUMENT_PART in names else []
+    extras = []
+    for name in names:
+        match = _EXTRA_PART.fullmatch(name)
+        if match:
+            extras.append((_EXTRA_PART_ORDER.index(match.group(1)), int(match.group(2) or 0), name))
+    return parts + [name for _kind, _number, name in sorted(extras)]
+
+
+def _read_part(stream, emit):
+    # Nested paragraphs (text boxes) and nested tables are folded into the enclosing block.
+    parents = []
+    paragraphs = []
+    row = None
+    cell = None
+    row_depth = 0
+    cell_depth = 0
+    for event, element in ET.iterparse(stream, events=('start', 'end')):
+        name = _local_name(element.tag)
+        if event == 'start':
+            parents.append(element)
+            if name == 'p':
+                paragraphs.append([])
+            elif name == 'tr':
+                row_depth += 1
+                if row_depth == 1:
+                    row = []
+            elif name == 'tc':
+                cell_depth += 1
+                if cell_depth == 1:
+                    cell = []
+            continue
+
+        parents.pop()
+        if name == 't':
+            if paragraphs and element.text:
+                paragraphs[-1].append(element.text)
+        elif name in _BREAKS:
+            if paragraphs:
+                paragraphs[-1].append(' ')
+        elif name == 'p':
+            text = ' '.join(''.join(paragraphs.pop()).split())
+            if paragraphs:
+                if text:
+                    paragraphs[-1].append(f' {text} ')
+            elif cell is not None:
+                if text:
+                    cell.append(text)
+            elif text and emit(text):
+                return True
+        elif name == 'tc':
+            cell_depth -= 1
+            if cell_depth == 0 and row is not None:
+                row.append(' '.join(cell))
+                cell = None
+        elif name == 'tr':
+            row_depth -= 1
+            if row_depth == 0:
+                text = ' | '.join(value for value in row if value)
+                row = None
+                if text and emit(text):
+                    return True
+        else:
+            continue
+
+        if not paragraphs and cell is None and parents:
+            parents[-1].clear()
+    return False
+
+
+def extract_docx_text_blocks(data, max_chars=DOCX_TEXT_MAX_CHARS):
+    """
+    Return the paragraphs and table rows of a DOCX file, in document order.
+
+    Blocks from the main document come first, then headers, footers and
+    footnotes. A part that is not well-formed keeps the blocks read before the
+    error. Returns [] when `data` is not a DOCX archive.
+    """
+    blocks = []
+    total = 0
+
+    def emit(text):
+        nonlocal total
+        blocks.append(text)
+        total += len(text)
+        return total >= max_chars
+
+    try:
+        archive = zipfile.ZipFile(BytesIO(data))
+    except (zipfile.BadZipFile, ValueError):
+        return []
+    with archive:
+        for name in _text_parts(archive):
+            try:
+                with archive.open(name) as stream:
+                    if _read_part(stream, emit):
+                        break
+            except (ET.ParseError, zipfile.BadZipFile, EOFError, ValueError, RuntimeError, OSError):
+                continue
+    return blocks
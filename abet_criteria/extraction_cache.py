@@ -0,0 +1,183 @@
+"""
+Content-addressed cache of text extracted from uploaded evidence files.
+
+Entries live in a SQLite file shared by every worker process on the host, so a
+document is parsed once per deployment rather than once per worker. The
+cache is bounded by the total size of the stored text and evicts the least
+recently used entries first. Hit and miss counters are kept in the same file;
+they and the last-used times are written in batches so that cache hits do
+not take the database write lock one by one.
+"""
+import hashlib
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+
+
+TEXT_EXTRACTION_CACHE_PATH = os.environ.get(
+    'TEXT_EXTRACTION_CACHE_PATH',
+    os.path.join(tempfile.gettempdir(), 'abet-text-extraction.sqlite3'),
+)
+TEXT_EXTRACTION_CACHE_MAX_BYTES = int(os.environ.get('TEXT_EXTRACTION_CACHE_MAX_BYTES', str(256 * 1024 * 1024)))
+# Pending hit/miss counts are flushed after this many lookups or seconds, whichever comes first.
+TEXT_EXTRACTION_CACHE_FLUSH_LOOKUPS = 64
+TEXT_EXTRACTION_CACHE_FLUSH_SECONDS = 5.0
+
+# Bump a kind's version whenever its extractor changes, so entries written by the old one are not served.
+EXTRACTOR_VERSIONS = {
+    'csv': 1,
+    'docx': 2,
+    'pdf': 2,
+    'text': 1,
+    'xlsx': 2,
+}
+
+_SCHEMA = (
+    'CREATE TABLE IF NOT EXISTS extracted_text ('
+    ' key TEXT PRIMARY KEY, text TEXT NOT NULL, size INTEGER NOT NULL,'
+    ' hits INTEGER NOT NULL DEFAULT 0, last_used REAL NOT NULL)',
+    'CREATE INDEX IF NOT EXISTS extracted_text_last_used ON extracted_text (last_used)',
+    'CREATE TABLE IF NOT EXISTS counters (name TEXT PRIMARY KEY, value INTEGER NOT NULL)',
+)
+
+_local = threading.local()
+_pending = {}
+_pending_lock = threading.Lock()
+
+
+def cache_key(kind, file_bytes):
+    """Return the key for `file_bytes` read by the `kind` extractor at its current version."""
+    return f'{kind}:v{EXTRACTOR_VERSIONS.get(kind, 1)}:{hashlib.sha1(file_bytes).hexdigest()}'
+
+
+def _connection():
+    # One connection per thread and process; SQLite connections must not cross a fork.
+    key = (os.getpid(), TEXT_EXTRACTION_CACHE_PATH)
+    connections = getattr(_local, 'connections', None)
+    if connections is None:
+        connections = _local.connections = {}
+    if key not in connections:
+        directory = os.path.dirname(TEXT_EXTRACTION_CACHE_PATH)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        connection = sqlite3.connect(TEXT_EXTRACTION_CACHE_PATH, timeout=5)
+        connection.execute('PRAGMA journal_mode=WAL')
+        with connection:
+            for statement in _SCHEMA:
+                connection.execute(statement)
+        connections[key] = connection
+    return connections[key]
+
+
+def _record_lookup(key, hit):
+    with _pending_lock:
+        pending = _pending.setdefault(TEXT_EXTRACTION_CACHE_PATH, {
+            'hits': 0, 'misses': 0, 'used': {}, 'lookups': 0, 'since': time.monotonic(),
+        })
+        if hit:
+            pending['hits'] += 1
+            count, _ = pending['used'].get(key, (0, 0))
+            pending['used'][key] = (count + 1, time.time())
+        else:
+            pending['misses'] += 1
+        pending['lookups'] += 1
+        return (
+            pending['lookups'] >= TEXT_EXTRACTION_CACHE_FLUSH_LOOKUPS
+            or time.monotonic() - pending['since'] >= TEXT_EXTRACTION_CACHE_FLUSH_SECONDS
+        )
+
+
+def _flush_lookups():
+    with _pending_lock:
+        pending = _pending.pop(TEXT_EXTRACTION_CACHE_PATH, None)
+    if not pending:
+        return
+    connection = _connection()
+    with connection:
+        connection.executemany(
+            'UPDATE extracted_text SET hits = hits + ?, last_used = MAX(last_used, ?) WHERE key = ?',
+            [(count, used_at, key) for key, (count, used_at) in pending['used'].items()],
+        )
+        connection.executemany(
+            'INSERT INTO counters (name, value) VALUES (?, ?) ON CONFLICT(name) DO UPDATE SET value = value + excluded.value',
+            [(name, pending[name]) for name in ('hits', 'misses') if pending[name]],
+        )
+
+
+def _lookup(key):
+    row = _connection().execute('SELECT text FROM extracted_text WHERE key = ?', (key,)).fetchone()
+    if _record_lookup(key, row is not None):
+        _flush_lookups()
+    return row[0] if row is not None else None
+
+
+def _store(key, text):
+    size = len(text.encode('utf-8'))
+    if size > TEXT_EXTRACTION_CACHE_MAX_BYTES:
+        return
+    # Eviction order depends on last-used times that may still be pending.
+    _flush_lookups()
+    connection = _connection()
+    with connection:
+        connection.execute(
+            'INSERT OR REPLACE INTO extracted_text (key, text, size, hits, last_used) VALUES (?, ?, ?, 0, ?)',
+            (key, text, size, time.time()),
+        )
+        total = connection.execute('SELECT COALESCE(SUM(size), 0) FROM extracted_text').fetchone()[0]
+        if total <= TEXT_EXTRACTION_CACHE_MAX_BYTES:
+            return
+        evict = []
+        for stale_key, stale_size in connection.execute('SELECT key, size FROM extracted_text ORDER BY last_used, key').fetchall():
+            if total <= TEXT_EXTRACTION_CACHE_MAX_BYTES:
+                break
+            if stale_key == key:
+                continue
+            evict.append((stale_key,))
+            total -= stale_size
+        connection.executemany('DELETE FROM extracted_text WHERE key = ?', evict)
+
+
+def get(key):
+    """Return the cached text for `key`, or None on a miss or if the cache file is unusable."""
+    try:
+        return _lookup(key)
+    except (sqlite3.Error, OSError):
+        return None
+
+
+def put(key, text):
+    try:
+        _store(key, text)
+    except (sqlite3.Error, OSError):
+        pass
+
+
+def get_or_extract(key, extract):
+    """
+    Return the cached text for `key`, or call `extract()` and cache its result.
+
+    Keys should be derived from the file content (and the extractor used), not
+    its name. If the cache file cannot be used, text is extracted uncached.
+    """
+    cached = get(key)
+    if cached is not None:
+        return cached
+    text = extract()
+    put(key, text)
+    return text
+
+
+def cache_stats():
+    """Return {hits, misses, entries, bytes} for the shared cache."""
+    _flush_lookups()
+    connection = _connection()
+    counters = dict(connection.execute('SELECT name, value FROM counters'))
+    entries, size = connection.execute('SELECT COUNT(*), COALESCE(SUM(size), 0) FROM extracted_text').fetchone()
+    return {
+        'hits': counters.get('hits', 0),
+        'misses': counters.get('misses', 0),
+        'entries': entries,
+        'bytes': size,
+    }
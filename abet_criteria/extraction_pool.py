@@ -0,0 +1,176 @@
+"""
+Parse the files of one upload request in parallel worker processes.
+
+Text extraction is CPU-bound (regex over PDF bytes, zlib, XML parsing), so
+threads do not help. Files that miss the shared extraction cache are sent
+to a bounded ProcessPoolExecutor. Each file gets a time limit and a size
+cap, so a ten-file upload takes about as long as its slowest file.
+"""
+import math
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from concurrent.futures.process import BrokenProcessPool
+from functools import partial
+
+from . import extraction_cache
+
+
+# 0 parses every file on the request thread.
+EXTRACTION_PROCESS_WORKERS = int(os.environ.get('EXTRACTION_PROCESS_WORKERS', str(min(4, os.cpu_count() or 1))))
+EXTRACTION_FILE_TIMEOUT_SECONDS = float(os.environ.get('EXTRACTION_FILE_TIMEOUT_SECONDS', '30'))
+EXTRACTION_MAX_FILE_BYTES = int(os.environ.get('EXTRACTION_MAX_FILE_BYTES', str(25 * 1024 * 1024)))
+
+_executor = None
+_executor_lock = threading.Lock()
+# Futures not yet finished, per pool, and the futures a caller gave up on in a retired pool.
+_in_flight = {}
+_retired = {}
+
+
+def _init_worker():
+    # Spawned (non-forked) workers import extractor modules that may need Django.
+    from django.apps import apps
+
+    if not apps.ready:
+        import django
+
+        os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'backend.settings')
+        django.setup()
+
+
+def _extraction_executor():
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ProcessPoolExecutor(max_workers=EXTRACTION_PROCESS_WORKERS, initializer=_init_worker)
+        return _executor
+
+
+def _submit(executor, extract, args):
+    future = executor.submit(extract, *args)
+    with _executor_lock:
+        _in_flight.setdefault(executor, set()).add(future)
+    future.add_done_callback(partial(_forget, executor))
+    return future
+
+
+def _forget(executor, future):
+    with _executor_lock:
+        _in_flight.get(executor, set()).discard(future)
+    _terminate_when_idle(executor)
+
+
+def _retire_executor(executor, abandoned):
+    """
+    Stop handing out `executor` after a file in it got stuck.
+
+    A worker stuck on a file cannot be cancelled, so the pool has to be
+    terminated, but it is shared by every request thread. New work goes to a
+    fresh pool at once; the old one is terminated only after the files other
+    callers still have in it are finished.
+    """
+    global _executor
+    with _executor_lock:
+        if _executor is executor:
+            _executor = None
+        _retired.setdefault(executor, set()).update(abandoned)
+    for future in abandoned:
+        future.cancel()
+    _terminate_when_idle(executor)
+
+
+def _terminate_when_idle(executor):
+    with _executor_lock:
+        if executor not in _retired or _in_flight.get(executor, set()) - _retired[executor]:
+            return
+        del _retired[executor]
+        _in_flight.pop(executor, None)
+    # Done callbacks run on the pool's own management thread, which must not wait on itself.
+    threading.Thread(target=_terminate, args=(executor,), daemon=True).start()
+
+
+def _terminate(executor):
+    if hasattr(executor, 'terminate_workers'):
+        executor.terminate_workers()
+        return
+    processes = list((getattr(executor, '_processes', None) or {}).values())
+    executor.shutdown(wait=False, cancel_futures=True)
+    for process in processes:
+        process.terminate()
+
+
+def shutdown():
+    global _executor
+    with _executor_lock:
+        executor, _executor = _executor, None
+    if executor is not None:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+def extract_all(jobs, extract):
+    """
+    Return the extracted text of each job, in order.
+
+    `jobs` is a list of (cache_key, args) and `extract(*args)` must be a
+    module-level function so it can be sent to a worker process. Files over
+    EXTRACTION_MAX_FILE_BYTES (the last item of `args` is the file bytes),
+    files that time out, and files whose extractor raises yield ''; only
+    real results are written to the extraction cache.
+    """
+    texts = [None] * len(jobs)
+    pending = []
+    for index, (cache_key, args) in enumerate(jobs):
+        if len(args[-1]) > EXTRACTION_MAX_FILE_BYTES:
+            texts[index] = ''
+            continue
+        cached = extraction_cache.get(cache_key) if cache_key else None
+        if cached is not None:
+            texts[index] = cached
+        else:
+            pending.append(index)
+
+    if EXTRACTION_PROCESS_WORKERS > 0 and len(pending) > 1:
+        _extract_in_pool(jobs, pending, extract, texts)
+    else:
+        _extract_inline(jobs, pending, extract, texts)
+
+    for index in pending:
+        cache_key = jobs[index][0]
+        if cache_key and texts[index] is not None:
+            extraction_cache.put(cache_key, texts[index])
+    return [text or '' for text in texts]
+
+
+def _extract_inline(jobs, pending, extract, texts):
+    for index in pending:
+        try:
+            texts[index] = extract(*jobs[index][1])
+        except Exception:
+            texts[index] = None
+
+
+def _extract_in_pool(jobs, pending, extract, texts):
+    executor = _extraction_executor()
+    try:
+        futures = {index: _submit(executor, extract, jobs[index][1]) for index in pending}
+    except (BrokenProcessPool, RuntimeError):
+        _retire_executor(executor, [])
+        _extract_inline(jobs, pending, extract, texts)
+        return
+
+    # Files queue behind each other once every worker is busy, so the deadline grows with the queue.
+    rounds = math.ceil(len(futures) / EXTRACTION_PROCESS_WORKERS)
+    deadline = time.monotonic() + EXTRACTION_FILE_TIMEOUT_SECONDS * rounds
+    abandoned = []
+    for index, future in futures.items():
+        try:
+            texts[index] = future.result(timeout=max(0, deadline - time.monotonic()))
+        except (FutureTimeoutError, BrokenProcessPool):
+            abandoned.append(future)
+        except Exception:
+            texts[index] = None
+    if abandoned:
+        _retire_executor(executor, abandoned)
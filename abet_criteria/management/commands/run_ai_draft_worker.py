@@ -0,0 +1,66 @@
+import threading
+import time
+
+from django.core.management.base import BaseCommand
+
+from abet_criteria.ai_draft_jobs import claim_next_job, new_worker_id, requeue_interrupted_jobs, run_job, run_job_in_thread
+
+
+class Command(BaseCommand):
+    help = "Run queued self-study AI draft jobs outside the web process."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--jobs",
+            type=int,
+            default=2,
+            help="Number of drafts to run at the same time.",
+        )
+        parser.add_argument(
+            "--poll-interval",
+            type=float,
+            default=1.0,
+            help="Seconds to wait between checks for new jobs.",
+        )
+        parser.add_argument(
+            "--once",
+            action="store_true",
+            help="Run the jobs queued right now one after another, then exit.",
+        )
+
+    def handle(self, *args, **options):
+        worker_id = new_worker_id()
+        self._requeue_interrupted()
+
+        if options["once"]:
+            processed = 0
+            while True:
+                job = claim_next_job(worker_id)
+                if job is None:
+                    break
+                run_job(job)
+                processed += 1
+            self.stdout.write(self.style.SUCCESS(f"Processed {processed} job(s)."))
+            return
+
+        max_jobs = max(1, options["jobs"])
+        running = []
+        self.stdout.write(self.style.SUCCESS(f"AI draft worker started ({max_jobs} concurrent job(s))."))
+        while True:
+            # Jobs of a worker that died while this one keeps running are picked up once their lease runs out.
+            self._requeue_interrupted()
+            running = [thread for thread in running if thread.is_alive()]
+            while len(running) < max_jobs:
+                job = claim_next_job(worker_id)
+                if job is None:
+                    break
+                self.stdout.write(f"Running AI draft job {job.id} for cycle {job.cycle_id}.")
+                thread = threading.Thread(target=run_job_in_thread, args=(job,), daemon=True)
+                thread.start()
+                running.append(thread)
+            time.sleep(options["poll_interval"])
+
+    def _requeue_interrupted(self):
+        requeued = requeue_interrupted_jobs()
+        if requeued:
+            self.stdout.write(f"Requeued {requeued} interrupted job(s).")
@@ -0,0 +1,53 @@
+from django.db import migrations
+
+
+CRITERION_NUMBERS = range(0, 10)
+
+
+def _criterion_number_from_name(name):
+    lowered = (name or '').lower()
+    if 'background' in lowered:
+        return 0
+    if 'append' in lowered:
+        return 9
+    for num in range(1, 9):
+        if f'criterion {num}' in lowered:
+            return num
+    return None
+
+
+def backfill_cycle_progress(apps, schema_editor):
+    AccreditationCycle = apps.get_model('abet_criteria', 'AccreditationCycle')
+    ChecklistItem = apps.get_model('abet_criteria', 'ChecklistItem')
+
+    progress_by_checklist = {}
+    for checklist_id, item_name, completion in ChecklistItem.objects.values_list(
+        'checklist_id',
+        'item_name',
+        'completion_percentage',
+    ):
+        criterion_number = _criterion_number_from_name(item_name)
+        if criterion_number is None:
+            continue
+        criterion_progress = progress_by_checklist.setdefault(checklist_id, {})
+        criterion_progress[criterion_number] = max(
+            criterion_progress.get(criterion_number, 0.0),
+            float(completion or 0),
+        )
+
+    for cycle in AccreditationCycle.objects.all():
+        criterion_progress = progress_by_checklist.get(cycle.checklist_id, {})
+        total = sum(criterion_progress.get(number, 0.0) for number in CRITERION_NUMBERS)
+        cycle.overall_progress_percentage = round(total / len(CRITERION_NUMBERS))
+        cycle.save(update_fields=['overall_progress_percentage'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('abet_criteria', '0008_background_review_date_nullable'),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_cycle_progress, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,50 @@
+# Generated by Django 6.0.2 on 2026-10-18 19:58
+
+from django.db import migrations, models
+
+
+def _criterion_number_from_name(name):
+    lowered = (name or '').lower()
+    if 'background' in lowered:
+        return 0
+    if 'append' in lowered:
+        return 9
+    for num in range(1, 9):
+        if f'criterion {num}' in lowered:
+            return num
+    return None
+
+
+def backfill_criterion_number(apps, schema_editor):
+    ChecklistItem = apps.get_model('abet_criteria', 'ChecklistItem')
+
+    # The criterion helpers always used the newest matching item, so that one
+    # keeps the number; older duplicates stay NULL to satisfy the constraint.
+    claimed = set()
+    for item in ChecklistItem.objects.order_by('-item_id'):
+        criterion_number = _criterion_number_from_name(item.item_name)
+        if criterion_number is None or (item.checklist_id, criterion_number) in claimed:
+            continue
+        claimed.add((item.checklist_id, criterion_number))
+        item.criterion_number = criterion_number
+        item.save(update_fields=['criterion_number'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('abet_criteria', '0009_backfill_cycle_progress'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='checklistitem',
+            name='criterion_number',
+            field=models.PositiveSmallIntegerField(blank=True, db_index=True, null=True),
+        ),
+        migrations.RunPython(backfill_criterion_number, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='checklistitem',
+            constraint=models.UniqueConstraint(fields=('checklist', 'criterion_number'), name='uniq_checklist_item_criterion'),
+        ),
+    ]
@@ -0,0 +1,52 @@
+from django.db import migrations
+
+
+CRITERION_ITEMS = {
+    0: 'Background Information',
+    1: 'Criterion 1 - Students',
+    2: 'Criterion 2 - Program Educational Objectives',
+    3: 'Criterion 3 - Student Outcomes',
+    4: 'Criterion 4 - Continuous Improvement',
+    5: 'Criterion 5 - Curriculum',
+    6: 'Criterion 6 - Faculty',
+    7: 'Criterion 7 - Facilities',
+    8: 'Criterion 8 - Institutional Support',
+    9: 'Appendices',
+}
+
+
+def seed_missing_checklist_items(apps, schema_editor):
+    AccreditationCycle = apps.get_model('abet_criteria', 'AccreditationCycle')
+    ChecklistItem = apps.get_model('abet_criteria', 'ChecklistItem')
+
+    checklist_ids = set(AccreditationCycle.objects.values_list('checklist_id', flat=True))
+    existing = set(
+        ChecklistItem.objects.filter(
+            checklist_id__in=checklist_ids,
+            criterion_number__isnull=False,
+        ).values_list('checklist_id', 'criterion_number')
+    )
+
+    ChecklistItem.objects.bulk_create([
+        ChecklistItem(
+            checklist_id=checklist_id,
+            item_name=item_name,
+            criterion_number=criterion_number,
+            status=0,
+            completion_percentage=0,
+        )
+        for checklist_id in sorted(checklist_ids)
+        for criterion_number, item_name in CRITERION_ITEMS.items()
+        if (checklist_id, criterion_number) not in existing
+    ])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('abet_criteria', '0010_checklistitem_criterion_number'),
+    ]
+
+    operations = [
+        migrations.RunPython(seed_missing_checklist_items, migrations.RunPython.noop),
+    ]
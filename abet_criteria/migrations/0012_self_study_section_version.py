@@ -0,0 +1,31 @@
+# Generated by Django 6.0.2 on 2026-10-18 20:11
+
+import django.db.models.deletion
+import django.utils.timezone
+import uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('abet_criteria', '0011_seed_missing_checklist_items'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SelfStudySectionVersion',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('section', models.CharField(max_length=32)),
+                ('version', models.PositiveIntegerField(default=1)),
+                ('token', models.UUIDField(default=uuid.uuid4)),
+                ('updated_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('cycle', models.ForeignKey(db_column='Cycle_ID', on_delete=django.db.models.deletion.CASCADE, to='abet_criteria.accreditationcycle')),
+            ],
+            options={
+                'db_table': 'SELF_STUDY_SECTION_VERSION',
+                'constraints': [models.UniqueConstraint(fields=('cycle', 'section'), name='uniq_self_study_section_version')],
+            },
+        ),
+    ]
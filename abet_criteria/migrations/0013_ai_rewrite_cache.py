@@ -0,0 +1,29 @@
+# Generated by Django 6.0.2 on 2026-10-18 20:28
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('abet_criteria', '0012_self_study_section_version'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='AIRewriteCacheEntry',
+            fields=[
+                ('key', models.CharField(max_length=64, primary_key=True, serialize=False)),
+                ('model', models.CharField(max_length=100)),
+                ('section_id', models.CharField(max_length=32)),
+                ('field_key', models.CharField(max_length=100)),
+                ('rewritten_text', models.TextField()),
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('last_used_at', models.DateTimeField(db_index=True, default=django.utils.timezone.now)),
+            ],
+            options={
+                'db_table': 'AI_REWRITE_CACHE',
+            },
+        ),
+    ]
@@ -0,0 +1,36 @@
+# Generated by Django 6.0.2 on 2026-10-18 20:29
+
+import django.core.serializers.json
+import django.db.models.deletion
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('abet_criteria', '0013_ai_rewrite_cache'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SelfStudyAIDraftJob',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('status', models.CharField(choices=[('queued', 'Queued'), ('running', 'Running'), ('succeeded', 'Succeeded'), ('failed', 'Failed')], db_index=True, default='queued', max_length=16)),
+                ('selected_fields', models.JSONField(default=list)),
+                ('save_to_backend', models.BooleanField(default=False)),
+                ('total_fields', models.PositiveIntegerField(default=0)),
+                ('completed_fields', models.PositiveIntegerField(default=0)),
+                ('result', models.JSONField(blank=True, encoder=django.core.serializers.json.DjangoJSONEncoder, null=True)),
+                ('error', models.TextField(blank=True, default='')),
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('started_at', models.DateTimeField(blank=True, null=True)),
+                ('finished_at', models.DateTimeField(blank=True, null=True)),
+                ('cycle', models.ForeignKey(db_column='Cycle_ID', on_delete=django.db.models.deletion.CASCADE, to='abet_criteria.accreditationcycle')),
+            ],
+            options={
+                'db_table': 'SELF_STUDY_AI_DRAFT_JOB',
+            },
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 6.0.2 on 2026-10-18 21:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('abet_criteria', '0014_self_study_ai_draft_job'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='selfstudyaidraftjob',
+            name='lease_expires_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='selfstudyaidraftjob',
+            name='worker_id',
+            field=models.CharField(blank=True, default='', max_length=100),
+        ),
+    ]
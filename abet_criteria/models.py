@@ -1,5 +1,8 @@
+import uuid
+
 from django.db import models
 from django.contrib.auth.models import AbstractBaseUser, BaseUserManager
+from django.core.serializers.json import DjangoJSONEncoder
 from django.utils import timezone
 
 # ============================================================================
@@ -343,6 +346,33 @@ class AppendixCEquipment(models.Model):
         return f"Appendix C - {self.appendix_c_id}"
 
 
+CRITERION_ITEMS = {
+    0: 'Background Information',
+    1: 'Criterion 1 - Students',
+    2: 'Criterion 2 - Program Educational Objectives',
+    3: 'Criterion 3 - Student Outcomes',
+    4: 'Criterion 4 - Continuous Improvement',
+    5: 'Criterion 5 - Curriculum',
+    6: 'Criterion 6 - Faculty',
+    7: 'Criterion 7 - Facilities',
+    8: 'Criterion 8 - Institutional Support',
+    9: 'Appendices',
+}
+
+
+def criterion_number_from_name(name):
+    """Return the CRITERION_ITEMS number an item name refers to, or None."""
+    lowered = (name or '').lower()
+    if 'background' in lowered:
+        return 0
+    if 'append' in lowered:
+        return 9
+    for number in range(1, 9):
+        if f'criterion {number}' in lowered:
+            return number
+    return None
+
+
 class ChecklistItem(models.Model):
     item_id = models.AutoField(primary_key=True)
     item_name = models.CharField(max_length=255)
@@ -395,9 +425,16 @@ class ChecklistItem(models.Model):
         null=True,
         blank=True
     )
+    criterion_number = models.PositiveSmallIntegerField(null=True, blank=True, db_index=True)
 
     class Meta:
         db_table = 'CHECKLIST_ITEM'
+        constraints = [
+            models.UniqueConstraint(
+                fields=['checklist', 'criterion_number'],
+                name='uniq_checklist_item_criterion',
+            ),
+        ]
 
     def __str__(self):
         return self.item_name
@@ -1041,3 +1078,64 @@ class SupportsPeo(models.Model):
         db_table = 'SUPPORTS_PEO'
         managed = False
         unique_together = (('so', 'peo'),)
+
+
+class SelfStudySectionVersion(models.Model):
+    cycle = models.ForeignKey(AccreditationCycle, on_delete=models.CASCADE, db_column='Cycle_ID')
+    section = models.CharField(max_length=32)
+    version = models.PositiveIntegerField(default=1)
+    # Cache keys include the token so a row recreated for a reused cycle id
+    # never matches payloads cached for the old one.
+    token = models.UUIDField(default=uuid.uuid4)
+    updated_at = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        db_table = 'SELF_STUDY_SECTION_VERSION'
+        constraints = [
+            models.UniqueConstraint(fields=['cycle', 'section'], name='uniq_self_study_section_version'),
+        ]
+
+
+class AIRewriteCacheEntry(models.Model):
+    # sha256 of (model, prompt version, section id, field key, source text).
+    key = models.CharField(max_length=64, primary_key=True)
+    model = models.CharField(max_length=100)
+    section_id = models.CharField(max_length=32)
+    field_key = models.CharField(max_length=100)
+    rewritten_text = models.TextField()
+    created_at = models.DateTimeField(default=timezone.now)
+    last_used_at = models.DateTimeField(default=timezone.now, db_index=True)
+
+    class Meta:
+        db_table = 'AI_REWRITE_CACHE'
+
+
+class SelfStudyAIDraftJob(models.Model):
+    STATUS_QUEUED = 'queued'
+    STATUS_RUNNING = 'running'
+    STATUS_SUCCEEDED = 'succeeded'
+    STATUS_FAILED = 'failed'
+    STATUS_CHOICES = [
+        (STATUS_QUEUED, 'Queued'),
+        (STATUS_RUNNING, 'Running'),
+        (STATUS_SUCCEEDED, 'Succeeded'),
+        (STATUS_FAILED, 'Failed'),
+    ]
+
+    cycle = models.ForeignKey(AccreditationCycle, on_delete=models.CASCADE, db_column='Cycle_ID')
+    status = models.CharField(max_length=16, choices=STATUS_CHOICES, default=STATUS_QUEUED, db_index=True)
+    selected_fields = models.JSONField(default=list)
+    save_to_backend = models.BooleanField(default=False)
+    total_fields = models.PositiveIntegerField(default=0)
+    completed_fields = models.PositiveIntegerField(default=0)
+    result = models.JSONField(null=True, blank=True, encoder=DjangoJSONEncoder)
+    error = models.TextField(blank=True, default='')
+    created_at = models.DateTimeField(default=timezone.now)
+    started_at = models.DateTimeField(null=True, blank=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+    # The worker running the job renews its lease; only jobs whose lease ran out are requeued.
+    worker_id = models.CharField(max_length=100, blank=True, default='')
+    lease_expires_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        db_table = 'SELF_STUDY_AI_DRAFT_JOB'
@@ -0,0 +1,498 @@
+"""
+Object-level PDF text extraction.
+
+Objects are located through the cross-reference table (classic tables, xref
+streams and incremental updates), falling back to a scan for object headers
+when the xref is missing or broken. Only stream objects that can hold page
+content are inflated (unfiltered or FlateDecode; images, fonts, metadata and
+object streams are skipped), and only the text operators inside BT/ET blocks
+are read. Work stops once the character budget is reached, so large scanned
+PDFs cost little more than their object table.
+"""
+import re
+import zlib
+
+
+PDF_TEXT_MAX_CHARS = 64000
+MAX_INFLATED_STREAM_BYTES = 8 * 1024 * 1024
+
+_OBJECT_HEADER = re.compile(rb'(\d+)\s+(\d+)\s+obj\b')
+_STARTXREF = re.compile(rb'startxref\s+(\d+)')
+_XREF_SUBSECTION = re.compile(rb'\s*(\d+)\s+(\d+)[ \t]*[\r\n]')
+_XREF_ENTRY = re.compile(rb'\s*(\d{10})\s+(\d{5})\s+([nf])')
+_LENGTH = re.compile(rb'/Length\s+(\d+)(?:\s+(\d+)\s+R)?')
+_FILTER = re.compile(rb'/Filter\s*(\[[^\]]*\]|/[^\s/\[\]<>()]+)')
+_FILTER_NAME = re.compile(rb'/([^\s/\[\]<>()]+)')
+_NOT_CONTENT = re.compile(
+    rb'/Subtype\s*/(?:Image|XML|Type1C|CIDFontType0C|OpenType)\b'
+    rb'|/Type\s*/(?:XRef|ObjStm|Metadata|EmbeddedFile)\b'
+    rb'|/Length[123]\b'
+)
+_TEXT_BLOCK = re.compile(rb'(?<![\w])BT(?![\w])')
+_TOKEN = re.compile(
+    rb'\s*(?:'
+    rb'<<|>>'
+    rb'|<(?P<hex>[0-9A-Fa-f\s]*)>'
+    rb'|(?P<open>\[)|(?P<close>\])'
+    rb'|/[^\s/\[\]()<>{}%]*'
+    rb'|(?P<number>[-+]?(?:\d+\.?\d*|\.\d+))'
+    rb'|(?P<operator>[A-Za-z\'"*][A-Za-z0-9*]*|\'|")'
+    rb'|%[^\r\n]*'
+    rb'|(?P<other>.)'
+    rb')',
+    re.DOTALL,
+)
+_LITERAL_ESCAPES = {
+    ord('n'): b'\n',
+    ord('r'): b'\r',
+    ord('t'): b'\t',
+    ord('b'): b'\b',
+    ord('f'): b'\f',
+    ord('('): b'(',
+    ord(')'): b')',
+    ord('\\'): b'\\',
+}
+# A TJ adjustment this negative (thousandths of an em) is treated as a word gap.
+_TJ_SPACE_THRESHOLD = -200
+
+
+def _dict_end(data, start):
+    """Return the offset just past the dictionary that opens at `start`."""
+    depth = 0
+    index = start
+    length = len(data)
+    while index < length:
+        marker = data.find(b'<<', index)
+        closing = data.find(b'>>', index)
+        if closing < 0:
+            return length
+        if 0 <= marker < closing:
+            depth += 1
+            index = marker + 2
+            continue
+        depth -= 1
+        index = closing + 2
+        if depth <= 0:
+            return index
+    return length
+
+
+def _skip_whitespace(data, index):
+    length = len(data)
+    while index < length and data[index] in b' \t\r\n\f\x00':
+        index += 1
+    return index
+
+
+def _png_unpredict(raw, columns):
+    rows = []
+    previous = bytearray(columns)
+    width = columns + 1
+    for start in range(0, len(raw) - width + 1, width):
+        kind = raw[start]
+        row = bytearray(raw[start + 1:start + width])
+        for index in range(columns):
+            left = row[index - 1] if index else 0
+            up = previous[index]
+            if kind == 1:
+                row[index] = (row[index] + left) & 0xFF
+            elif kind == 2:
+                row[index] = (row[index] + up) & 0xFF
+            elif kind == 3:
+                row[index] = (row[index] + ((left + up) >> 1)) & 0xFF
+            elif kind == 4:
+                upper_left = previous[index - 1] if index else 0
+                estimate = left + up - upper_left
+                distances = (abs(estimate - left), abs(estimate - up), abs(estimate - upper_left))
+                row[index] = (row[index] + (left, up, upper_left)[distances.index(min(distances))]) & 0xFF
+        rows.append(bytes(row))
+        previous = row
+    return b''.join(rows)
+
+
+class _Document:
+    def __init__(self, data):
+        self.data = data
+        self.view = memoryview(data)
+        self.offsets = {}
+        self.trailers = []
+
+    # Cross-reference table
+
+    def load_offsets(self):
+        valid = {}
+        try:
+            self._read_xref_chain()
+            for number, offset in self.offsets.items():
+                header = _OBJECT_HEADER.match(self.data, offset)
+                if header and int(header.group(1)) == number:
+                    valid[number] = offset
+        except Exception:
+            # Any damage in the xref (missing /W, bad numbers, bad streams) falls back to the header scan.
+            valid = {}
+        if not valid or len(valid) < len(self.offsets) // 2:
+            valid = {}
+            for match in _OBJECT_HEADER.finditer(self.data):
+                valid[int(match.group(1))] = match.start()
+        self.offsets = valid
+
+    def _read_xref_chain(self):
+        tail_start = max(0, len(self.data) - 2048)
+        matches = list(_STARTXREF.finditer(self.data, tail_start))
+        if not matches:
+            return
+        pending = [int(matches[-1].group(1))]
+        seen = set()
+        while pending:
+            position = pending.pop(0)
+            if position in seen or position >= len(self.data):
+                continue
+            seen.add(position)
+            trailer = self._read_xref_section(position)
+            if trailer is None:
+                continue
+            self.trailers.append(trailer)
+            hybrid = re.search(rb'/XRefStm\s+(\d+)', trailer)
+            if hybrid:
+                pending.append(int(hybrid.group(1)))
+            previous = re.search(rb'/Prev\s+(\d+)', trailer)
+            if previous:
+                pending.append(int(previous.group(1)))
+
+    def _read_xref_section(self, position):
+        position = _skip_whitespace(self.data, position)
+        if self.data.startswith(b'xref', position):
+            return self._read_xref_table(position + 4)
+        if _OBJECT_HEADER.match(self.data, position):
+            return self._read_xref_stream(position)
+        return None
+
+    def _read_xref_table(self, position):
+        while True:
+            subsection = _XREF_SUBSECTION.match(self.data, position)
+            if not subsection:
+                break
+            first, count = int(subsection.group(1)), int(subsection.group(2))
+            position = subsection.end()
+            for number in range(first, first + count):
+                entry = _XREF_ENTRY.match(self.data, position)
+                if not entry:
+                    raise ValueError('truncated xref table')
+                position = entry.end()
+                if entry.group(3) == b'n':
+                    self.offsets.setdefault(number, int(entry.group(1)))
+        trailer_at = self.data.find(b'trailer', position, position + 4096)
+        if trailer_at < 0:
+            return b''
+        start = self.data.find(b'<<', trailer_at)
+        return self.data[start:_dict_end(self.data, start)] if start >= 0 else b''
+
+    def _read_xref_stream(self, position):
+        header, dictionary, body = self._object(position)
+        if dictionary is None or body is None or b'/XRef' not in dictionary:
+            return None
+        raw = zlib.decompress(body) if b'/FlateDecode' in dictionary else bytes(body)
+        predictor = re.search(rb'/Predictor\s+(\d+)', dictionary)
+        widths = [int(value) for value in re.search(rb'/W\s*\[([^\]]*)\]', dictionary).group(1).split()]
+        if predictor and int(predictor.group(1)) >= 10:
+            columns = re.search(rb'/Columns\s+(\d+)', dictionary)
+            raw = _png_unpredict(raw, int(columns.group(1)) if columns else sum(widths))
+        index = re.search(rb'/Index\s*\[([^\]]*)\]', dictionary)
+        if index:
+            bounds = [int(value) for value in index.group(1).split()]
+        else:
+            bounds = [0, int(re.search(rb'/Size\s+(\d+)', dictionary).group(1))]
+
+        entry_size = sum(widths)
+        if entry_size == 0:
+            raise ValueError('xref stream has no entry width')
+        cursor = 0
+        for first, count in zip(bounds[0::2], bounds[1::2]):
+            # /Size and /Index can claim far more entries than the stream holds.
+            count = min(count, (len(raw) - cursor) // entry_size)
+            for number in range(first, first + count):
+                entry = raw[cursor:cursor + entry_size]
+                cursor += entry_size
+                fields = []
+                offset = 0
+                for width in widths:
+                    fields.append(int.from_bytes(entry[offset:offset + width], 'big') if width else None)
+                    offset += width
+                kind = 1 if widths[0] == 0 else fields[0]
+                if kind == 1 and fields[1] is not None:
+                    self.offsets.setdefault(number, fields[1])
+        return dictionary
+
+    # Objects
+
+    def _object(self, offset):
+        """Return (header end, dictionary bytes or None, stream memoryview or None) for the object at `offset`."""
+        header = _OBJECT_HEADER.match(self.data, offset)
+        if not header:
+            return None, None, None
+        start = _skip_whitespace(self.data, header.end())
+        if not self.data.startswith(b'<<', start):
+            return header.end(), None, None
+        end = _dict_end(self.data, start)
+        dictionary = self.data[start:end]
+        after = _skip_whitespace(self.data, end)
+        if not self.data.startswith(b'stream', after):
+            return header.end(), dictionary, None
+        body_start = after + 6
+        if self.data.startswith(b'\r\n', body_start):
+            body_start += 2
+        elif self.data.startswith(b'\n', body_start) or self.data.startswith(b'\r', body_start):
+            body_start += 1
+        body_end = self._stream_end(dictionary, body_start)
+        return header.end(), dictionary, self.view[body_start:body_end]
+
+    def _stream_end(self, dictionary, body_start):
+        length = _LENGTH.search(dictionary)
+        if length:
+            size = int(length.group(1)) if length.group(2) is None else self._integer_object(int(length.group(1)))
+            if size is not None:
+                end = body_start + size
+                after = _skip_whitespace(self.data, end)
+                if self.data.startswith(b'endstream', after):
+                    return end
+        end = self.data.find(b'endstream', body_start)
+        return len(self.data) if end < 0 else end
+
+    def _integer_object(self, number):
+        offset = self.offsets.get(number)
+        if offset is None:
+            return None
+        header = _OBJECT_HEADER.match(self.data, offset)
+        value = re.match(rb'\s*(\d+)', self.data[header.end():header.end() + 32]) if header else None
+        return int(value.group(1)) if value else None
+
+    def iter_objects(self):
+        for offset in sorted(self.offsets.values()):
+            header_end, dictionary, body = self._object(offset)
+            if header_end is not None:
+                yield header_end, dictionary, body
+
+
+def _is_content_stream(dictionary):
+    if _NOT_CONTENT.search(dictionary):
+        return False
+    filters = _FILTER.search(dictionary)
+    if not filters:
+        return True
+    names = _FILTER_NAME.findall(filters.group(1))
+    return all(name in (b'FlateDecode', b'Fl') for name in names) and len(names) <= 1
+
+
+def _inflate(body, dictionary):
+    if not _FILTER.search(dictionary):
+        return bytes(body)
+    decompressor = zlib.decompressobj()
+    try:
+        return decompressor.decompress(body, MAX_INFLATED_STREAM_BYTES)
+    except zlib.error:
+        return b''
+
+
+def _read_literal(content, index):
+    """Return (raw bytes, offset past the closing parenthesis) for the string opening at `index`."""
+    decoded = bytearray()
+    depth = 1
+    index += 1
+    length = len(content)
+    while index < length:
+        byte = content[index]
+        if byte == 92:  # backslash
+            index += 1
+            if index >= length:
+                break
+            escaped = content[index]
+            if escaped in _LITERAL_ESCAPES:
+                decoded.extend(_LITERAL_ESCAPES[escaped])
+                index += 1
+            elif escaped in (10, 13):
+                index += 2 if escaped == 13 and content[index + 1:index + 2] == b'\n' else 1
+            elif 48 <= escaped <= 55:
+                end = index + 1
+                while end < length and end < index + 3 and 48 <= content[end] <= 55:
+                    end += 1
+                decoded.append(int(content[index:end], 8) & 0xFF)
+                index = end
+            else:
+                decoded.append(escaped)
+                index += 1
+            continue
+        if byte == 40:
+            depth += 1
+        elif byte == 41:
+            depth -= 1
+            if depth == 0:
+                return bytes(decoded), index + 1
+        decoded.append(byte)
+        index += 1
+    return bytes(decoded), index
+
+
+def decode_text_bytes(raw_bytes):
+    if not raw_bytes:
+        return ''
+    if raw_bytes.startswith((b'\xfe\xff', b'\xff\xfe')):
+        for encoding in ('utf-16', 'utf-16-be', 'utf-16-le'):
+            try:
+                return raw_bytes.decode(encoding)
+            except UnicodeDecodeError:
+                continue
+    if raw_bytes.count(b'\x00') > max(1, len(raw_bytes) // 8):
+        for encoding in ('utf-16-be', 'utf-16-le'):
+            try:
+                return raw_bytes.decode(encoding)
+            except UnicodeDecodeError:
+                continue
+    try:
+        return raw_bytes.decode('utf-8')
+    except UnicodeDecodeError:
+        return raw_bytes.decode('latin-1')
+
+
+def _hex_bytes(value):
+    digits = re.sub(rb'\s', b'', value)
+    if len(digits) % 2:
+        digits += b'0'
+    return bytes.fromhex(digits.decode('ascii'))
+
+
+def _iter_text_lines(content):
+    """Yield the text lines shown by the BT/ET blocks of one content stream."""
+    parts = []
+    current_y = None
+
+    def flush():
+        line = re.sub(r'\s+', ' ', ''.join(parts)).strip()
+        parts.clear()
+        return line
+
+    position = 0
+    length = len(content)
+    while position < length:
+        block = _TEXT_BLOCK.search(content, position)
+        if not block:
+            break
+        position = block.end()
+        operands = []
+        while position < length:
+            position = _skip_whitespace(content, position)
+            if content[position:position + 1] == b'(':
+                value, position = _read_literal(content, position)
+                operands.append(decode_text_bytes(value))
+                continue
+            token = _TOKEN.match(content, position)
+            if not token:
+                break
+            position = token.end()
+            if token.group('hex') is not None:
+                try:
+                    operands.append(decode_text_bytes(_hex_bytes(token.group('hex'))))
+                except ValueError:
+                    operands.append('')
+            elif token.group('open') is not None:
+                operands.append('[')
+            elif token.group('close') is not None:
+                array = []
+                while operands and operands[-1] != '[':
+                    array.append(operands.pop())
+                if operands:
+                    operands.pop()
+                operands.append(list(reversed(array)))
+            elif token.group('number') is not None:
+                operands.append(float(token.group('number')))
+            elif token.group('operator') is not None:
+                operator = token.group('operator')
+                if operator == b'ET':
+                    break
+                if operator in (b'Tj', b"'", b'"'):
+                    if operator != b'Tj':
+                        line = flush()
+                        if line:
+                            yield line
+                    if operands and isinstance(operands[-1], str):
+                        parts.append(operands[-1])
+                elif operator == b'TJ' and operands and isinstance(operands[-1], list):
+                    for item in operands[-1]:
+                        if isinstance(item, str):
+                            parts.append(item)
+                        elif isinstance(item, float) and item < _TJ_SPACE_THRESHOLD:
+                            parts.append(' ')
+                elif operator in (b'Td', b'TD') and len(operands) >= 2:
+                    if operands[-1] != 0:
+                        line = flush()
+                        if line:
+                            yield line
+                    elif parts:
+                        parts.append(' ')
+                elif operator == b'Tm' and len(operands) >= 6:
+                    if current_y is not None and operands[-1] != current_y:
+                        line = flush()
+                        if line:
+                            yield line
+                    elif parts:
+                        parts.append(' ')
+                    current_y = operands[-1]
+                elif operator == b'T*':
+                    line = flush()
+                    if line:
+                        yield line
+                operands = []
+        line = flush()
+        if line:
+            yield line
+
+
+def _iter_dictionary_strings(document):
+    for header_end, dictionary, body in document.iter_objects():
+        if body is not None:
+            continue
+        end = document.data.find(b'endobj', header_end)
+        region = document.data[header_end:end if end >= 0 else header_end + 4096]
+        index = region.find(b'(')
+        while index >= 0:
+            value, index = _read_literal(region, index)
+            text = re.sub(r'\s+', ' ', decode_text_bytes(value)).strip()
+            if text:
+                yield text
+            index = region.find(b'(', index)
+
+
+def extract_pdf_text_lines(data, max_chars=PDF_TEXT_MAX_CHARS):
+    """
+    Return the text lines of a PDF in file order, stopping once about
+    `max_chars` characters have been collected.
+
+    When no content stream yields text, literal strings from object
+    dictionaries (document info, annotations, form fields) are returned instead.
+    """
+    if not data:
+        return []
+    document = _Document(bytes(data))
+    document.load_offsets()
+
+    lines = []
+    total = 0
+    for _, dictionary, body in document.iter_objects():
+        if body is None or not _is_content_stream(dictionary):
+            continue
+        content = _inflate(body, dictionary)
+        if b'BT' not in content:
+            continue
+        for line in _iter_text_lines(content):
+            lines.append(line)
+            total += len(line)
+            if total >= max_chars:
+                return lines
+    if lines:
+        return lines
+
+    for text in _iter_dictionary_strings(document):
+        lines.append(text)
+        total += len(text)
+        if total >= max_chars:
+            break
+    return lines
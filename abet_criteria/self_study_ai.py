@@ -1,14 +1,31 @@
 import copy
+import hashlib
 import json
 import os
 import re
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import timedelta
 from urllib import error as urllib_error
-from urllib import request as urllib_request
+
+from django.utils import timezone
+
+from . import ai_http
+from .models import AIRewriteCacheEntry
 
 
 OPENAI_REPORT_MODEL = os.environ.get('OPENAI_REPORT_MODEL', 'gpt-4.1-mini')
 OPENAI_REPORT_TIMEOUT_SECONDS = 90
 OPENAI_REPORT_BATCH_SIZE = 20
+# Batches are packed by prompt size (roughly 4 characters per token) as well as field count.
+OPENAI_REPORT_BATCH_CHAR_BUDGET = int(os.environ.get('OPENAI_REPORT_BATCH_CHAR_BUDGET', '24000'))
+OPENAI_REPORT_FIELD_CHAR_LIMIT = 2600
+OPENAI_REPORT_MAX_IN_FLIGHT = int(os.environ.get('OPENAI_REPORT_MAX_IN_FLIGHT', '4'))
+OPENAI_RESPONSES_URL = os.environ.get('OPENAI_RESPONSES_URL', 'https://api.openai.com/v1/responses')
+NO_ELIGIBLE_FIELDS_ERROR = 'None of the selected fields are eligible for AI drafting.'
+# Bump when _build_rewrite_prompt or the system prompt changes so cached rewrites are not reused.
+REWRITE_PROMPT_VERSION = 1
+REWRITE_CACHE_TTL = timedelta(days=int(os.environ.get('OPENAI_REWRITE_CACHE_TTL_DAYS', '30')))
+REWRITE_CACHE_MAX_ENTRIES = int(os.environ.get('OPENAI_REWRITE_CACHE_MAX_ENTRIES', '5000'))
 
 
 SELF_STUDY_AI_FIELD_GROUPS = {
@@ -229,19 +246,18 @@ def _run_openai_json_prompt(prompt_text):
     }
 
     encoded_body = json.dumps(request_body).encode('utf-8')
-    request = urllib_request.Request(
-        'https://api.openai.com/v1/responses',
-        data=encoded_body,
-        headers={
-            'Content-Type': 'application/json',
-            'Authorization': f'Bearer {api_key}',
-        },
-        method='POST',
-    )
 
     try:
-        with urllib_request.urlopen(request, timeout=OPENAI_REPORT_TIMEOUT_SECONDS) as response:
-            raw_payload = response.read().decode('utf-8')
+        raw_payload = ai_http.post(
+            OPENAI_RESPONSES_URL,
+            encoded_body,
+            headers={
+                'Content-Type': 'application/json',
+                'Authorization': f'Bearer {api_key}',
+            },
+            timeout=OPENAI_REPORT_TIMEOUT_SECONDS,
+            provider='openai',
+        ).decode('utf-8')
     except urllib_error.HTTPError as exc:
         raw_error = exc.read().decode('utf-8', errors='replace')
         try:
@@ -373,24 +389,51 @@ def _build_target_descriptors(payload, selected_pairs):
             'field_key': field_key,
             'field_label': registry_entry['label'],
             'guidance': registry_entry['guidance'],
-            'current_value': _truncate_text(section_payload.get(field_key), limit=2600),
+            'current_value': _truncate_text(section_payload.get(field_key), limit=OPENAI_REPORT_FIELD_CHAR_LIMIT),
             'section_context': _build_section_context(section_payload, field_key),
         })
     return valid_targets, invalid_targets
 
 
+def _compact_target(target):
+    return {
+        'section_id': target['section_id'],
+        'section_title': target['section_title'],
+        'field_key': target['field_key'],
+        'field_label': target['field_label'],
+        'guidance': target['guidance'],
+        'current_value': target['current_value'],
+        'nearby_section_context': target['section_context'],
+    }
+
+
+def _pack_rewrite_batches(targets):
+    """
+    Group targets into batches of similar prompt size.
+
+    Largest targets are placed first, each into the first batch that still has
+    room under OPENAI_REPORT_BATCH_CHAR_BUDGET and OPENAI_REPORT_BATCH_SIZE; a
+    target bigger than the budget gets a batch of its own.
+    """
+    sized = sorted(
+        ((len(json.dumps(_compact_target(target), ensure_ascii=False, indent=2)), index, target) for index, target in enumerate(targets)),
+        key=lambda item: (-item[0], item[1]),
+    )
+    batches = []
+    for size, index, target in sized:
+        for batch in batches:
+            if batch['size'] + size <= OPENAI_REPORT_BATCH_CHAR_BUDGET and len(batch['targets']) < OPENAI_REPORT_BATCH_SIZE:
+                break
+        else:
+            batch = {'size': 0, 'targets': []}
+            batches.append(batch)
+        batch['size'] += size
+        batch['targets'].append((index, target))
+    return [[target for _, target in sorted(batch['targets'], key=lambda item: item[0])] for batch in batches]
+
+
 def _build_rewrite_prompt(metadata, targets):
-    compact_targets = []
-    for target in targets:
-        compact_targets.append({
-            'section_id': target['section_id'],
-            'section_title': target['section_title'],
-            'field_key': target['field_key'],
-            'field_label': target['field_label'],
-            'guidance': target['guidance'],
-            'current_value': target['current_value'],
-            'nearby_section_context': target['section_context'],
-        })
+    compact_targets = [_compact_target(target) for target in targets]
 
     instructions = {
         'task': 'Rewrite or expand each selected field for an ABET self-study report.',
@@ -421,50 +464,181 @@ def _build_rewrite_prompt(metadata, targets):
     return json.dumps(instructions, ensure_ascii=False, indent=2)
 
 
-def augment_self_study_payload_with_ai(payload, selected_fields):
+def _rewrite_cache_key(metadata, target):
+    # Everything _build_rewrite_prompt sends for the target, so one program never gets another's rewrite.
+    source = [
+        OPENAI_REPORT_MODEL,
+        REWRITE_PROMPT_VERSION,
+        _clean_text((metadata or {}).get('program_name')),
+        _clean_text((metadata or {}).get('cycle_label')),
+        target['section_id'],
+        target['field_key'],
+        target['current_value'],
+        target['section_context'],
+    ]
+    return hashlib.sha256(json.dumps(source, ensure_ascii=False, sort_keys=True).encode('utf-8')).hexdigest()
+
+
+def _cached_rewrites(keys):
+    """Return {key: text} for live cache entries and mark them as used."""
+    now = timezone.now()
+    entries = dict(
+        AIRewriteCacheEntry.objects.filter(key__in=keys, last_used_at__gte=now - REWRITE_CACHE_TTL)
+        .values_list('key', 'rewritten_text')
+    )
+    if entries:
+        AIRewriteCacheEntry.objects.filter(key__in=list(entries)).update(last_used_at=now)
+    return entries
+
+
+def _store_rewrites(rows):
+    """Save (key, target, text) rows, then evict expired and least recently used entries."""
+    if not rows:
+        return
+    now = timezone.now()
+    AIRewriteCacheEntry.objects.bulk_create(
+        [
+            AIRewriteCacheEntry(
+                key=key,
+                model=OPENAI_REPORT_MODEL,
+                section_id=target['section_id'],
+                field_key=target['field_key'],
+                rewritten_text=text,
+                created_at=now,
+                last_used_at=now,
+            )
+            for key, target, text in rows
+        ],
+        update_conflicts=True,
+        unique_fields=['key'],
+        update_fields=['rewritten_text', 'last_used_at'],
+    )
+    AIRewriteCacheEntry.objects.filter(last_used_at__lt=now - REWRITE_CACHE_TTL).delete()
+    overflow = AIRewriteCacheEntry.objects.order_by('-last_used_at', '-key').values_list('key', flat=True)[REWRITE_CACHE_MAX_ENTRIES:]
+    stale_keys = list(overflow)
+    if stale_keys:
+        AIRewriteCacheEntry.objects.filter(key__in=stale_keys).delete()
+
+
+def _run_rewrite_batch(metadata, batch_targets):
+    parsed_response, error = _run_openai_json_prompt(_build_rewrite_prompt(metadata, batch_targets))
+    if error:
+        return None, error
+    rewrite_rows = parsed_response.get('rewrites') if isinstance(parsed_response, dict) else None
+    if not isinstance(rewrite_rows, list):
+        return None, 'OpenAI did not return the expected rewrite format.'
+    return rewrite_rows, None
+
+
+def _dispatch_rewrite_batches(metadata, batches, on_batch_done=None):
+    """
+    Run the batches with at most OPENAI_REPORT_MAX_IN_FLIGHT requests open.
+
+    Results keep batch order; on_batch_done(batch) is called as each finishes.
+    """
+    if len(batches) <= 1:
+        results = []
+        for batch in batches:
+            results.append(_run_rewrite_batch(metadata, batch))
+            if on_batch_done:
+                on_batch_done(batch)
+        return results
+
+    workers = max(1, min(OPENAI_REPORT_MAX_IN_FLIGHT, len(batches)))
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='openai-report') as executor:
+        futures = {executor.submit(_run_rewrite_batch, metadata, batch): index for index, batch in enumerate(batches)}
+        results = [None] * len(batches)
+        for future in as_completed(futures):
+            index = futures[future]
+            results[index] = future.result()
+            if on_batch_done:
+                on_batch_done(batches[index])
+    return results
+
+
+def validate_selected_fields(payload, selected_fields):
+    """Return (invalid, error); `error` is set when none of the selected fields can be drafted."""
     selected_pairs = _normalize_selected_fields(selected_fields)
     if not selected_pairs:
-        return copy.deepcopy(payload), [], [], None
+        return [], None
+    targets, invalid_targets = _build_target_descriptors(payload, selected_pairs)
+    if not targets:
+        return invalid_targets, NO_ELIGIBLE_FIELDS_ERROR
+    return invalid_targets, None
+
+
+def augment_self_study_payload_with_ai(payload, selected_fields, progress=None):
+    """
+    Rewrite the selected fields with OpenAI.
+
+    Returns (payload, applied, invalid, failed, error). Batches that fail are
+    reported in `failed` with their error while the others are still applied;
+    `error` is only set when nothing could be applied. `progress`, if given,
+    is called with (finished_fields, total_fields) as work completes.
+    """
+    selected_pairs = _normalize_selected_fields(selected_fields)
+    if not selected_pairs:
+        return copy.deepcopy(payload), [], [], [], None
 
     targets, invalid_targets = _build_target_descriptors(payload, selected_pairs)
     if not targets:
-        return None, [], invalid_targets, 'None of the selected fields are eligible for AI drafting.'
+        return None, [], invalid_targets, [], NO_ELIGIBLE_FIELDS_ERROR
 
     augmented_payload = copy.deepcopy(payload)
-    applied = []
-    valid_lookup = {(target['section_id'], target['field_key']): target for target in targets}
     sections = (augmented_payload or {}).get('sections') or {}
     metadata = (payload or {}).get('metadata') or {}
-
-    for start_index in range(0, len(targets), OPENAI_REPORT_BATCH_SIZE):
-        batch_targets = targets[start_index:start_index + OPENAI_REPORT_BATCH_SIZE]
-        prompt = _build_rewrite_prompt(metadata, batch_targets)
-        parsed_response, error = _run_openai_json_prompt(prompt)
+    failed = []
+    errors = []
+
+    # Unchanged fields reuse earlier rewrites; only cache misses are sent to OpenAI.
+    keys = {(target['section_id'], target['field_key']): _rewrite_cache_key(metadata, target) for target in targets}
+    cached = _cached_rewrites(list(keys.values()))
+    rewritten = {pair: cached[key] for pair, key in keys.items() if key in cached}
+    misses = [target for target in targets if (target['section_id'], target['field_key']) not in rewritten]
+
+    batches = _pack_rewrite_batches(misses)
+    finished = [len(targets) - len(misses)]
+
+    def on_batch_done(batch_targets):
+        finished[0] += len(batch_targets)
+        progress(finished[0], len(targets))
+
+    if progress:
+        progress(finished[0], len(targets))
+    fresh = []
+    dispatched = _dispatch_rewrite_batches(metadata, batches, on_batch_done if progress else None)
+    for batch_targets, (rewrite_rows, error) in zip(batches, dispatched):
         if error:
-            return None, applied, invalid_targets, error
-
-        rewrite_rows = parsed_response.get('rewrites') if isinstance(parsed_response, dict) else None
-        if not isinstance(rewrite_rows, list):
-            return None, applied, invalid_targets, 'OpenAI did not return the expected rewrite format.'
+            errors.append(error)
+            failed.extend(
+                {'sectionId': target['section_id'], 'fieldKey': target['field_key'], 'error': error}
+                for target in batch_targets
+            )
+            continue
 
+        batch_lookup = {(target['section_id'], target['field_key']): target for target in batch_targets}
         for row in rewrite_rows:
-            section_id = _clean_text((row or {}).get('section_id'))
-            field_key = _clean_text((row or {}).get('field_key'))
+            pair = (_clean_text((row or {}).get('section_id')), _clean_text((row or {}).get('field_key')))
             rewritten_text = _clean_text((row or {}).get('text'))
-            if not section_id or not field_key or not rewritten_text:
+            if pair not in batch_lookup or not rewritten_text or pair in rewritten:
                 continue
-            if (section_id, field_key) not in valid_lookup:
-                continue
-            if section_id not in sections or field_key not in sections[section_id]:
-                continue
-            sections[section_id][field_key] = rewritten_text
-            applied.append({
-                'sectionId': section_id,
-                'fieldKey': field_key,
-                'label': valid_lookup[(section_id, field_key)]['field_label'],
-            })
+            rewritten[pair] = rewritten_text
+            fresh.append((keys[pair], batch_lookup[pair], rewritten_text))
+    _store_rewrites(fresh)
+
+    applied = []
+    for target in targets:
+        pair = (target['section_id'], target['field_key'])
+        if pair not in rewritten or target['section_id'] not in sections or target['field_key'] not in sections[target['section_id']]:
+            continue
+        sections[target['section_id']][target['field_key']] = rewritten[pair]
+        applied.append({
+            'sectionId': target['section_id'],
+            'fieldKey': target['field_key'],
+            'label': target['field_label'],
+        })
 
     if not applied:
-        return None, [], invalid_targets, 'OpenAI did not return usable text for the selected fields.'
+        return None, [], invalid_targets, failed, errors[0] if errors else 'OpenAI did not return usable text for the selected fields.'
 
-    return augmented_payload, applied, invalid_targets, None
+    return augmented_payload, applied, invalid_targets, failed, None
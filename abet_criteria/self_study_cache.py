@@ -0,0 +1,190 @@
+import hashlib
+import os
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import UTC, datetime
+
+from django.core.cache import cache
+from django.db import connections
+from django.db.models import F
+from django.utils import timezone
+
+from .models import AccreditationCycle, AssignedTo, SelfStudySectionVersion
+
+
+SELF_STUDY_CACHE_TIMEOUT = int(os.environ.get('SELF_STUDY_CACHE_TIMEOUT', '86400'))
+# 0 builds every section on the request thread.
+SELF_STUDY_PARALLEL_WORKERS = int(os.environ.get('SELF_STUDY_PARALLEL_WORKERS', '0'))
+
+_MISSING = object()
+_UNSEEDED_TOKEN = uuid.UUID(int=0)
+_UNSEEDED_AT = datetime(1970, 1, 1, tzinfo=UTC)
+
+SELF_STUDY_SECTIONS = (
+    'background',
+    'criterion1',
+    'criterion2',
+    'criterion3',
+    'criterion4',
+    'criterion5',
+    'criterion6',
+    'criterion7',
+    'criterion8',
+    'appendixA',
+    'appendixB',
+    'appendixC',
+    'appendixD',
+    'evidence_files',
+)
+
+# Program-wide records and the sections of every program cycle built from them.
+PROGRAM_RECORD_SECTIONS = {
+    'student_outcomes': ('criterion3', 'criterion4', 'appendixA'),
+    'peos': ('criterion3',),
+    'clos': ('criterion3', 'appendixA'),
+    'courses': ('criterion3', 'criterion4', 'criterion6', 'appendixA'),
+    'faculty': ('criterion6', 'appendixA', 'appendixB'),
+}
+
+
+def section_versions(cycle_id):
+    # Reads never write: a section without a row reads as version 0 under a
+    # fixed token until the first write (or seed_section_versions) creates it.
+    versions = {row.section: row for row in SelfStudySectionVersion.objects.filter(cycle_id=cycle_id)}
+    for section in SELF_STUDY_SECTIONS:
+        if section not in versions:
+            versions[section] = SelfStudySectionVersion(
+                cycle_id=cycle_id, section=section, version=0, token=_UNSEEDED_TOKEN, updated_at=_UNSEEDED_AT,
+            )
+    return versions
+
+
+def seed_section_versions(cycle_ids):
+    """Create the version rows the given cycles are missing."""
+    cycle_ids = [int(cycle_id) for cycle_id in cycle_ids if cycle_id is not None]
+    existing = set(
+        SelfStudySectionVersion.objects.filter(cycle_id__in=cycle_ids).values_list('cycle_id', 'section')
+    )
+    missing = [
+        SelfStudySectionVersion(cycle_id=cycle_id, section=section)
+        for cycle_id in cycle_ids
+        for section in SELF_STUDY_SECTIONS
+        if (cycle_id, section) not in existing
+    ]
+    if missing:
+        SelfStudySectionVersion.objects.bulk_create(missing, ignore_conflicts=True)
+
+
+def _cache_key(cycle_id, version):
+    return f'self-study:{cycle_id}:{version.section}:{version.token.hex}:{version.version}'
+
+
+def section_validators(cycle_id, sections=SELF_STUDY_SECTIONS, *extra):
+    """
+    Return (digest, updated_at) for content built from the given sections.
+
+    The digest changes whenever any of the sections is written; updated_at is
+    the latest of their write times.
+    """
+    versions = section_versions(cycle_id)
+    rows = [versions[section] for section in sections]
+    parts = [f'{row.section}:{row.token.hex}:{row.version}' for row in rows]
+    parts.extend(str(value) for value in extra)
+    digest = hashlib.sha256('|'.join(parts).encode('utf-8')).hexdigest()[:32]
+    return digest, max(row.updated_at for row in rows)
+
+
+_executors = {}
+_executors_lock = threading.Lock()
+
+
+def _section_executor(workers):
+    with _executors_lock:
+        if workers not in _executors:
+            _executors[workers] = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='self-study')
+        return _executors[workers]
+
+
+def _build_on_worker(builder):
+    # Pool threads open their own connections; close them so none outlive the build.
+    try:
+        return builder()
+    finally:
+        connections.close_all()
+
+
+def iter_cached_sections(cycle_id, builders, parallel=()):
+    """
+    Yield (section, payload) in builder order. Each section is read from the
+    cache, or built and cached when stale, only once it is reached.
+
+    When SELF_STUDY_PARALLEL_WORKERS is set, stale sections named in
+    `parallel` (builders that only read) are started up front on a bounded
+    thread pool while the remaining builders run on the calling thread.
+    """
+    versions = section_versions(cycle_id)
+    keys = {section: _cache_key(cycle_id, versions[section]) for section in builders}
+
+    futures = {}
+    if SELF_STUDY_PARALLEL_WORKERS > 0:
+        executor = _section_executor(SELF_STUDY_PARALLEL_WORKERS)
+        # has_key only checks for the entry, so no cached payload is loaded
+        # before the section it belongs to is reached.
+        futures = {
+            section: executor.submit(_build_on_worker, builder)
+            for section, builder in builders.items()
+            if section in parallel and not cache.has_key(keys[section])
+        }
+
+    try:
+        for section, builder in builders.items():
+            key = keys[section]
+            payload = _MISSING if section in futures else cache.get(key, _MISSING)
+            if payload is not _MISSING:
+                yield section, payload
+                continue
+            payload = futures.pop(section).result() if section in futures else builder()
+            cache.set(key, payload, SELF_STUDY_CACHE_TIMEOUT)
+            yield section, payload
+    finally:
+        for future in futures.values():
+            future.cancel()
+
+
+def cached_sections(cycle_id, builders, parallel=()):
+    """
+    Return {section: payload} for the given builders.
+
+    Payloads are cached under the section's current version, so only sections
+    written since they were last cached are rebuilt.
+    """
+    return dict(iter_cached_sections(cycle_id, builders, parallel))
+
+
+def _bump(cycle_ids, sections):
+    # Rows missing until now read as version 0, so creating them already moves
+    # every section of those cycles off the unseeded keys.
+    seed_section_versions(cycle_ids)
+    return SelfStudySectionVersion.objects.filter(cycle_id__in=cycle_ids, section__in=list(sections)).update(
+        version=F('version') + 1, updated_at=timezone.now(),
+    )
+
+
+def touch_cycle_sections(cycle_ids, sections):
+    cycle_ids = [int(cycle_id) for cycle_id in cycle_ids if cycle_id is not None]
+    if not cycle_ids:
+        return 0
+    return _bump(cycle_ids, sections)
+
+
+def touch_program_sections(program_ids, *records):
+    sections = {section for record in records for section in PROGRAM_RECORD_SECTIONS[record]}
+    cycle_ids = AccreditationCycle.objects.filter(program_id__in=list(program_ids)).values_list('cycle_id', flat=True)
+    return _bump(list(cycle_ids), sections)
+
+
+def touch_faculty_sections(faculty_id):
+    program_ids = AssignedTo.objects.filter(faculty_id=faculty_id).values('program_id')
+    cycle_ids = AccreditationCycle.objects.filter(program_id__in=program_ids).values_list('cycle_id', flat=True)
+    return _bump(list(cycle_ids), PROGRAM_RECORD_SECTIONS['faculty'])
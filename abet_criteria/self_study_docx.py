@@ -0,0 +1,353 @@
+import glob
+import os
+import re
+import tempfile
+import uuid
+import zipfile
+from xml.sax.saxutils import escape
+
+from .self_study_ai import SELF_STUDY_AI_FIELD_GROUPS, _is_scalar, _prettify_label
+
+
+DOCX_CONTENT_TYPE = 'application/vnd.openxmlformats-officedocument.wordprocessingml.document'
+SELF_STUDY_EXPORT_DIR = os.environ.get(
+    'SELF_STUDY_EXPORT_DIR',
+    os.path.join(tempfile.gettempdir(), 'abet-self-study-exports'),
+)
+
+EMPTY_TEXT = 'Not provided.'
+FONT_FAMILY = 'Arial'
+BODY_SIZE = 24
+SUBTITLE_SIZE = 28
+BODY_INDENT = 360
+NESTED_INDENT = 720
+MAX_DEPTH = 4
+
+# Serializer bookkeeping that has no place in the report body.
+SKIPPED_KEYS = {'id', 'cycle', 'item', 'program', 'user', 'file_blob'}
+ITEM_TITLE_KEYS = ('course_code', 'full_name', 'name', 'title', 'label', 'code')
+
+_INVALID_XML_CHARS = re.compile(r'[\x00-\x08\x0b\x0c\x0e-\x1f\x7f\ud800-\udfff\ufffe\uffff]')
+
+_W_NS = 'http://schemas.openxmlformats.org/wordprocessingml/2006/main'
+
+CONTENT_TYPES_XML = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+    '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+    '<Default Extension="xml" ContentType="application/xml"/>'
+    '<Override PartName="/word/document.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.document.main+xml"/>'
+    '<Override PartName="/word/styles.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.styles+xml"/>'
+    '</Types>'
+)
+
+PACKAGE_RELS_XML = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" '
+    'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" '
+    'Target="word/document.xml"/>'
+    '</Relationships>'
+)
+
+DOCUMENT_RELS_XML = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" '
+    'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/styles" '
+    'Target="styles.xml"/>'
+    '</Relationships>'
+)
+
+STYLES_XML = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    f'<w:styles xmlns:w="{_W_NS}">'
+    '<w:docDefaults><w:rPrDefault><w:rPr>'
+    f'<w:rFonts w:ascii="{FONT_FAMILY}" w:hAnsi="{FONT_FAMILY}" w:cs="{FONT_FAMILY}"/>'
+    f'<w:sz w:val="{BODY_SIZE}"/>'
+    '</w:rPr></w:rPrDefault></w:docDefaults>'
+    '<w:style w:type="paragraph" w:default="1" w:styleId="Normal"><w:name w:val="Normal"/></w:style>'
+    '<w:style w:type="paragraph" w:styleId="Heading1"><w:name w:val="heading 1"/>'
+    '<w:basedOn w:val="Normal"/><w:next w:val="Normal"/>'
+    '<w:pPr><w:keepNext/><w:spacing w:before="240" w:after="200"/><w:outlineLvl w:val="0"/></w:pPr>'
+    '<w:rPr><w:b/><w:sz w:val="32"/></w:rPr></w:style>'
+    '<w:style w:type="table" w:styleId="TableGrid"><w:name w:val="Table Grid"/><w:tblPr><w:tblBorders>'
+    '<w:top w:val="single" w:sz="4" w:space="0" w:color="auto"/>'
+    '<w:left w:val="single" w:sz="4" w:space="0" w:color="auto"/>'
+    '<w:bottom w:val="single" w:sz="4" w:space="0" w:color="auto"/>'
+    '<w:right w:val="single" w:sz="4" w:space="0" w:color="auto"/>'
+    '<w:insideH w:val="single" w:sz="4" w:space="0" w:color="auto"/>'
+    '<w:insideV w:val="single" w:sz="4" w:space="0" w:color="auto"/>'
+    '</w:tblBorders></w:tblPr></w:style>'
+    '</w:styles>'
+)
+
+DOCUMENT_HEAD_XML = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    f'<w:document xmlns:w="{_W_NS}"><w:body>'
+)
+
+DOCUMENT_TAIL_XML = (
+    '<w:sectPr><w:pgSz w:w="12240" w:h="15840"/>'
+    '<w:pgMar w:top="1440" w:right="1440" w:bottom="1440" w:left="1440" '
+    'w:header="720" w:footer="720" w:gutter="0"/></w:sectPr>'
+    '</w:body></w:document>'
+)
+
+
+def _text(value):
+    if isinstance(value, bool):
+        value = 'Yes' if value else 'No'
+    cleaned = _INVALID_XML_CHARS.sub(' ', f'{"" if value is None else value}')
+    cleaned = re.sub(r'[ \t]*\n[ \t]*', '\n', cleaned).strip()
+    return cleaned
+
+
+def _has_value(value):
+    if isinstance(value, (list, dict)):
+        return bool(value)
+    return _text(value) != ''
+
+
+def _run(text, bold=False, size=None):
+    properties = ''
+    if bold or size:
+        properties = '<w:rPr>' + ('<w:b/>' if bold else '') + (f'<w:sz w:val="{size}"/>' if size else '') + '</w:rPr>'
+    lines = _text(text).split('\n')
+    body = '<w:br/>'.join(f'<w:t xml:space="preserve">{escape(line)}</w:t>' for line in lines)
+    return f'<w:r>{properties}{body}</w:r>'
+
+
+def _paragraph(text, indent=BODY_INDENT, bold=False, size=None, style=None, align=None, spacing=None):
+    properties = []
+    if style:
+        properties.append(f'<w:pStyle w:val="{style}"/>')
+    if spacing:
+        properties.append(f'<w:spacing w:before="{spacing[0]}" w:after="{spacing[1]}"/>')
+    if indent:
+        properties.append(f'<w:ind w:left="{indent}"/>')
+    if align:
+        properties.append(f'<w:jc w:val="{align}"/>')
+    return f'<w:p><w:pPr>{"".join(properties)}</w:pPr>{_run(text, bold=bold, size=size)}</w:p>'
+
+
+def _body(value, indent=BODY_INDENT):
+    return _paragraph(value if _has_value(value) else EMPTY_TEXT, indent=indent)
+
+
+def _subtitle(text, indent=BODY_INDENT):
+    return _paragraph(text, indent=indent, bold=True, size=SUBTITLE_SIZE, spacing=(200, 120))
+
+
+def _page_break():
+    return '<w:p><w:r><w:br w:type="page"/></w:r></w:p>'
+
+
+def _is_skipped(key):
+    return key in SKIPPED_KEYS or key.endswith('_id') or key.endswith('_ids')
+
+
+def _field_label(section_id, key):
+    field = (SELF_STUDY_AI_FIELD_GROUPS.get(section_id) or {}).get('fields', {}).get(key) or {}
+    return field.get('label') or _prettify_label(key)
+
+
+def _cell_text(value):
+    if isinstance(value, dict):
+        return '; '.join(
+            f'{_prettify_label(key)}: {_cell_text(item)}'
+            for key, item in value.items()
+            if not _is_skipped(key) and _has_value(item)
+        )
+    if isinstance(value, list):
+        return '; '.join(_cell_text(item) for item in value if _has_value(item))
+    return _text(value)
+
+
+def _cell(text, bold=False):
+    return f'<w:tc><w:tcPr><w:tcW w:w="0" w:type="auto"/></w:tcPr>{_paragraph(text, indent=0, bold=bold)}</w:tc>'
+
+
+def _table(rows, indent):
+    columns = []
+    for row in rows:
+        for key in row:
+            if key not in columns and not _is_skipped(key):
+                columns.append(key)
+    if not columns:
+        return _body('', indent)
+    header = '<w:tr>' + ''.join(_cell(_prettify_label(key), bold=True) for key in columns) + '</w:tr>'
+    body = ''.join(
+        '<w:tr>' + ''.join(_cell(_cell_text(row.get(key))) for key in columns) + '</w:tr>'
+        for row in rows
+    )
+    return (
+        '<w:tbl><w:tblPr><w:tblStyle w:val="TableGrid"/><w:tblW w:w="0" w:type="auto"/>'
+        f'<w:tblInd w:w="{indent}" w:type="dxa"/></w:tblPr>'
+        f'<w:tblGrid>{"<w:gridCol/>" * len(columns)}</w:tblGrid>'
+        f'{header}{body}</w:tbl>'
+        '<w:p/>'
+    )
+
+
+def _item_title(label, index, item):
+    for key in ITEM_TITLE_KEYS:
+        if _has_value(item.get(key)):
+            return _text(item[key])
+    return f'{label} {index}'
+
+
+def _iter_value_xml(section_id, key, value, depth):
+    indent = min(BODY_INDENT + depth * BODY_INDENT, NESTED_INDENT * 2)
+    label = _field_label(section_id, key)
+
+    if _is_scalar(value):
+        yield _subtitle(label, indent)
+        yield _body(value, indent)
+        return
+
+    if isinstance(value, dict):
+        yield _subtitle(label, indent)
+        yield from _iter_mapping_xml(section_id, value, depth + 1)
+        return
+
+    yield _subtitle(label, indent)
+    if not value:
+        yield _body('', indent)
+        return
+    if all(_is_scalar(item) for item in value):
+        for item in value:
+            yield _body(item, indent)
+        return
+
+    rows = [item for item in value if isinstance(item, dict)]
+    nested = depth < MAX_DEPTH and any(
+        isinstance(item, (dict, list)) and item
+        for row in rows
+        for item in row.values()
+    )
+    if not nested:
+        yield _table(rows, indent)
+        return
+    for index, row in enumerate(rows, start=1):
+        yield _paragraph(_item_title(label, index, row), indent=indent + BODY_INDENT, bold=True, spacing=(160, 100))
+        yield from _iter_mapping_xml(section_id, row, depth + 2)
+
+
+def _iter_mapping_xml(section_id, mapping, depth):
+    for key, value in mapping.items():
+        if _is_skipped(key):
+            continue
+        if depth >= MAX_DEPTH and not _is_scalar(value):
+            indent = min(BODY_INDENT + depth * BODY_INDENT, NESTED_INDENT * 2)
+            yield _subtitle(_field_label(section_id, key), indent)
+            yield _body(_cell_text(value), indent)
+            continue
+        yield from _iter_value_xml(section_id, key, value, depth)
+
+
+def _iter_section_xml(section_id, title, payload):
+    yield _paragraph(title, indent=0, style='Heading1')
+    if isinstance(payload, dict):
+        yield from _iter_mapping_xml(section_id, payload, 0)
+    elif isinstance(payload, list):
+        yield from _iter_value_xml(section_id, section_id, payload, 0)
+    else:
+        yield _body(payload)
+
+
+def _cover_xml(metadata):
+    return ''.join([
+        _paragraph(metadata.get('program_name') or 'Program', indent=0, bold=True, size=40, align='center', spacing=(2400, 240)),
+        _paragraph('ABET Self-Study Report', indent=0, bold=True, size=32, align='center', spacing=(0, 240)),
+        _paragraph(metadata.get('cycle_label') or '', indent=0, size=SUBTITLE_SIZE, align='center', spacing=(0, 240)),
+        _page_break(),
+    ])
+
+
+class _ChunkWriter:
+    """Write-only file object whose contents are drained between zip writes."""
+
+    def __init__(self):
+        self._chunks = []
+
+    def write(self, data):
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self):
+        pass
+
+    def drain(self):
+        data = b''.join(self._chunks)
+        self._chunks = []
+        return data
+
+
+def iter_self_study_docx(metadata, toc, sections):
+    """
+    Yield a .docx file in chunks.
+
+    `sections` is an iterable of (section_id, payload) pairs; each section is
+    rendered and written into word/document.xml as soon as it is produced.
+    """
+    titles = {entry['id']: entry['title'] for entry in toc}
+    writer = _ChunkWriter()
+    with zipfile.ZipFile(writer, 'w', compression=zipfile.ZIP_DEFLATED) as archive:
+        archive.writestr('[Content_Types].xml', CONTENT_TYPES_XML)
+        archive.writestr('_rels/.rels', PACKAGE_RELS_XML)
+        archive.writestr('word/_rels/document.xml.rels', DOCUMENT_RELS_XML)
+        archive.writestr('word/styles.xml', STYLES_XML)
+        yield writer.drain()
+
+        with archive.open('word/document.xml', 'w') as document:
+            document.write((DOCUMENT_HEAD_XML + _cover_xml(metadata)).encode('utf-8'))
+            first = True
+            for section_id, payload in sections:
+                if not first:
+                    document.write(_page_break().encode('utf-8'))
+                first = False
+                for fragment in _iter_section_xml(section_id, titles.get(section_id, section_id), payload):
+                    document.write(fragment.encode('utf-8'))
+                chunk = writer.drain()
+                if chunk:
+                    yield chunk
+            document.write(DOCUMENT_TAIL_XML.encode('utf-8'))
+    yield writer.drain()
+
+
+def export_path(cycle_id, fingerprint):
+    return os.path.join(SELF_STUDY_EXPORT_DIR, f'cycle-{cycle_id}-{fingerprint}.docx')
+
+
+def cache_docx_stream(path, chunks):
+    """
+    Pass chunks through while writing them to `path`.
+
+    The file only replaces an earlier export once the stream completed, so an
+    aborted download never leaves a truncated document in the cache.
+    """
+    directory = os.path.dirname(path)
+    os.makedirs(directory, exist_ok=True)
+    partial_path = f'{path}.{uuid.uuid4().hex}.part'
+    completed = False
+    try:
+        with open(partial_path, 'wb') as handle:
+            for chunk in chunks:
+                handle.write(chunk)
+                yield chunk
+        os.replace(partial_path, path)
+        completed = True
+    finally:
+        if not completed and os.path.exists(partial_path):
+            os.remove(partial_path)
+
+    prefix = os.path.basename(path).rsplit('-', 1)[0]
+    for stale_path in glob.glob(os.path.join(directory, f'{prefix}-*.docx')):
+        if stale_path != path:
+            try:
+                os.remove(stale_path)
+            except OSError:
+                pass
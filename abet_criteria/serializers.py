@@ -21,7 +21,9 @@ from .models import (
     StaffingRow,
     EvidenceFile,
     AccreditationCycle,
+    CRITERION_ITEMS,
     ChecklistItem,
+    criterion_number_from_name,
     FacultyMember,
 )
 
@@ -271,9 +273,32 @@ class AccreditationCycleSerializer(serializers.ModelSerializer):
 
 
 class ChecklistItemSerializer(serializers.ModelSerializer):
+    criterion_number = serializers.IntegerField(required=False, allow_null=True)
+
     class Meta:
         model = ChecklistItem
         fields = '__all__'
+        # Uniqueness of (checklist, criterion_number) is checked in validate(), after the number is resolved.
+        validators = []
+
+    def validate_criterion_number(self, value):
+        if value is not None and value not in CRITERION_ITEMS:
+            raise serializers.ValidationError(f'Must be one of {", ".join(str(number) for number in CRITERION_ITEMS)}.')
+        return value
+
+    def validate(self, attrs):
+        if self.instance is not None:
+            # An item keeps the criterion it was created for.
+            attrs.pop('criterion_number', None)
+            return attrs
+
+        if attrs.get('criterion_number') is None:
+            attrs['criterion_number'] = criterion_number_from_name(attrs.get('item_name'))
+        if attrs['criterion_number'] is None:
+            raise serializers.ValidationError({'criterion_number': 'Set criterion_number or use a criterion name as item_name.'})
+        if ChecklistItem.objects.filter(checklist=attrs.get('checklist'), criterion_number=attrs['criterion_number']).exists():
+            raise serializers.ValidationError({'criterion_number': 'This checklist already has an item for that criterion.'})
+        return attrs
 
 
 class FacultyMemberSerializer(serializers.ModelSerializer):
@@ -1,30 +1,69 @@
 import base64
 import csv
-import hashlib
 import html
+import http.client
 import json
 import os
 import re
 import subprocess
 import zipfile
-import zlib
 from datetime import datetime, timedelta
 from io import BytesIO, StringIO
 from urllib import error as urllib_error
-from urllib import request as urllib_request
 import xml.etree.ElementTree as ET
 
+from . import ai_http, extraction_cache, extraction_pool
+from .docx_text import extract_docx_text_blocks
+from .pdf_text import extract_pdf_text_lines
+
 
 DEFAULT_OLLAMA_MODEL = 'llama3.1:8b'
+OLLAMA_URL = os.environ.get('OLLAMA_URL', 'http://127.0.0.1:11434').rstrip('/')
+# How long the Ollama server keeps the model loaded after a request.
+OLLAMA_KEEP_ALIVE = os.environ.get('OLLAMA_KEEP_ALIVE', '30m')
 STRUCTURED_LLAMA_TIMEOUT_SECONDS = 150
 BACKGROUND_GEMINI_MODEL = 'gemini-2.5-flash'
 BACKGROUND_GEMINI_TIMEOUT_SECONDS = 30
 MAX_PROMPT_EVIDENCE_CHARS = 8000
-MAX_EXTRACTION_CACHE_ENTRIES = 64
-_TEXT_EXTRACTION_CACHE = {}
+
+
+def _run_ollama_http(prompt, timeout, model_name=DEFAULT_OLLAMA_MODEL):
+    payload = {
+        'model': model_name,
+        'prompt': prompt,
+        'stream': False,
+        'format': 'json',
+        'keep_alive': OLLAMA_KEEP_ALIVE,
+    }
+    raw_response = ai_http.post(
+        f'{OLLAMA_URL}/api/generate',
+        json.dumps(payload).encode('utf-8'),
+        headers={'Content-Type': 'application/json'},
+        timeout=timeout,
+        provider='ollama',
+        max_retries=0,
+    )
+    response_payload = json.loads(raw_response.decode('utf-8'))
+    return subprocess.CompletedProcess(
+        args=['ollama', 'run', model_name],
+        returncode=0,
+        stdout=f'{response_payload.get("response") or ""}',
+        stderr='',
+    )
 
 
 def _run_ollama_command(prompt, timeout, model_name=DEFAULT_OLLAMA_MODEL):
+    """
+    Run the prompt on the local Ollama server's HTTP API, which keeps the model
+    loaded between calls, falling back to `ollama run` when the server cannot
+    answer it. Returns a CompletedProcess either way.
+    """
+    try:
+        return _run_ollama_http(prompt, timeout, model_name=model_name)
+    except TimeoutError:
+        raise
+    except (OSError, ValueError, http.client.HTTPException):
+        pass
     return subprocess.run(
         ['ollama', 'run', model_name],
         input=prompt,
@@ -59,16 +98,6 @@ def _normalize_line(value):
     return re.sub(r'\s+', ' ', f'{value or ""}').strip()
 
 
-def _remember_text_extraction(cache_key, text):
-    if cache_key in _TEXT_EXTRACTION_CACHE:
-        return _TEXT_EXTRACTION_CACHE[cache_key]
-    if len(_TEXT_EXTRACTION_CACHE) >= MAX_EXTRACTION_CACHE_ENTRIES:
-        oldest_key = next(iter(_TEXT_EXTRACTION_CACHE))
-        _TEXT_EXTRACTION_CACHE.pop(oldest_key, None)
-    _TEXT_EXTRACTION_CACHE[cache_key] = text
-    return text
-
-
 def _normalize_extracted_chunk(value):
     return _clean_text(html.unescape(value))
 
@@ -94,7 +123,7 @@ def _looks_like_meaningful_text_chunk(value):
     return True
 
 
-def _dedupe_and_limit_chunks(chunks, max_chunks=40, max_total_chars=12000):
+def _dedupe_and_limit_chunks(chunks, max_chunks=40, max_total_chars=12000, separator='\n'):
     selected = []
     seen = set()
     total_chars = 0
@@ -116,7 +145,7 @@ def _dedupe_and_limit_chunks(chunks, max_chunks=40, max_total_chars=12000):
         total_chars += len(snippet)
         if len(selected) >= max_chunks:
             break
-    return '\n'.join(selected)
+    return separator.join(selected)
 
 
 def _clean_contact_value(value):
@@ -204,200 +233,12 @@ def _pick_field_value(candidates, validator, minimum_score):
 
 
 def _extract_text_from_docx_bytes(file_bytes):
-    paragraph_parts = []
-    namespace = {'w': 'http://schemas.openxmlformats.org/wordprocessingml/2006/main'}
-
-    def read_wordprocessing_part(xml_bytes):
-        try:
-            root = ET.fromstring(xml_bytes)
-        except ET.ParseError:
-            return []
-
-        paragraphs = []
-        for paragraph in root.findall('.//w:p', namespace):
-            segments = []
-            for node in paragraph.iter():
-                tag = node.tag.rsplit('}', 1)[-1] if '}' in node.tag else node.tag
-                if tag == 't':
-                    segments.append(node.text or '')
-                elif tag == 'tab':
-                    segments.append(' ')
-                elif tag in ('br', 'cr'):
-                    segments.append(' ')
-            text = html.unescape(''.join(segments))
-            text = re.sub(r'\s+', ' ', text).strip()
-            if text:
-                paragraphs.append(text)
-        return paragraphs
-
-    try:
-        with zipfile.ZipFile(BytesIO(file_bytes)) as archive:
-            candidate_names = []
-            for preferred_name in ('word/document.xml',):
-                if preferred_name in archive.namelist():
-                    candidate_names.append(preferred_name)
-            candidate_names.extend(
-                sorted(
-                    name for name in archive.namelist()
-                    if re.fullmatch(r'word/(?:header|footer)\d+\.xml', name)
-                )
-            )
-
-            for name in candidate_names:
-                paragraph_parts.extend(read_wordprocessing_part(archive.read(name)))
-    except Exception:
-        return ''
-
-    if not paragraph_parts:
-        return ''
-    return _dedupe_and_limit_chunks(paragraph_parts, max_chunks=80, max_total_chars=16000)
-
-
-def _decode_pdf_text_bytes(raw_bytes):
-    if not raw_bytes:
-        return ''
-    candidate = bytes(raw_bytes)
-    if candidate.startswith(b'\xfe\xff') or candidate.startswith(b'\xff\xfe'):
-        for encoding in ('utf-16', 'utf-16-be', 'utf-16-le'):
-            try:
-                return _clean_text(candidate.decode(encoding))
-            except UnicodeDecodeError:
-                continue
-    if candidate.count(b'\x00') > max(1, len(candidate) // 8):
-        for encoding in ('utf-16-be', 'utf-16-le'):
-            try:
-                return _clean_text(candidate.decode(encoding))
-            except UnicodeDecodeError:
-                continue
-    for encoding in ('utf-8', 'latin-1'):
-        try:
-            return _clean_text(candidate.decode(encoding))
-        except UnicodeDecodeError:
-            continue
-    return ''
-
-
-def _decode_pdf_literal_string(raw_bytes):
-    decoded = bytearray()
-    index = 0
-    escape_map = {
-        ord('n'): b'\n',
-        ord('r'): b'\r',
-        ord('t'): b'\t',
-        ord('b'): b'\b',
-        ord('f'): b'\f',
-        ord('('): b'(',
-        ord(')'): b')',
-        ord('\\'): b'\\',
-    }
-
-    while index < len(raw_bytes):
-        byte = raw_bytes[index]
-        if byte != 92:  # backslash
-            decoded.append(byte)
-            index += 1
-            continue
-
-        index += 1
-        if index >= len(raw_bytes):
-            break
-        escaped = raw_bytes[index]
-
-        if escaped in escape_map:
-            decoded.extend(escape_map[escaped])
-            index += 1
-            continue
-
-        if escaped in (10, 13):
-            if escaped == 13 and index + 1 < len(raw_bytes) and raw_bytes[index + 1] == 10:
-                index += 1
-            index += 1
-            continue
-
-        if 48 <= escaped <= 55:
-            octal_digits = bytes([escaped])
-            extra_index = index + 1
-            while extra_index < len(raw_bytes) and len(octal_digits) < 3 and 48 <= raw_bytes[extra_index] <= 55:
-                octal_digits += bytes([raw_bytes[extra_index]])
-                extra_index += 1
-            decoded.append(int(octal_digits, 8))
-            index = extra_index
-            continue
-
-        decoded.append(escaped)
-        index += 1
-
-    return _decode_pdf_text_bytes(bytes(decoded))
-
-
-def _decode_pdf_hex_string(raw_bytes):
-    hex_text = re.sub(rb'[^0-9A-Fa-f]', b'', raw_bytes or b'')
-    if not hex_text:
-        return ''
-    if len(hex_text) % 2 == 1:
-        hex_text += b'0'
-    try:
-        decoded = bytes.fromhex(hex_text.decode('ascii'))
-    except ValueError:
-        return ''
-    return _decode_pdf_text_bytes(decoded)
-
-
-def _extract_pdf_text_chunks_from_stream(stream_bytes):
-    chunks = []
-    stream_candidates = []
-    seen_candidates = set()
-
-    for candidate in (stream_bytes,):
-        if candidate not in seen_candidates:
-            seen_candidates.add(candidate)
-            stream_candidates.append(candidate)
-        for wbits in (zlib.MAX_WBITS, -zlib.MAX_WBITS):
-            try:
-                inflated = zlib.decompress(candidate, wbits)
-            except Exception:
-                continue
-            if inflated not in seen_candidates:
-                seen_candidates.add(inflated)
-                stream_candidates.append(inflated)
-
-    for candidate in stream_candidates:
-        for text_block in re.findall(rb'BT(.*?)ET', candidate, flags=re.DOTALL):
-            for array_match in re.finditer(rb'\[(.*?)\]\s*TJ', text_block, flags=re.DOTALL):
-                array_text = array_match.group(1)
-                for literal in re.finditer(rb'\((.*?)(?<!\\)\)', array_text, flags=re.DOTALL):
-                    decoded = _decode_pdf_literal_string(literal.group(1))
-                    if decoded:
-                        chunks.append(decoded)
-                for hex_match in re.finditer(rb'<([0-9A-Fa-f\s]+)>', array_text):
-                    decoded = _decode_pdf_hex_string(hex_match.group(1))
-                    if decoded:
-                        chunks.append(decoded)
-
-            for literal in re.finditer(rb'\((.*?)(?<!\\)\)\s*(?:Tj|\'|")', text_block, flags=re.DOTALL):
-                decoded = _decode_pdf_literal_string(literal.group(1))
-                if decoded:
-                    chunks.append(decoded)
-            for hex_match in re.finditer(rb'<([0-9A-Fa-f\s]+)>\s*Tj', text_block, flags=re.DOTALL):
-                decoded = _decode_pdf_hex_string(hex_match.group(1))
-                if decoded:
-                    chunks.append(decoded)
-
-    return chunks
+    # One block per paragraph or table row; blank lines keep them apart for _build_blocks.
+    return _dedupe_and_limit_chunks(extract_docx_text_blocks(file_bytes), max_chunks=80, max_total_chars=16000, separator='\n\n')
 
 
 def _extract_text_from_pdf_bytes(file_bytes):
-    chunks = []
-    for stream_bytes in re.findall(rb'stream\s*(.*?)\s*endstream', file_bytes, flags=re.DOTALL):
-        chunks.extend(_extract_pdf_text_chunks_from_stream(stream_bytes))
-
-    if not chunks:
-        for match in re.findall(rb'\((.*?)(?<!\\)\)', file_bytes, flags=re.DOTALL):
-            decoded = _decode_pdf_literal_string(match)
-            if decoded:
-                chunks.append(decoded)
-
-    return _dedupe_and_limit_chunks(chunks, max_chunks=80, max_total_chars=16000)
+    return _dedupe_and_limit_chunks(extract_pdf_text_lines(file_bytes), max_chunks=80, max_total_chars=16000)
 
 
 def _extract_text_from_csv_bytes(file_bytes):
@@ -496,6 +337,37 @@ def _looks_like_excel_date_format(format_code):
     return any(token in cleaned for token in ('yy', 'dd', 'mm', 'm/', '/m', 'h:', 'ss'))
 
 
+def _read_xlsx_shared_strings(archive, needed, namespace):
+    """Stream xl/sharedStrings.xml and return {index: text} for the needed indexes only."""
+    if not needed:
+        return {}
+    item_tag = f'{{{namespace["main"]}}}si'
+    text_tag = f'{{{namespace["main"]}}}t'
+    last_needed = max(needed)
+    shared_strings = {}
+    index = 0
+    try:
+        with archive.open('xl/sharedStrings.xml') as strings_stream:
+            table = None
+            for event, element in ET.iterparse(strings_stream, events=('start', 'end')):
+                if event == 'start':
+                    if table is None:
+                        table = element
+                    continue
+                if element.tag != item_tag:
+                    continue
+                if index in needed:
+                    parts = [''.join(text.itertext()).strip() for text in element.iter(text_tag)]
+                    shared_strings[index] = _clean_text(' '.join(part for part in parts if part))
+                table.clear()
+                index += 1
+                if index > last_needed:
+                    break
+    except Exception:
+        pass
+    return shared_strings
+
+
 def _extract_xlsx_workbook_data(file_bytes, max_rows_per_sheet=180, max_sheets=10, max_columns=40):
     try:
         archive = zipfile.ZipFile(BytesIO(file_bytes))
@@ -505,18 +377,6 @@ def _extract_xlsx_workbook_data(file_bytes, max_rows_per_sheet=180, max_sheets=1
     namespace = {'main': 'http://schemas.openxmlformats.org/spreadsheetml/2006/main'}
     relationship_ns = '{http://schemas.openxmlformats.org/officeDocument/2006/relationships}id'
 
-    shared_strings = []
-    try:
-        shared_root = ET.fromstring(archive.read('xl/sharedStrings.xml'))
-        for string_item in shared_root.findall('main:si', namespace):
-            parts = [
-                ''.join(text.itertext()).strip()
-                for text in string_item.findall('.//main:t', namespace)
-            ]
-            shared_strings.append(_clean_text(' '.join(part for part in parts if part)))
-    except Exception:
-        shared_strings = []
-
     date_1904 = False
     try:
         workbook_root = ET.fromstring(archive.read('xl/workbook.xml'))
@@ -573,7 +433,8 @@ def _extract_xlsx_workbook_data(file_bytes, max_rows_per_sheet=180, max_sheets=1
             if name.startswith('xl/worksheets/') and name.endswith('.xml')
         ]
 
-    def cell_text(cell):
+    def cell_value(cell):
+        # Shared strings come back as their int index and are resolved after every sheet is read.
         cell_type = cell.attrib.get('t')
         style_index = None
         try:
@@ -588,8 +449,8 @@ def _extract_xlsx_workbook_data(file_bytes, max_rows_per_sheet=180, max_sheets=1
             return ''
         if cell_type == 's':
             try:
-                return _clean_text(shared_strings[int(raw_value)])
-            except Exception:
+                return int(raw_value)
+            except ValueError:
                 return ''
         if cell_type == 'b':
             return 'TRUE' if raw_value == '1' else 'FALSE'
@@ -599,38 +460,67 @@ def _extract_xlsx_workbook_data(file_bytes, max_rows_per_sheet=180, max_sheets=1
                 return converted
         return raw_value
 
-    workbook_data = []
+    sheet_data_tag = f'{{{namespace["main"]}}}sheetData'
+    row_tag = f'{{{namespace["main"]}}}row'
+    parsed_sheets = []
+    needed_strings = set()
     for sheet_name, target in sheet_targets[:max_sheets]:
+        parsed_rows = []
         try:
-            sheet_root = ET.fromstring(archive.read(target))
+            with archive.open(target) as sheet_stream:
+                sheet_data = None
+                for event, element in ET.iterparse(sheet_stream, events=('start', 'end')):
+                    if event == 'start':
+                        if element.tag == sheet_data_tag:
+                            sheet_data = element
+                        continue
+                    if element.tag != row_tag:
+                        continue
+                    row_values = {}
+                    for cell in element.findall('main:c', namespace):
+                        column_index = _xlsx_column_index(cell.attrib.get('r'))
+                        if column_index <= 0 or column_index > max_columns:
+                            continue
+                        value = cell_value(cell)
+                        if value != '':
+                            row_values[column_index] = value
+                            if isinstance(value, int):
+                                needed_strings.add(value)
+                    # Drop parsed rows so memory stays flat however long the sheet is.
+                    if sheet_data is not None:
+                        sheet_data.clear()
+                    else:
+                        element.clear()
+                    if row_values:
+                        parsed_rows.append(row_values)
+                    if len(parsed_rows) >= max_rows_per_sheet:
+                        break
         except Exception:
-            continue
-        sheet_rows = sheet_root.findall('.//main:sheetData/main:row', namespace)
-        if not sheet_rows:
-            continue
+            pass
+        if parsed_rows:
+            parsed_sheets.append((sheet_name, parsed_rows))
 
-        parsed_rows = []
+    shared_strings = _read_xlsx_shared_strings(archive, needed_strings, namespace)
+
+    workbook_data = []
+    for sheet_name, parsed_rows in parsed_sheets:
+        resolved_rows = []
         max_seen_column = 0
-        for row in sheet_rows:
-            row_values = {}
-            for cell in row.findall('main:c', namespace):
-                column_index = _xlsx_column_index(cell.attrib.get('r'))
-                if column_index <= 0 or column_index > max_columns:
-                    continue
-                text = cell_text(cell)
+        for row_values in parsed_rows:
+            resolved = {}
+            for column_index, value in row_values.items():
+                text = shared_strings.get(value, '') if isinstance(value, int) else value
                 if text:
-                    row_values[column_index] = text
+                    resolved[column_index] = text
                     max_seen_column = max(max_seen_column, column_index)
-            if row_values:
-                parsed_rows.append(row_values)
-            if len(parsed_rows) >= max_rows_per_sheet:
-                break
+            if resolved:
+                resolved_rows.append(resolved)
 
-        if not parsed_rows or max_seen_column == 0:
+        if not resolved_rows or max_seen_column == 0:
             continue
 
         rows = []
-        for row_values in parsed_rows:
+        for row_values in resolved_rows:
             row = [row_values.get(column_index, '') for column_index in range(1, max_seen_column + 1)]
             while row and not _clean_text(row[-1]):
                 row.pop()
@@ -682,28 +572,52 @@ def _extract_text_from_xlsx_bytes(file_bytes):
     return '\n'.join(lines)
 
 
-def _extract_text_from_uploaded_file(uploaded_file):
-    name = f'{uploaded_file.name or ""}'.lower()
-    file_bytes = uploaded_file.read()
-    uploaded_file.seek(0)
-    if not file_bytes:
-        return ''
-    cache_key = f'{name}:{hashlib.sha1(file_bytes).hexdigest()}'
-    cached_text = _TEXT_EXTRACTION_CACHE.get(cache_key)
-    if cached_text is not None:
-        return cached_text
+def _upload_kind(name):
     if name.endswith('.csv'):
-        return _remember_text_extraction(cache_key, _extract_text_from_csv_bytes(file_bytes))
+        return 'csv'
     if name.endswith(('.xlsx', '.xlsm')):
-        return _remember_text_extraction(cache_key, _extract_text_from_xlsx_bytes(file_bytes))
+        return 'xlsx'
     if name.endswith(('.txt', '.md', '.json', '.yaml', '.yml', '.html', '.xml', '.tsv')):
-        return _remember_text_extraction(cache_key, file_bytes.decode('utf-8', errors='ignore'))
+        return 'text'
     if name.endswith('.docx'):
-        return _remember_text_extraction(cache_key, _extract_text_from_docx_bytes(file_bytes))
+        return 'docx'
     if name.endswith('.pdf'):
-        return _remember_text_extraction(cache_key, _extract_text_from_pdf_bytes(file_bytes))
+        return 'pdf'
+    return 'raw'
+
+
+def _extract_text_from_bytes(kind, file_bytes):
+    if kind == 'csv':
+        return _extract_text_from_csv_bytes(file_bytes)
+    if kind == 'xlsx':
+        return _extract_text_from_xlsx_bytes(file_bytes)
+    if kind == 'text':
+        return file_bytes.decode('utf-8', errors='ignore')
+    if kind == 'docx':
+        return _extract_text_from_docx_bytes(file_bytes)
+    if kind == 'pdf':
+        return _extract_text_from_pdf_bytes(file_bytes)
     decoded = file_bytes.decode('utf-8', errors='ignore').strip()
-    return _remember_text_extraction(cache_key, decoded or file_bytes.decode('latin-1', errors='ignore'))
+    return decoded or file_bytes.decode('latin-1', errors='ignore')
+
+
+def _read_upload_job(uploaded_file):
+    file_bytes = uploaded_file.read()
+    uploaded_file.seek(0)
+    kind = _upload_kind(f'{uploaded_file.name or ""}'.lower())
+    return extraction_cache.cache_key(kind, file_bytes), (kind, file_bytes)
+
+
+def _extract_text_from_uploaded_file(uploaded_file):
+    cache_key, (kind, file_bytes) = _read_upload_job(uploaded_file)
+    if not file_bytes:
+        return ''
+    return extraction_cache.get_or_extract(cache_key, lambda: _extract_text_from_bytes(kind, file_bytes))
+
+
+def _extract_texts_from_uploaded_files(files):
+    """Extract every upload of a request, in parallel worker processes when there are several."""
+    return extraction_pool.extract_all([_read_upload_job(uploaded_file) for uploaded_file in files or []], _extract_text_from_bytes)
 
 
 def _extract_json_object(text):
@@ -756,16 +670,16 @@ def _run_gemini_json_prompt(prompt, model_name=BACKGROUND_GEMINI_MODEL, timeout=
         },
     }
     url = f'https://generativelanguage.googleapis.com/v1beta/models/{model_name}:generateContent?key={api_key}'
-    request = urllib_request.Request(
-        url,
-        data=json.dumps(payload).encode('utf-8'),
-        headers={'Content-Type': 'application/json'},
-        method='POST',
-    )
 
     try:
-        with urllib_request.urlopen(request, timeout=timeout) as response:
-            response_payload = json.loads(response.read().decode('utf-8'))
+        raw_response = ai_http.post(
+            url,
+            json.dumps(payload).encode('utf-8'),
+            headers={'Content-Type': 'application/json'},
+            timeout=timeout,
+            provider='gemini',
+        )
+        response_payload = json.loads(raw_response.decode('utf-8'))
     except urllib_error.HTTPError as exc:
         error_body = exc.read().decode('utf-8', errors='ignore')
         parsed_error = _extract_json_object(error_body) if error_body else None
@@ -1831,9 +1745,8 @@ def extract_textbox_section(page_key, section_title, current_fields, files):
 
     text_parts = []
     file_names = []
-    for uploaded_file in files:
+    for uploaded_file, extracted_text in zip(files, _extract_texts_from_uploaded_files(files)):
         file_names.append(uploaded_file.name or 'document')
-        extracted_text = _extract_text_from_uploaded_file(uploaded_file)
         if extracted_text.strip():
             text_parts.append(extracted_text)
     combined_text = '\n\n'.join(text_parts).strip()
@@ -2791,8 +2704,7 @@ def extract_structured_section(page_key, section_title, current_state, files):
                 file_names.append(uploaded_file.name or 'workbook.xlsx')
                 excel_row_count += workbook_rows
     else:
-        for uploaded_file in files:
-            extracted_text = _extract_text_from_uploaded_file(uploaded_file)
+        for uploaded_file, extracted_text in zip(files, _extract_texts_from_uploaded_files(files)):
             if extracted_text.strip():
                 text_parts.append(extracted_text)
                 file_names.append(uploaded_file.name or 'document')
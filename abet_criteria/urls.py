@@ -24,9 +24,13 @@ from .views import (
     program_syllabus_detail,
     program_cycles_create,
     program_cycles_delete,
+    program_cycle_clone,
     cycle_detail,
     cycle_self_study,
     cycle_self_study_ai_draft,
+    cycle_self_study_ai_draft_job,
+    cycle_self_study_stream,
+    cycle_self_study_export_docx,
     cycle_checklist,
     cycle_background,
     cycle_background_llama_extract,
@@ -88,9 +92,13 @@ urlpatterns = [
     path('programs/<int:program_id>/courses/<int:course_id>/sections/<int:syllabus_id>/syllabus/', program_syllabus_detail),
     path('programs/<int:program_id>/cycles/', program_cycles_create),
     path('programs/<int:program_id>/cycles/<int:cycle_id>/', program_cycles_delete),
+    path('programs/<int:program_id>/cycles/<int:cycle_id>/clone/', program_cycle_clone),
     path('cycles/<int:cycle_id>/', cycle_detail),
     path('cycles/<int:cycle_id>/self-study/', cycle_self_study),
     path('cycles/<int:cycle_id>/self-study/ai-draft/', cycle_self_study_ai_draft),
+    path('cycles/<int:cycle_id>/self-study/ai-draft/<int:job_id>/', cycle_self_study_ai_draft_job),
+    path('cycles/<int:cycle_id>/self-study/stream/', cycle_self_study_stream),
+    path('cycles/<int:cycle_id>/self-study/export.docx', cycle_self_study_export_docx),
     path('cycles/<int:cycle_id>/checklist/', cycle_checklist),
     path('cycles/<int:cycle_id>/background/', cycle_background),
     path('cycles/<int:cycle_id>/background/llama-extract/', cycle_background_llama_extract),
@@ -2,26 +2,35 @@ from rest_framework import viewsets, status
 from rest_framework.decorators import action, api_view
 from rest_framework.parsers import FormParser, MultiPartParser
 from rest_framework.response import Response
+from rest_framework.utils.encoders import JSONEncoder as DRFJSONEncoder
 from django.db import IntegrityError
+from django.db import NotSupportedError
 from django.db import connection
 from django.db import transaction
 from django.db.models import Max
 from django.utils import timezone
 from django.conf import settings
 from django.contrib.auth.hashers import check_password, make_password
-from django.http import HttpResponse
+from django.http import FileResponse, HttpResponse, StreamingHttpResponse
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date, quote_etag
 from datetime import date, datetime
 import json
-import html
+import os
 import re
-import zipfile
-import zlib
 import jwt
 from datetime import timedelta
-from io import BytesIO
+from functools import partial
+from . import extraction_cache, extraction_pool
+from .cycle_graph import clone_cycle, delete_courses, delete_cycles, delete_program, lock_for_clone
+from .docx_text import extract_docx_text_blocks
+from .pdf_text import extract_pdf_text_lines
 from .textbox_ai import extract_ai_section, _run_ollama_command
-from .self_study_ai import augment_self_study_payload_with_ai, build_self_study_ai_options
+from .self_study_ai import build_self_study_ai_options, validate_selected_fields
+from .self_study_docx import DOCX_CONTENT_TYPE, cache_docx_stream, export_path, iter_self_study_docx
+from .self_study_cache import SELF_STUDY_SECTIONS, cached_sections, iter_cached_sections, section_validators, seed_section_versions, touch_cycle_sections, touch_faculty_sections, touch_program_sections
 from .models import (
+    CRITERION_ITEMS,
     Criterion1Students,
     Criterion4,
     Criterion5Curriculum,
@@ -64,6 +73,7 @@ from .models import (
     NonacademicSupportUnit,
     EnrollmentRecord,
     PersonnelRecord,
+    SelfStudyAIDraftJob,
 )
 
 
@@ -93,19 +103,6 @@ from .serializers import (
 # CYCLE-BASED COMPATIBILITY ENDPOINTS (Checklist + Criteria 1/2)
 # ============================================================================
 
-CRITERION_ITEMS = {
-    0: 'Background Information',
-    1: 'Criterion 1 - Students',
-    2: 'Criterion 2 - Program Educational Objectives',
-    3: 'Criterion 3 - Student Outcomes',
-    4: 'Criterion 4 - Continuous Improvement',
-    5: 'Criterion 5 - Curriculum',
-    6: 'Criterion 6 - Faculty',
-    7: 'Criterion 7 - Facilities',
-    8: 'Criterion 8 - Institutional Support',
-    9: 'Appendices',
-}
-
 FRAMEWORK_ITEMS = [
     {'id': 'abet', 'name': 'ABET', 'category': 'Engineering Accreditation', 'icon': 'award', 'status': 'available'},
     {'id': 'ceeaa', 'name': 'CEEAA', 'category': 'Regional Accreditation', 'icon': 'clipboard', 'status': 'coming-soon'},
@@ -238,38 +235,39 @@ def _get_request_user(request):
     return User.objects.filter(user_id=user_id).first()
 
 
-def _ensure_checklist_items(cycle):
-    existing_numbers = set()
-    items = ChecklistItem.objects.filter(checklist=cycle.checklist).order_by('item_id')
-    for item in items:
-        existing_numbers.add(_criterion_number_from_name(item.item_name))
-
-    for criterion_number, default_name in CRITERION_ITEMS.items():
-        if criterion_number in existing_numbers:
-            continue
-
-        ChecklistItem.objects.create(
-            checklist=cycle.checklist,
+def _seed_checklist_items(checklist, existing_numbers=()):
+    ChecklistItem.objects.bulk_create([
+        ChecklistItem(
+            checklist=checklist,
             item_name=default_name,
+            criterion_number=criterion_number,
             status=0,
             completion_percentage=0,
         )
+        for criterion_number, default_name in CRITERION_ITEMS.items()
+        if criterion_number not in existing_numbers
+    ])
 
 
-def _criterion_number_from_name(name):
-    if not name:
-        return 999
+def _ensure_checklist_items(cycle):
+    existing_numbers = set(
+        ChecklistItem.objects.filter(checklist=cycle.checklist).values_list('criterion_number', flat=True)
+    )
+    if len(existing_numbers & set(CRITERION_ITEMS)) < len(CRITERION_ITEMS):
+        _seed_checklist_items(cycle.checklist, existing_numbers)
 
-    lowered = name.lower()
-    if 'background' in lowered:
-        return 0
-    if 'append' in lowered:
-        return 9
 
-    for num in range(1, 9):
-        if f'criterion {num}' in lowered:
-            return num
-    return 999
+def _get_or_create_checklist_item(cycle, criterion_number):
+    item, _ = ChecklistItem.objects.get_or_create(
+        checklist=cycle.checklist,
+        criterion_number=criterion_number,
+        defaults={
+            'item_name': CRITERION_ITEMS[criterion_number],
+            'status': 0,
+            'completion_percentage': 0,
+        },
+    )
+    return item
 
 
 def _default_cycle_dependencies():
@@ -306,21 +304,12 @@ def _cycle_label(cycle):
     return f"ABET {cycle.start_year}-{cycle.end_year}"
 
 
-def _calculate_cycle_progress(cycle):
-    if not cycle or not cycle.checklist:
-        return float(cycle.overall_progress_percentage or 0) if cycle else 0.0
-
-    items = ChecklistItem.objects.filter(checklist=cycle.checklist).order_by('item_id')
+def _progress_from_criterion_rows(criterion_rows):
     target_criteria = {0, 1, 2, 3, 4, 5, 6, 7, 8, 9}
     criterion_progress = {}
-    for item in items:
-        criterion_number = _criterion_number_from_name(item.item_name)
-        if criterion_number not in target_criteria:
-            continue
-        current_value = float(item.completion_percentage or 0)
-        previous_value = criterion_progress.get(criterion_number, -1)
-        if current_value > previous_value:
-            criterion_progress[criterion_number] = current_value
+    for criterion_number, completion_percentage in criterion_rows:
+        if criterion_number in target_criteria:
+            criterion_progress[criterion_number] = float(completion_percentage or 0)
 
     total_percentage = 0.0
     for criterion_number in target_criteria:
@@ -329,6 +318,49 @@ def _calculate_cycle_progress(cycle):
     return round(total_percentage / len(target_criteria))
 
 
+def _refresh_cycle_progress(checklist_id):
+    # Called after every completion_percentage write so reads can use the stored rollup.
+    if not checklist_id:
+        return 0
+    criterion_rows = ChecklistItem.objects.filter(
+        checklist_id=checklist_id,
+        criterion_number__isnull=False,
+    ).values_list('criterion_number', 'completion_percentage')
+    progress_value = _progress_from_criterion_rows(criterion_rows)
+    AccreditationCycle.objects.filter(checklist_id=checklist_id).update(
+        overall_progress_percentage=progress_value,
+    )
+    return progress_value
+
+
+def _build_programs_dashboard():
+    programs = list(Program.objects.order_by('program_name'))
+    cycles_by_program = {}
+    for cycle in AccreditationCycle.objects.order_by('-cycle_id'):
+        cycles_by_program.setdefault(cycle.program_id, []).append(cycle)
+
+    items = []
+    for program in programs:
+        cycle_payload = []
+        for cycle in cycles_by_program.get(program.program_id, []):
+            progress_value = cycle.overall_progress_percentage or 0
+            cycle_payload.append({
+                'id': cycle.cycle_id,
+                'label': _cycle_label(cycle),
+                'status': _cycle_status(progress_value),
+                'progress': float(progress_value),
+            })
+        items.append({
+            'id': program.program_id,
+            'name': program.program_name,
+            'level': program.program_level,
+            'department': 'Engineering',
+            'icon': _program_icon(program),
+            'cycles': cycle_payload,
+        })
+    return items
+
+
 def _program_icon(program):
     lowered = (program.program_name or '').lower()
     if 'mechan' in lowered or 'chem' in lowered:
@@ -344,8 +376,6 @@ def cycle_checklist(request, cycle_id):
     if not cycle:
         return Response({'detail': 'Accreditation cycle not found.'}, status=status.HTTP_404_NOT_FOUND)
 
-    _ensure_checklist_items(cycle)
-
     items = ChecklistItem.objects.filter(checklist=cycle.checklist).order_by('item_id')
     payload = []
     for item in items:
@@ -354,7 +384,7 @@ def cycle_checklist(request, cycle_id):
             'item_name': item.item_name,
             'status': item.status,
             'completion_percentage': float(item.completion_percentage or 0),
-            'criterion_number': _criterion_number_from_name(item.item_name),
+            'criterion_number': item.criterion_number if item.criterion_number is not None else 999,
         })
 
     return Response({
@@ -363,7 +393,7 @@ def cycle_checklist(request, cycle_id):
         'cycle_label': _cycle_label(cycle),
         'start_year': cycle.start_year,
         'end_year': cycle.end_year,
-        'overall_progress_percentage': float(_calculate_cycle_progress(cycle)),
+        'overall_progress_percentage': float(cycle.overall_progress_percentage or 0),
         'items': payload,
     })
 
@@ -376,26 +406,7 @@ def frameworks_list(request):
 @api_view(['GET', 'POST'])
 def programs_list(request):
     if request.method == 'GET':
-        items = []
-        for program in Program.objects.order_by('program_name'):
-            cycles = AccreditationCycle.objects.filter(program=program).order_by('-cycle_id')
-            cycle_payload = []
-            for cycle in cycles:
-                progress_value = _calculate_cycle_progress(cycle)
-                cycle_payload.append({
-                    'id': cycle.cycle_id,
-                    'label': _cycle_label(cycle),
-                    'status': _cycle_status(progress_value),
-                    'progress': float(progress_value),
-                })
-            items.append({
-                'id': program.program_id,
-                'name': program.program_name,
-                'level': program.program_level,
-                'department': 'Engineering',
-                'icon': _program_icon(program),
-                'cycles': cycle_payload,
-            })
+        items = _build_programs_dashboard()
         return Response({'items': items})
 
     name = (request.data.get('name') or '').strip()
@@ -421,15 +432,30 @@ def programs_list(request):
 
 @api_view(['DELETE'])
 def program_detail(request, program_id):
-    try:
-        program = Program.objects.get(pk=program_id)
-    except Program.DoesNotExist:
+    if not Program.objects.filter(pk=program_id).exists():
         return Response({'detail': 'Program not found.'}, status=status.HTTP_404_NOT_FOUND)
 
-    program.delete()
+    with transaction.atomic():
+        delete_program(program_id)
     return Response(status=status.HTTP_204_NO_CONTENT)
 
 
+def _cycle_years_error(program, start_year, end_year):
+    if not (1000 <= start_year <= 9999 and 1000 <= end_year <= 9999):
+        return 'start_year and end_year must be 4-digit years.'
+    if end_year <= start_year:
+        return 'End year must be greater than start year.'
+
+    existing_cycles = AccreditationCycle.objects.filter(program=program)
+    if existing_cycles.filter(start_year=start_year, end_year=end_year).exists():
+        return 'This cycle already exists for the selected program.'
+
+    max_existing_end = existing_cycles.aggregate(max_end=Max('end_year')).get('max_end')
+    if max_existing_end is not None and start_year < int(max_existing_end):
+        return f'Start year must be {int(max_existing_end)} or greater for this program.'
+    return None
+
+
 @api_view(['POST'])
 def program_cycles_create(request, program_id):
     try:
@@ -453,32 +479,57 @@ def program_cycles_create(request, program_id):
         start_year = int(years[0]) if len(years) >= 1 else current_year
         end_year = int(years[1]) if len(years) >= 2 else (start_year + 2)
 
-    if not (1000 <= start_year <= 9999 and 1000 <= end_year <= 9999):
-        return Response({'detail': 'start_year and end_year must be 4-digit years.'}, status=status.HTTP_400_BAD_REQUEST)
-    if end_year <= start_year:
-        return Response({'detail': 'End year must be greater than start year.'}, status=status.HTTP_400_BAD_REQUEST)
+    years_error = _cycle_years_error(program, start_year, end_year)
+    if years_error:
+        return Response({'detail': years_error}, status=status.HTTP_400_BAD_REQUEST)
 
-    existing_cycles = AccreditationCycle.objects.filter(program=program)
-    if existing_cycles.filter(start_year=start_year, end_year=end_year).exists():
-        return Response({'detail': 'This cycle already exists for the selected program.'}, status=status.HTTP_400_BAD_REQUEST)
-
-    max_existing_end = existing_cycles.aggregate(max_end=Max('end_year')).get('max_end')
-    if max_existing_end is not None and start_year < int(max_existing_end):
-        return Response(
-            {'detail': f'Start year must be {int(max_existing_end)} or greater for this program.'},
-            status=status.HTTP_400_BAD_REQUEST,
+    with transaction.atomic():
+        checklist, criterion2, criterion3 = _default_cycle_dependencies()
+        cycle = AccreditationCycle.objects.create(
+            start_year=start_year,
+            end_year=end_year,
+            overall_progress_percentage=0,
+            program=program,
+            checklist=checklist,
+            criterion2=criterion2,
+            criterion3=criterion3,
         )
+        _seed_checklist_items(checklist)
+        seed_section_versions([cycle.cycle_id])
+    return Response({
+        'id': cycle.cycle_id,
+        'label': _cycle_label(cycle),
+        'status': _cycle_status(cycle.overall_progress_percentage),
+        'progress': float(cycle.overall_progress_percentage or 0),
+    }, status=status.HTTP_201_CREATED)
 
-    checklist, criterion2, criterion3 = _default_cycle_dependencies()
-    cycle = AccreditationCycle.objects.create(
-        start_year=start_year,
-        end_year=end_year,
-        overall_progress_percentage=0,
-        program=program,
-        checklist=checklist,
-        criterion2=criterion2,
-        criterion3=criterion3,
-    )
+
+@api_view(['POST'])
+def program_cycle_clone(request, program_id, cycle_id):
+    source = AccreditationCycle.objects.filter(pk=cycle_id, program_id=program_id).select_related('program').first()
+    if not source:
+        return Response({'detail': 'Cycle not found for this program.'}, status=status.HTTP_404_NOT_FOUND)
+
+    cycle_length = max(int(source.end_year) - int(source.start_year), 1)
+    try:
+        start_year = int(request.data.get('start_year') or source.end_year)
+        end_year = int(request.data.get('end_year') or (start_year + cycle_length))
+    except (TypeError, ValueError):
+        return Response({'detail': 'start_year and end_year must be valid years.'}, status=status.HTTP_400_BAD_REQUEST)
+
+    with transaction.atomic():
+        try:
+            lock_for_clone()
+        except NotSupportedError as exc:
+            return Response({'detail': str(exc)}, status=status.HTTP_501_NOT_IMPLEMENTED)
+        # Checked under the lock so two clones cannot both take the same years.
+        years_error = _cycle_years_error(source.program, start_year, end_year)
+        if years_error:
+            return Response({'detail': years_error}, status=status.HTTP_400_BAD_REQUEST)
+        new_cycle_id = clone_cycle(source.cycle_id, start_year, end_year)
+        seed_section_versions([new_cycle_id])
+
+    cycle = AccreditationCycle.objects.get(pk=new_cycle_id)
     return Response({
         'id': cycle.cycle_id,
         'label': _cycle_label(cycle),
@@ -489,23 +540,11 @@ def program_cycles_create(request, program_id):
 
 @api_view(['DELETE'])
 def program_cycles_delete(request, program_id, cycle_id):
-    try:
-        cycle = AccreditationCycle.objects.get(pk=cycle_id, program_id=program_id)
-    except AccreditationCycle.DoesNotExist:
+    if not AccreditationCycle.objects.filter(pk=cycle_id, program_id=program_id).exists():
         return Response({'detail': 'Cycle not found for this program.'}, status=status.HTTP_404_NOT_FOUND)
 
-    checklist = cycle.checklist
-    criterion2 = cycle.criterion2
-    criterion3 = cycle.criterion3
-
-    cycle.delete()
-
-    if checklist and not AccreditationCycle.objects.filter(checklist=checklist).exists():
-        checklist.delete()
-    if criterion2 and not AccreditationCycle.objects.filter(criterion2=criterion2).exists():
-        criterion2.delete()
-    if criterion3 and not AccreditationCycle.objects.filter(criterion3=criterion3).exists():
-        criterion3.delete()
+    with transaction.atomic():
+        delete_cycles([cycle_id])
 
     return Response(status=status.HTTP_204_NO_CONTENT)
 
@@ -527,38 +566,60 @@ def cycle_detail(request, cycle_id):
     })
 
 
-def _serialize_faculty_profile_payload(faculty_id, cycle_id=None):
-    qualification = Qualification.objects.filter(faculty_id=faculty_id).order_by('-qualification_id').first()
-    profile_payload = {
-        'qualification': {
-            'degree_field': qualification.degree_field if qualification else '',
-            'degree_institution': qualification.degree_institution if qualification else '',
-            'degree_year': qualification.degree_year if qualification else '',
-            'years_industry_government': qualification.years_industry_government if qualification else '',
-            'years_at_institution': qualification.years_at_institution if qualification else '',
-        },
-        'certifications': list(Certification.objects.filter(faculty_id=faculty_id).order_by('certification_id').values_list('certification_title', flat=True)),
-        'memberships': list(ProfessionalMembership.objects.filter(faculty_id=faculty_id).order_by('membership_id').values_list('membership_description', flat=True)),
-        'industry_experience': list(IndustryExperience.objects.filter(faculty_id=faculty_id).order_by('experience_id').values_list('experience_discription', flat=True)),
-        'honors': list(HonorAward.objects.filter(faculty_id=faculty_id).order_by('award_id').values_list('award_discription', flat=True)),
-        'services': list(ServiceActivity.objects.filter(faculty_id=faculty_id).order_by('service_id').values_list('service_description', flat=True)),
-        'publications': list(Publication.objects.filter(faculty_id=faculty_id).order_by('publication_id').values_list('publication_discription', flat=True)),
-    }
+FACULTY_PROFILE_LISTS = [
+    ('certifications', Certification, 'certification_id', 'certification_title'),
+    ('memberships', ProfessionalMembership, 'membership_id', 'membership_description'),
+    ('industry_experience', IndustryExperience, 'experience_id', 'experience_discription'),
+    ('honors', HonorAward, 'award_id', 'award_discription'),
+    ('services', ServiceActivity, 'service_id', 'service_description'),
+    ('publications', Publication, 'publication_id', 'publication_discription'),
+]
+
+
+def _serialize_faculty_profile_payloads(faculty_ids, cycle_id=None):
+    """Build vitae payloads for many faculty members, one query per profile table."""
+    faculty_ids = [int(faculty_id) for faculty_id in faculty_ids]
+    payloads = {}
+    if not faculty_ids:
+        return payloads
+
+    latest_qualifications = {}
+    for qualification in Qualification.objects.filter(faculty_id__in=faculty_ids).order_by('faculty_id', '-qualification_id'):
+        latest_qualifications.setdefault(qualification.faculty_id, qualification)
+
+    lists_by_key = {}
+    for key, model, order_field, value_field in FACULTY_PROFILE_LISTS:
+        grouped = lists_by_key[key] = {}
+        rows = model.objects.filter(faculty_id__in=faculty_ids).order_by(order_field).values_list('faculty_id', value_field)
+        for faculty_id, value in rows:
+            grouped.setdefault(faculty_id, []).append(value)
+
+    development = ProfessionalDevelopment.objects.filter(faculty_id__in=faculty_ids)
     if cycle_id:
         criterion6 = Criterion6Faculty.objects.filter(cycle_id=cycle_id).order_by('-criterion6_id').first()
-        if criterion6:
-            profile_payload['development_activities'] = list(
-                ProfessionalDevelopment.objects.filter(faculty_id=faculty_id, criterion6_id=criterion6.criterion6_id)
-                .order_by('development_id')
-                .values_list('activity_description', flat=True)
-            )
-        else:
-            profile_payload['development_activities'] = []
-    else:
-        profile_payload['development_activities'] = list(
-            ProfessionalDevelopment.objects.filter(faculty_id=faculty_id).order_by('development_id').values_list('activity_description', flat=True)
-        )
-    return profile_payload
+        development = development.filter(criterion6_id=criterion6.criterion6_id) if criterion6 else development.none()
+    development_by_faculty = {}
+    for faculty_id, activity in development.order_by('development_id').values_list('faculty_id', 'activity_description'):
+        development_by_faculty.setdefault(faculty_id, []).append(activity)
+
+    for faculty_id in faculty_ids:
+        qualification = latest_qualifications.get(faculty_id)
+        payloads[faculty_id] = {
+            'qualification': {
+                'degree_field': qualification.degree_field if qualification else '',
+                'degree_institution': qualification.degree_institution if qualification else '',
+                'degree_year': qualification.degree_year if qualification else '',
+                'years_industry_government': qualification.years_industry_government if qualification else '',
+                'years_at_institution': qualification.years_at_institution if qualification else '',
+            },
+            **{key: lists_by_key[key].get(faculty_id, []) for key, _, _, _ in FACULTY_PROFILE_LISTS},
+            'development_activities': development_by_faculty.get(faculty_id, []),
+        }
+    return payloads
+
+
+def _serialize_faculty_profile_payload(faculty_id, cycle_id=None):
+    return _serialize_faculty_profile_payloads([faculty_id], cycle_id)[int(faculty_id)]
 
 
 def _build_criterion3_course_links(program_id, cycle_id):
@@ -576,28 +637,29 @@ def _build_criterion3_course_links(program_id, cycle_id):
         so_lookup[int(serialized['so_id'])] = serialized
         so_payload.append(serialized)
 
-    _ensure_syllabus_clo_so_map_table()
-    with connection.cursor() as cursor:
-        cursor.execute(
-            '''
-            SELECT
-              m.so_id,
-              c.Course_ID,
-              COALESCE(c.Course_Code, ''),
-              m.clo_id,
-              COALESCE(clo.description, ''),
-              COALESCE(clo.level, '')
-            FROM SYLLABUS_CLO_SO_MAP m
-            INNER JOIN STUDENT_OUTCOME so ON so.so_id = m.so_id
-            INNER JOIN INSTRUCTOR_SYLLABUS s ON s.syllabus_id = m.syllabus_id
-            INNER JOIN COURSE c ON c.Course_ID = s.Course_ID
-            LEFT JOIN CLO clo ON clo.clo_id = m.clo_id
-            WHERE so.program_id = %s AND c.Cycle_ID = %s
-            ORDER BY m.so_id, c.Course_Code, m.clo_id
-            ''',
-            [program_id, cycle_id]
-        )
-        rows = cursor.fetchall()
+    rows = []
+    if _runtime_table_exists('SYLLABUS_CLO_SO_MAP'):
+        with connection.cursor() as cursor:
+            cursor.execute(
+                '''
+                SELECT
+                  m.so_id,
+                  c.Course_ID,
+                  COALESCE(c.Course_Code, ''),
+                  m.clo_id,
+                  COALESCE(clo.description, ''),
+                  COALESCE(clo.level, '')
+                FROM SYLLABUS_CLO_SO_MAP m
+                INNER JOIN STUDENT_OUTCOME so ON so.so_id = m.so_id
+                INNER JOIN INSTRUCTOR_SYLLABUS s ON s.syllabus_id = m.syllabus_id
+                INNER JOIN COURSE c ON c.Course_ID = s.Course_ID
+                LEFT JOIN CLO clo ON clo.clo_id = m.clo_id
+                WHERE so.program_id = %s AND c.Cycle_ID = %s
+                ORDER BY m.so_id, c.Course_Code, m.clo_id
+                ''',
+                [program_id, cycle_id]
+            )
+            rows = cursor.fetchall()
 
     for row in rows:
         so_id = int(row[0])
@@ -724,19 +786,18 @@ def _build_appendix_a_payload(cycle):
         )
         rows = cursor.fetchall()
 
+    sections_by_course = _cycle_sections_by_course(cycle.cycle_id)
+    preview_ids = [sections[0]['syllabus_id'] for sections in sections_by_course.values()]
+    previews = _load_syllabus_payloads(cycle.program_id, cycle.cycle_id, preview_ids)
+
     course_payloads = []
     for row in rows:
-        course_payload = _serialize_course_row(row)
-        course_id = int(course_payload.get('course_id') or 0)
-        sections = _course_sections_rows(course_id)
-        first_section = sections[0] if sections else None
-        syllabus = None
-        if first_section and first_section.get('syllabus_id'):
-            syllabus = _load_syllabus_payload(cycle.program_id, cycle.cycle_id, course_id, int(first_section['syllabus_id']))
+        sections = sections_by_course.get(int(row[0]), [])
+        course_payload = _serialize_course_row(row, sections=[dict(section) for section in sections])
         course_payloads.append({
             **course_payload,
             'all_sections': sections,
-            'syllabus_preview': syllabus,
+            'syllabus_preview': previews.get(sections[0]['syllabus_id']) if sections else None,
         })
 
     return {
@@ -753,12 +814,13 @@ def _build_appendix_b_payload(cycle):
         )
         faculty_ids = [int(row[0]) for row in cursor.fetchall()]
 
-    faculty_list = FacultyMember.objects.filter(faculty_id__in=faculty_ids).order_by('full_name')
+    faculty_list = list(FacultyMember.objects.filter(faculty_id__in=faculty_ids).order_by('full_name'))
+    profiles = _serialize_faculty_profile_payloads([faculty.faculty_id for faculty in faculty_list], cycle.cycle_id)
     return {
         'faculty': [
             {
                 **FacultyMemberSerializer(faculty).data,
-                'profile': _serialize_faculty_profile_payload(faculty.faculty_id, cycle.cycle_id),
+                'profile': profiles[faculty.faculty_id],
             }
             for faculty in faculty_list
         ],
@@ -783,64 +845,221 @@ def _build_self_study_toc():
     ]
 
 
-def _build_self_study_payload(cycle):
+def _build_background_payload(cycle):
     background, _ = _ensure_background(cycle)
+    return _serialize_background_payload(background)
+
+
+def _build_criterion1_payload(cycle):
     criterion1, _ = _get_or_create_criterion1(cycle)
+    return Criterion1StudentsSerializer(criterion1).data
+
+
+def _build_criterion2_payload(cycle):
+    return Criterion2PeosSerializer(cycle.criterion2).data
+
+
+def _build_criterion4_payload(cycle):
     criterion4, criterion4_item = _get_or_create_criterion4(cycle)
+    return _serialize_criterion4_payload(cycle, criterion4, criterion4_item, cycle.program_id)
+
+
+def _build_criterion5_payload(cycle):
     criterion5, _ = _get_or_create_criterion5(cycle)
+    return {
+        **Criterion5CurriculumSerializer(criterion5).data,
+        'checklist_item_id': getattr(
+            ChecklistItem.objects.filter(checklist=cycle.checklist, criterion_number=5).first(),
+            'item_id',
+            None,
+        ),
+    }
+
+
+def _build_criterion6_payload(cycle):
     criterion6, criterion6_item = _get_or_create_criterion6(cycle)
+    return _serialize_criterion6_payload(cycle, criterion6, criterion6_item)
+
+
+def _build_appendix_c_payload(cycle):
     appendixc = _get_or_create_appendixc(cycle)
-    appendixd = _get_or_create_appendixd(cycle)
+    return {
+        'appendix': AppendixCEquipmentSerializer(appendixc).data,
+        'equipment_rows': EquipmentItemSerializer(
+            EquipmentItem.objects.filter(appendix_c=appendixc).order_by('equipment_id'),
+            many=True,
+        ).data,
+    }
+
+
+def _build_appendix_d_payload(cycle):
+    return _serialize_appendixd_payload(_get_or_create_appendixd(cycle))
 
+
+def _build_evidence_files_payload(cycle):
     evidence_queryset = EvidenceFile.objects.select_related('user', 'cycle', 'program').filter(
         cycle_id=cycle.cycle_id
     ).order_by('-uploaded_at', '-evidence_id')
+    return EvidenceFileSerializer(evidence_queryset, many=True).data
+
+
+SELF_STUDY_SECTION_BUILDERS = {
+    'background': _build_background_payload,
+    'criterion1': _build_criterion1_payload,
+    'criterion2': _build_criterion2_payload,
+    'criterion3': _build_criterion3_payload,
+    'criterion4': _build_criterion4_payload,
+    'criterion5': _build_criterion5_payload,
+    'criterion6': _build_criterion6_payload,
+    'criterion7': _build_criterion7_payload,
+    'criterion8': _build_criterion8_payload,
+    'appendixA': _build_appendix_a_payload,
+    'appendixB': _build_appendix_b_payload,
+    'appendixC': _build_appendix_c_payload,
+    'appendixD': _build_appendix_d_payload,
+    'evidence_files': _build_evidence_files_payload,
+}
+
+
+# Builders that only run SELECTs (no get-or-create, no DDL); safe to run on the section pool.
+SELF_STUDY_READ_ONLY_SECTIONS = frozenset({
+    'criterion2',
+    'criterion3',
+    'criterion7',
+    'criterion8',
+    'appendixA',
+    'appendixB',
+    'evidence_files',
+})
+
+SELF_STUDY_INCLUDES = ('evidence', 'ai_options')
+
+
+def _split_query_list(raw_value):
+    return [part.strip() for part in str(raw_value or '').split(',') if part.strip()]
+
+
+def _parse_self_study_selection(query_params):
+    """
+    Return (sections, includes, error) for ?sections= and ?include=.
+
+    Without ?sections every section is built. Evidence files and AI options
+    are included by default only for the full payload.
+    """
+    raw_sections = query_params.get('sections')
+    raw_includes = query_params.get('include')
+
+    sections = None
+    if raw_sections is not None:
+        sections = tuple(_split_query_list(raw_sections))
+        unknown = [section for section in sections if section not in SELF_STUDY_SECTION_BUILDERS or section == 'evidence_files']
+        if unknown:
+            return None, None, f'Unknown self-study section(s): {", ".join(unknown)}.'
+
+    if raw_includes is None:
+        includes = SELF_STUDY_INCLUDES if raw_sections is None else ()
+    else:
+        includes = tuple(_split_query_list(raw_includes))
+        unknown = [include for include in includes if include not in SELF_STUDY_INCLUDES]
+        if unknown:
+            return None, None, f'Unknown self-study include(s): {", ".join(unknown)}.'
+    return sections, includes, None
+
+
+def _cycle_validators(cycle, sections, *extra):
+    digest, updated_at = section_validators(cycle.cycle_id, sections, *extra)
+    return quote_etag(digest), int(updated_at.timestamp())
+
+
+def _not_modified_response(request, validators):
+    """Return a 304 when the client's copy is current, before any payload is built."""
+    etag, last_modified = validators
+    response = get_conditional_response(request, etag=etag, last_modified=last_modified)
+    if response is None:
+        return None
+    return _with_validators(response, validators)
+
+
+def _with_validators(response, validators):
+    etag, last_modified = validators
+    response['ETag'] = etag
+    response['Last-Modified'] = http_date(last_modified)
+    # Revalidate on every use instead of trusting heuristic freshness.
+    patch_cache_control(response, private=True, no_cache=True)
+    return response
+
+
+def _self_study_builders(cycle, sections=None, includes=SELF_STUDY_INCLUDES):
+    if sections is None:
+        sections = [section for section in SELF_STUDY_SECTION_BUILDERS if section != 'evidence_files']
+    requested = list(sections)
+    if 'evidence' in includes:
+        requested.append('evidence_files')
+    return {section: partial(SELF_STUDY_SECTION_BUILDERS[section], cycle) for section in requested}
+
+
+def _build_self_study_metadata(cycle):
+    return {
+        'cycle_id': cycle.cycle_id,
+        'program_id': cycle.program_id,
+        'program_name': cycle.program.program_name if cycle.program_id else '',
+        'cycle_label': _cycle_label(cycle),
+        'start_year': cycle.start_year,
+        'end_year': cycle.end_year,
+        'generated_at': timezone.now().isoformat(),
+    }
+
+
+def _build_self_study_payload(cycle, sections=None, includes=SELF_STUDY_INCLUDES):
+    built = cached_sections(
+        cycle.cycle_id,
+        _self_study_builders(cycle, sections, includes),
+        SELF_STUDY_READ_ONLY_SECTIONS,
+    )
+    evidence_files = built.pop('evidence_files', None)
 
     payload = {
-        'metadata': {
-            'cycle_id': cycle.cycle_id,
-            'program_id': cycle.program_id,
-            'program_name': cycle.program.program_name if cycle.program_id else '',
-            'cycle_label': _cycle_label(cycle),
-            'start_year': cycle.start_year,
-            'end_year': cycle.end_year,
-            'generated_at': timezone.now().isoformat(),
-        },
+        'metadata': _build_self_study_metadata(cycle),
         'toc': _build_self_study_toc(),
-        'sections': {
-            'background': _serialize_background_payload(background),
-            'criterion1': Criterion1StudentsSerializer(criterion1).data,
-            'criterion2': Criterion2PeosSerializer(cycle.criterion2).data,
-            'criterion3': _build_criterion3_payload(cycle),
-            'criterion4': _serialize_criterion4_payload(cycle, criterion4, criterion4_item, cycle.program_id),
-            'criterion5': {
-                **Criterion5CurriculumSerializer(criterion5).data,
-                'checklist_item_id': getattr(
-                    ChecklistItem.objects.filter(checklist=cycle.checklist, item_name__icontains='Criterion 5').order_by('-item_id').first(),
-                    'item_id',
-                    None,
-                ),
-            },
-            'criterion6': _serialize_criterion6_payload(cycle, criterion6, criterion6_item),
-            'criterion7': _build_criterion7_payload(cycle),
-            'criterion8': _build_criterion8_payload(cycle),
-            'appendixA': _build_appendix_a_payload(cycle),
-            'appendixB': _build_appendix_b_payload(cycle),
-            'appendixC': {
-                'appendix': AppendixCEquipmentSerializer(appendixc).data,
-                'equipment_rows': EquipmentItemSerializer(
-                    EquipmentItem.objects.filter(appendix_c=appendixc).order_by('equipment_id'),
-                    many=True,
-                ).data,
-            },
-            'appendixD': _serialize_appendixd_payload(appendixd),
-        },
-        'evidence_files': EvidenceFileSerializer(evidence_queryset, many=True).data,
+        'sections': built,
     }
-    payload['ai_options'] = build_self_study_ai_options(payload)
+    if 'evidence' in includes:
+        payload['evidence_files'] = evidence_files
+    if 'ai_options' in includes:
+        payload['ai_options'] = build_self_study_ai_options(payload)
     return payload
 
 
+def _ndjson_line(record):
+    return json.dumps(record, cls=DRFJSONEncoder, ensure_ascii=False) + '\n'
+
+
+def _iter_self_study_ndjson(cycle, sections=None, includes=SELF_STUDY_INCLUDES):
+    """
+    Yield the self-study payload as NDJSON records: metadata and toc first,
+    then one record per section as its builder finishes.
+    """
+    yield _ndjson_line({'type': 'metadata', 'data': _build_self_study_metadata(cycle)})
+    yield _ndjson_line({'type': 'toc', 'data': _build_self_study_toc()})
+
+    ai_options = []
+    for section, data in iter_cached_sections(
+        cycle.cycle_id,
+        _self_study_builders(cycle, sections, includes),
+        SELF_STUDY_READ_ONLY_SECTIONS,
+    ):
+        if section == 'evidence_files':
+            yield _ndjson_line({'type': 'evidence_files', 'data': data})
+            continue
+        if 'ai_options' in includes:
+            ai_options.extend(build_self_study_ai_options({'sections': {section: data}}))
+        yield _ndjson_line({'type': 'section', 'id': section, 'data': data})
+
+    if 'ai_options' in includes:
+        yield _ndjson_line({'type': 'ai_options', 'data': ai_options})
+    yield _ndjson_line({'type': 'end'})
+
+
 def _get_or_create_criterion7_for_cycle(cycle):
     criterion7 = Criterion7Facilities.objects.filter(cycle=cycle).order_by('-criterion7_id').first()
     if criterion7:
@@ -849,18 +1068,7 @@ def _get_or_create_criterion7_for_cycle(cycle):
 
 
 def _ensure_criterion8_item_for_cycle(cycle):
-    criterion8_item = ChecklistItem.objects.filter(
-        checklist=cycle.checklist,
-        item_name__icontains='criterion 8'
-    ).order_by('-item_id').first()
-    if criterion8_item:
-        return criterion8_item
-    return ChecklistItem.objects.create(
-        item_name='Criterion 8 - Institutional Support',
-        status=0,
-        completion_percentage=0,
-        checklist=cycle.checklist,
-    )
+    return _get_or_create_checklist_item(cycle, 8)
 
 
 def _get_or_create_criterion8_for_cycle(cycle):
@@ -1058,6 +1266,7 @@ def _persist_self_study_ai_fields(cycle, payload, applied_fields):
     for instance, update_fields in dirty_models.items():
         if update_fields:
             instance.save(update_fields=sorted(update_fields))
+    touch_cycle_sections([cycle.cycle_id], {field['sectionId'] for field in applied_fields})
 
 
 @api_view(['GET'])
@@ -1066,7 +1275,95 @@ def cycle_self_study(request, cycle_id):
     if not cycle:
         return Response({'detail': 'Accreditation cycle not found.'}, status=status.HTTP_404_NOT_FOUND)
 
-    return Response(_build_self_study_payload(cycle))
+    sections, includes, error = _parse_self_study_selection(request.query_params)
+    if error:
+        return Response({'detail': error}, status=status.HTTP_400_BAD_REQUEST)
+
+    validated_sections = list(sections or [section for section in SELF_STUDY_SECTION_BUILDERS if section != 'evidence_files'])
+    if 'evidence' in includes:
+        validated_sections.append('evidence_files')
+    validators = _cycle_validators(
+        cycle,
+        validated_sections,
+        ','.join(includes),
+        cycle.program.program_name if cycle.program_id else '',
+        _cycle_label(cycle),
+    )
+    not_modified = _not_modified_response(request, validators)
+    if not_modified is not None:
+        return not_modified
+
+    return _with_validators(Response(_build_self_study_payload(cycle, sections, includes)), validators)
+
+
+@api_view(['GET'])
+def cycle_self_study_stream(request, cycle_id):
+    cycle = _ensure_cycle(cycle_id)
+    if not cycle:
+        return Response({'detail': 'Accreditation cycle not found.'}, status=status.HTTP_404_NOT_FOUND)
+
+    sections, includes, error = _parse_self_study_selection(request.query_params)
+    if error:
+        return Response({'detail': error}, status=status.HTTP_400_BAD_REQUEST)
+
+    response = StreamingHttpResponse(
+        _iter_self_study_ndjson(cycle, sections, includes),
+        content_type='application/x-ndjson',
+    )
+    response['Cache-Control'] = 'no-cache'
+    response['X-Accel-Buffering'] = 'no'
+    return response
+
+
+@api_view(['GET'])
+def cycle_self_study_export_docx(request, cycle_id):
+    cycle = _ensure_cycle(cycle_id)
+    if not cycle:
+        return Response({'detail': 'Accreditation cycle not found.'}, status=status.HTTP_404_NOT_FOUND)
+
+    metadata = _build_self_study_metadata(cycle)
+    report_sections = [section for section in SELF_STUDY_SECTION_BUILDERS if section != 'evidence_files']
+    fingerprint, _ = section_validators(
+        cycle.cycle_id,
+        report_sections,
+        metadata['program_name'],
+        metadata['cycle_label'],
+    )
+    path = export_path(cycle.cycle_id, fingerprint)
+    filename = f'self-study-cycle-{cycle.cycle_id}.docx'
+
+    if os.path.exists(path):
+        return FileResponse(open(path, 'rb'), as_attachment=True, filename=filename, content_type=DOCX_CONTENT_TYPE)
+
+    sections = iter_cached_sections(
+        cycle.cycle_id,
+        _self_study_builders(cycle, report_sections, ()),
+        SELF_STUDY_READ_ONLY_SECTIONS,
+    )
+    response = StreamingHttpResponse(
+        cache_docx_stream(path, iter_self_study_docx(metadata, _build_self_study_toc(), sections)),
+        content_type=DOCX_CONTENT_TYPE,
+    )
+    response['Content-Disposition'] = f'attachment; filename="{filename}"'
+    return response
+
+
+def _serialize_ai_draft_job(job):
+    return {
+        'job_id': job.id,
+        'cycle_id': job.cycle_id,
+        'status': job.status,
+        'progress': {
+            'completed_fields': job.completed_fields,
+            'total_fields': job.total_fields,
+        },
+        'save_to_backend': job.save_to_backend,
+        'created_at': job.created_at.isoformat() if job.created_at else None,
+        'started_at': job.started_at.isoformat() if job.started_at else None,
+        'finished_at': job.finished_at.isoformat() if job.finished_at else None,
+        'detail': job.error,
+        'result': job.result,
+    }
 
 
 @api_view(['POST'])
@@ -1075,45 +1372,36 @@ def cycle_self_study_ai_draft(request, cycle_id):
     if not cycle:
         return Response({'detail': 'Accreditation cycle not found.'}, status=status.HTTP_404_NOT_FOUND)
 
-    base_payload = _build_self_study_payload(cycle)
     selected_fields = request.data.get('selectedFields', [])
-    save_to_backend = bool(request.data.get('saveToBackend'))
-    augmented_payload, applied_fields, invalid_fields, error = augment_self_study_payload_with_ai(
-        base_payload,
-        selected_fields,
-    )
+    if not isinstance(selected_fields, list):
+        return Response({'detail': 'selectedFields must be a list.'}, status=status.HTTP_400_BAD_REQUEST)
+    invalid_fields, error = validate_selected_fields(_build_self_study_payload(cycle), selected_fields)
     if error:
-        return Response({'detail': error, 'invalidFields': invalid_fields}, status=status.HTTP_400_BAD_REQUEST)
+        return Response(
+            {'detail': error, 'invalidFields': invalid_fields, 'failedFields': []},
+            status=status.HTTP_400_BAD_REQUEST,
+        )
 
-    response_payload = augmented_payload
-    if save_to_backend:
-        _persist_self_study_ai_fields(cycle, augmented_payload, applied_fields)
-        response_payload = _build_self_study_payload(cycle)
+    # Drafting runs in the run_ai_draft_worker process; clients poll the job.
+    job = SelfStudyAIDraftJob.objects.create(
+        cycle=cycle,
+        selected_fields=selected_fields,
+        save_to_backend=bool(request.data.get('saveToBackend')),
+        total_fields=len(selected_fields),
+    )
+    return Response(_serialize_ai_draft_job(job), status=status.HTTP_202_ACCEPTED)
 
-    return Response({
-        'payload': response_payload,
-        'appliedFields': applied_fields,
-        'invalidFields': invalid_fields,
-        'savedToBackend': save_to_backend,
-        'message': (
-            f'AI drafted {len(applied_fields)} field{"s" if len(applied_fields) != 1 else ""}'
-            f'{" and saved them to the cycle records" if save_to_backend else ""}.'
-        ),
-    })
+
+@api_view(['GET'])
+def cycle_self_study_ai_draft_job(request, cycle_id, job_id):
+    job = SelfStudyAIDraftJob.objects.filter(pk=job_id, cycle_id=cycle_id).first()
+    if not job:
+        return Response({'detail': 'AI draft job not found.'}, status=status.HTTP_404_NOT_FOUND)
+    return Response(_serialize_ai_draft_job(job))
 
 
 def _get_or_create_criterion1(cycle):
-    item = ChecklistItem.objects.filter(
-        checklist=cycle.checklist,
-        item_name__icontains='Criterion 1'
-    ).order_by('-item_id').first()
-    if not item:
-        item = ChecklistItem.objects.create(
-            checklist=cycle.checklist,
-            item_name=CRITERION_ITEMS[1],
-            status=0,
-            completion_percentage=0,
-        )
+    item = _get_or_create_checklist_item(cycle, 1)
 
     obj = Criterion1Students.objects.filter(cycle=cycle).order_by('-criterion1_id').first()
     if obj:
@@ -1232,17 +1520,7 @@ def _background_completion_percentage(background):
 def _ensure_background(cycle):
     _ensure_checklist_items(cycle)
 
-    item = ChecklistItem.objects.filter(
-        checklist=cycle.checklist,
-        item_name__icontains='background'
-    ).order_by('-item_id').first()
-    if not item:
-        item = ChecklistItem.objects.create(
-            checklist=cycle.checklist,
-            item_name=CRITERION_ITEMS[0],
-            status=0,
-            completion_percentage=0,
-        )
+    item = _get_or_create_checklist_item(cycle, 0)
 
     obj = BackgroundInfo.objects.filter(cycle=cycle).order_by('-background_id').first()
     if obj:
@@ -1284,6 +1562,7 @@ def _save_background_completion(background, item):
     item.status = 1 if completion_percentage >= 100 else 0
     item.completion_percentage = completion_percentage
     item.save(update_fields=['status', 'completion_percentage'])
+    _refresh_cycle_progress(item.checklist_id)
 
 
 def _clean_ai_text(value):
@@ -1298,61 +1577,14 @@ def _truncate_for_llm(text, limit=16000):
 
 
 def _extract_text_from_docx_bytes(file_bytes):
-    parts = []
-    try:
-        with zipfile.ZipFile(BytesIO(file_bytes)) as archive:
-            for name in archive.namelist():
-                if not name.startswith('word/') or not name.endswith('.xml'):
-                    continue
-                xml_text = archive.read(name).decode('utf-8', errors='ignore')
-                text = html.unescape(re.sub(r'<[^>]+>', ' ', xml_text))
-                text = re.sub(r'\s+', ' ', text).strip()
-                if text:
-                    parts.append(text)
-    except Exception:
-        return ''
-    return '\n'.join(parts)
+    return '\n'.join(extract_docx_text_blocks(file_bytes))
 
 
 def _extract_text_from_pdf_bytes(file_bytes):
-    # Lightweight PDF fallback: this is intentionally simple and conservative.
-    # It works best for text-based PDFs and gracefully returns partial text when
-    # the file uses standard embedded strings.
-    chunks = []
-    for match in re.findall(rb'\((.*?)(?<!\\)\)', file_bytes, flags=re.DOTALL):
-        text = match
-        for src, dst in (
-            (rb'\\n', b' '),
-            (rb'\\r', b' '),
-            (rb'\\t', b' '),
-            (rb'\\(', b'('),
-            (rb'\\)', b')'),
-            (rb'\\\\', b'\\'),
-        ):
-            text = text.replace(src, dst)
-        decoded = text.decode('latin-1', errors='ignore').strip()
-        if decoded:
-            chunks.append(decoded)
-
-    for stream_bytes in re.findall(rb'stream\s*(.*?)\s*endstream', file_bytes, flags=re.DOTALL):
-        for candidate in (stream_bytes,):
-            try:
-                inflated = zlib.decompress(candidate)
-            except Exception:
-                continue
-            text = re.sub(rb'[^A-Za-z0-9@\.\-\+\(\)/,:;#\s]', b' ', inflated)
-            decoded = text.decode('latin-1', errors='ignore')
-            decoded = re.sub(r'\s+', ' ', decoded).strip()
-            if decoded:
-                chunks.append(decoded)
-
-    return '\n'.join(chunks[:80])
+    return '\n'.join(extract_pdf_text_lines(file_bytes)[:80])
 
 
-def _extract_text_from_uploaded_file(uploaded_file):
-    name = f'{uploaded_file.name or ""}'.lower()
-    file_bytes = uploaded_file.read()
-    uploaded_file.seek(0)
+def _extract_text_from_file_bytes(name, file_bytes):
     if not file_bytes:
         return ''
 
@@ -1632,11 +1864,19 @@ def _run_ollama_background_contact_extraction(text, heuristic_result):
     return result, None
 
 
+def _read_background_upload_job(uploaded_file):
+    name = f'{uploaded_file.name or ""}'.lower()
+    file_bytes = uploaded_file.read()
+    uploaded_file.seek(0)
+    kind = os.path.splitext(name)[1].lstrip('.')
+    return f'background:{extraction_cache.cache_key(kind, file_bytes)}', (name, file_bytes)
+
+
 def _extract_background_section_a_from_files(files):
     text_parts = []
     file_summaries = []
-    for uploaded_file in files:
-        extracted_text = _extract_text_from_uploaded_file(uploaded_file)
+    jobs = [_read_background_upload_job(uploaded_file) for uploaded_file in files]
+    for uploaded_file, extracted_text in zip(files, extraction_pool.extract_all(jobs, _extract_text_from_file_bytes)):
         if extracted_text.strip():
             text_parts.append(f'File: {uploaded_file.name}\n{extracted_text}')
             file_summaries.append(uploaded_file.name or 'document')
@@ -1716,6 +1956,7 @@ def cycle_background(request, cycle_id):
     background.save()
 
     _save_background_completion(background, item)
+    touch_cycle_sections([cycle.cycle_id], ['background'])
 
     return Response(_serialize_background_payload(background))
 
@@ -1831,6 +2072,7 @@ def cycle_background_llama_extract(request, cycle_id):
         'email_address',
     ])
     _save_background_completion(background, item)
+    touch_cycle_sections([cycle.cycle_id], ['background'])
 
     return Response({
         'sectionTitle': section_title,
@@ -1856,6 +2098,7 @@ def cycle_criterion1(request, cycle_id):
     serializer = Criterion1StudentsSerializer(criterion1, data=request.data, partial=True)
     serializer.is_valid(raise_exception=True)
     serializer.save(cycle=cycle, item=item)
+    touch_cycle_sections([cycle.cycle_id], ['criterion1'])
     return Response(serializer.data)
 
 
@@ -1873,21 +2116,15 @@ def cycle_criterion2(request, cycle_id):
     serializer = Criterion2PeosSerializer(criterion2, data=request.data, partial=True)
     serializer.is_valid(raise_exception=True)
     serializer.save()
+    touch_cycle_sections(
+        AccreditationCycle.objects.filter(criterion2=criterion2).values_list('cycle_id', flat=True),
+        ['criterion2'],
+    )
     return Response(serializer.data)
 
 
 def _get_or_create_criterion4(cycle):
-    item = ChecklistItem.objects.filter(
-        checklist=cycle.checklist,
-        item_name__icontains='Criterion 4'
-    ).order_by('-item_id').first()
-    if not item:
-        item = ChecklistItem.objects.create(
-            checklist=cycle.checklist,
-            item_name=CRITERION_ITEMS[4],
-            status=0,
-            completion_percentage=0,
-        )
+    item = _get_or_create_checklist_item(cycle, 4)
 
     criterion4 = Criterion4.objects.filter(cycle=cycle).order_by('-criterion4_id').first()
     if not criterion4:
@@ -2044,10 +2281,19 @@ def cycle_criterion4(request, cycle_id):
     if program_error:
         return program_error
 
+    # Version counters only follow the cycle's own program.
+    validators = None
+    if request.method == 'GET' and program_id == cycle.program_id:
+        validators = _cycle_validators(cycle, ['criterion4'])
+        not_modified = _not_modified_response(request, validators)
+        if not_modified is not None:
+            return not_modified
+
     criterion4, item = _get_or_create_criterion4(cycle)
 
     if request.method == 'GET':
-        return Response(_serialize_criterion4_payload(cycle, criterion4, item, program_id))
+        response = Response(_serialize_criterion4_payload(cycle, criterion4, item, program_id))
+        return _with_validators(response, validators) if validators else response
 
     payload = {
         'programNarrative': request.data.get('programNarrative', ''),
@@ -2096,22 +2342,13 @@ def cycle_criterion4(request, cycle_id):
     criterion4.cycle = cycle
     criterion4.item = item
     criterion4.save()
+    touch_cycle_sections([cycle.cycle_id], ['criterion4'])
 
     return Response(_serialize_criterion4_payload(cycle, criterion4, item, program_id))
 
 
 def _get_or_create_criterion5(cycle):
-    item = ChecklistItem.objects.filter(
-        checklist=cycle.checklist,
-        item_name__icontains='Criterion 5'
-    ).order_by('-item_id').first()
-    if not item:
-        item = ChecklistItem.objects.create(
-            checklist=cycle.checklist,
-            item_name=CRITERION_ITEMS[5],
-            status=0,
-            completion_percentage=0,
-        )
+    item = _get_or_create_checklist_item(cycle, 5)
 
     criterion5 = cycle.criterion5
     if not criterion5:
@@ -2167,6 +2404,10 @@ def cycle_criterion5(request, cycle_id):
     if item.criterion5_id != saved.criterion5_id:
         item.criterion5 = saved
         item.save(update_fields=['criterion5'])
+    touch_cycle_sections(
+        AccreditationCycle.objects.filter(criterion5=saved).values_list('cycle_id', flat=True),
+        ['criterion5'],
+    )
 
     payload = serializer.data
     payload['checklist_item_id'] = item.item_id
@@ -2278,17 +2519,7 @@ def _resolve_or_create_criterion6_faculty(cycle, row, row_label):
 
 
 def _get_or_create_criterion6(cycle):
-    item = ChecklistItem.objects.filter(
-        checklist=cycle.checklist,
-        item_name__icontains='Criterion 6'
-    ).order_by('-item_id').first()
-    if not item:
-        item = ChecklistItem.objects.create(
-            checklist=cycle.checklist,
-            item_name=CRITERION_ITEMS[6],
-            status=0,
-            completion_percentage=0,
-        )
+    item = _get_or_create_checklist_item(cycle, 6)
 
     criterion6 = Criterion6Faculty.objects.filter(cycle=cycle).order_by('-criterion6_id').first()
     if not criterion6:
@@ -2428,10 +2659,16 @@ def cycle_criterion6(request, cycle_id):
     if not cycle:
         return Response({'detail': 'Accreditation cycle not found.'}, status=status.HTTP_404_NOT_FOUND)
 
+    if request.method == 'GET':
+        validators = _cycle_validators(cycle, ['criterion6'])
+        not_modified = _not_modified_response(request, validators)
+        if not_modified is not None:
+            return not_modified
+
     criterion6, item = _get_or_create_criterion6(cycle)
 
     if request.method == 'GET':
-        return Response(_serialize_criterion6_payload(cycle, criterion6, item))
+        return _with_validators(Response(_serialize_criterion6_payload(cycle, criterion6, item)), validators)
 
     qualification_rows = request.data.get('qualification_rows', [])
     workload_rows = request.data.get('workload_rows', [])
@@ -2661,6 +2898,7 @@ def cycle_criterion6(request, cycle_id):
             next_pd_id += 1
         if pd_objects:
             ProfessionalDevelopment.objects.bulk_create(pd_objects)
+        touch_cycle_sections([cycle.cycle_id], ['criterion6', 'appendixB'])
 
     return Response(_serialize_criterion6_payload(cycle, saved_criterion6, item))
 
@@ -2681,18 +2919,7 @@ def _get_or_create_appendixc(cycle):
 
 def _ensure_appendices_item(cycle):
     _ensure_checklist_items(cycle)
-    item = ChecklistItem.objects.filter(
-        checklist=cycle.checklist,
-        item_name__icontains='append'
-    ).order_by('-item_id').first()
-    if item:
-        return item
-    return ChecklistItem.objects.create(
-        checklist=cycle.checklist,
-        item_name=CRITERION_ITEMS[9],
-        status=0,
-        completion_percentage=0,
-    )
+    return _get_or_create_checklist_item(cycle, 9)
 
 
 def _validate_appendixc_service_date(raw_value):
@@ -2925,6 +3152,8 @@ def cycle_appendixc(request, cycle_id):
         appendices_item.status = 1 if completion_percentage >= 100 else 0
         appendices_item.completion_percentage = completion_percentage
         appendices_item.save(update_fields=['status', 'completion_percentage'])
+        _refresh_cycle_progress(appendices_item.checklist_id)
+        touch_cycle_sections([cycle.cycle_id], ['appendixC'])
 
     return Response({
         'appendix': AppendixCEquipmentSerializer(appendix).data,
@@ -3022,10 +3251,16 @@ def cycle_appendixd(request, cycle_id):
     if not cycle:
         return Response({'detail': 'Accreditation cycle not found.'}, status=status.HTTP_404_NOT_FOUND)
 
+    if request.method == 'GET':
+        validators = _cycle_validators(cycle, ['appendixD'])
+        not_modified = _not_modified_response(request, validators)
+        if not_modified is not None:
+            return not_modified
+
     appendix_d = _get_or_create_appendixd(cycle)
 
     if request.method == 'GET':
-        return Response(_serialize_appendixd_payload(appendix_d))
+        return _with_validators(Response(_serialize_appendixd_payload(appendix_d)), validators)
 
     academic_units = request.data.get('academicSupportUnits', [])
     nonacademic_units = request.data.get('nonacademicSupportUnits', [])
@@ -3295,6 +3530,8 @@ def cycle_appendixd(request, cycle_id):
         appendices_item.status = 1 if completion_percentage >= 100 else 0
         appendices_item.completion_percentage = completion_percentage
         appendices_item.save(update_fields=['status', 'completion_percentage'])
+        _refresh_cycle_progress(appendices_item.checklist_id)
+        touch_cycle_sections([cycle.cycle_id], ['appendixD'])
 
     appendix_d.refresh_from_db()
     return Response(_serialize_appendixd_payload(appendix_d))
@@ -3304,7 +3541,40 @@ def cycle_appendixd(request, cycle_id):
 # CRITERION 7 VIEWSETS
 # ============================================================================
 
-class Criterion7FacilitiesViewSet(viewsets.ModelViewSet):
+class SelfStudySectionWritesMixin:
+    """Bump the self-study sections that a viewset's writes can change."""
+
+    self_study_sections = ()
+
+    def _self_study_cycle_ids(self, instance):
+        return [instance.cycle_id]
+
+    def perform_create(self, serializer):
+        super().perform_create(serializer)
+        touch_cycle_sections(self._self_study_cycle_ids(serializer.instance), self.self_study_sections)
+
+    def perform_update(self, serializer):
+        previous_cycle_ids = self._self_study_cycle_ids(serializer.instance)
+        super().perform_update(serializer)
+        touch_cycle_sections(
+            [*previous_cycle_ids, *self._self_study_cycle_ids(serializer.instance)],
+            self.self_study_sections,
+        )
+
+    def perform_destroy(self, instance):
+        cycle_ids = self._self_study_cycle_ids(instance)
+        super().perform_destroy(instance)
+        touch_cycle_sections(cycle_ids, self.self_study_sections)
+
+
+class Criterion7RowWritesMixin(SelfStudySectionWritesMixin):
+    self_study_sections = ('criterion7',)
+
+    def _self_study_cycle_ids(self, instance):
+        return [instance.criterion7.cycle_id]
+
+
+class Criterion7FacilitiesViewSet(SelfStudySectionWritesMixin, viewsets.ModelViewSet):
     """
     API endpoint for Criterion 7 (Facilities)
     
@@ -3317,6 +3587,7 @@ class Criterion7FacilitiesViewSet(viewsets.ModelViewSet):
     """
     queryset = Criterion7Facilities.objects.all()
     serializer_class = Criterion7FacilitiesSerializer
+    self_study_sections = ('criterion7',)
     
     @action(detail=True, methods=['get'])
     def classrooms(self, request, pk=None):
@@ -3335,7 +3606,7 @@ class Criterion7FacilitiesViewSet(viewsets.ModelViewSet):
         return Response(serializer.data)
 
 
-class ClassroomsViewSet(viewsets.ModelViewSet):
+class ClassroomsViewSet(Criterion7RowWritesMixin, viewsets.ModelViewSet):
     """
     API endpoint for Classrooms
     """
@@ -3343,7 +3614,7 @@ class ClassroomsViewSet(viewsets.ModelViewSet):
     serializer_class = ClassroomsSerializer
 
 
-class LaboratoriesViewSet(viewsets.ModelViewSet):
+class LaboratoriesViewSet(Criterion7RowWritesMixin, viewsets.ModelViewSet):
     """
     API endpoint for Laboratories
     """
@@ -3351,7 +3622,7 @@ class LaboratoriesViewSet(viewsets.ModelViewSet):
     serializer_class = LaboratoriesSerializer
 
 
-class ComputingResourcesViewSet(viewsets.ModelViewSet):
+class ComputingResourcesViewSet(Criterion7RowWritesMixin, viewsets.ModelViewSet):
     """
     API endpoint for Computing Resources
     """
@@ -3359,7 +3630,7 @@ class ComputingResourcesViewSet(viewsets.ModelViewSet):
     serializer_class = ComputingResourcesSerializer
 
 
-class UpgradingFacilitiesViewSet(viewsets.ModelViewSet):
+class UpgradingFacilitiesViewSet(Criterion7RowWritesMixin, viewsets.ModelViewSet):
     """
     API endpoint for Upgrading Facilities
     """
@@ -3371,7 +3642,7 @@ class UpgradingFacilitiesViewSet(viewsets.ModelViewSet):
 # CRITERION 8 VIEWSETS
 # ============================================================================
 
-class Criterion8InstitutionalSupportViewSet(viewsets.ModelViewSet):
+class Criterion8InstitutionalSupportViewSet(SelfStudySectionWritesMixin, viewsets.ModelViewSet):
     """
     API endpoint for Criterion 8 (Institutional Support)
     
@@ -3384,6 +3655,7 @@ class Criterion8InstitutionalSupportViewSet(viewsets.ModelViewSet):
     """
     queryset = Criterion8InstitutionalSupport.objects.all()
     serializer_class = Criterion8InstitutionalSupportSerializer
+    self_study_sections = ('criterion8',)
 
     def _ensure_cycle(self):
         latest_cycle = AccreditationCycle.objects.order_by('-cycle_id').first()
@@ -3419,7 +3691,7 @@ class Criterion8InstitutionalSupportViewSet(viewsets.ModelViewSet):
         if not criterion3:
             criterion3 = Criterion3SoPeo.objects.create()
 
-        return AccreditationCycle.objects.create(
+        cycle = AccreditationCycle.objects.create(
             start_year=2025,
             end_year=2027,
             overall_progress_percentage=0,
@@ -3428,21 +3700,11 @@ class Criterion8InstitutionalSupportViewSet(viewsets.ModelViewSet):
             criterion2=criterion2,
             criterion3=criterion3,
         )
+        seed_section_versions([cycle.cycle_id])
+        return cycle
 
     def _ensure_criterion8_item(self, cycle):
-        criterion8_item = ChecklistItem.objects.filter(
-            checklist=cycle.checklist,
-            item_name__icontains='criterion 8'
-        ).order_by('-item_id').first()
-        if criterion8_item:
-            return criterion8_item
-
-        return ChecklistItem.objects.create(
-            item_name='Criterion 8 - Institutional Support',
-            status=0,
-            completion_percentage=0,
-            checklist=cycle.checklist,
-        )
+        return _get_or_create_checklist_item(cycle, 8)
 
     def _inject_missing_cycle_item(self, request):
         data = request.data.copy()
@@ -3492,23 +3754,28 @@ class Criterion8InstitutionalSupportViewSet(viewsets.ModelViewSet):
         return Response(serializer.data)
 
 
-class StaffingRowViewSet(viewsets.ModelViewSet):
+class StaffingRowViewSet(SelfStudySectionWritesMixin, viewsets.ModelViewSet):
     """
     API endpoint for Staffing Rows
     """
     queryset = StaffingRow.objects.all()
     serializer_class = StaffingRowSerializer
+    self_study_sections = ('criterion8',)
+
+    def _self_study_cycle_ids(self, instance):
+        return [instance.criterion8.cycle_id]
 
 
 # ============================================================================
 # SUPPORTING VIEWSETS
 # ============================================================================
 
-class EvidenceFileViewSet(viewsets.ModelViewSet):
+class EvidenceFileViewSet(SelfStudySectionWritesMixin, viewsets.ModelViewSet):
     """
     API endpoint for Evidence Files
     """
     serializer_class = EvidenceFileSerializer
+    self_study_sections = ('evidence_files',)
     parser_classes = [MultiPartParser, FormParser]
 
     def get_queryset(self):
@@ -3577,6 +3844,7 @@ class EvidenceFileViewSet(viewsets.ModelViewSet):
             last_modified=last_modified,
             file_blob=content,
         )
+        touch_cycle_sections([cycle.cycle_id], self.self_study_sections)
         serializer = self.get_serializer(evidence)
         return Response(serializer.data, status=status.HTTP_201_CREATED)
 
@@ -3589,12 +3857,13 @@ class EvidenceFileViewSet(viewsets.ModelViewSet):
         return response
 
 
-class AccreditationCycleViewSet(viewsets.ModelViewSet):
+class AccreditationCycleViewSet(SelfStudySectionWritesMixin, viewsets.ModelViewSet):
     """
     API endpoint for Accreditation Cycles
     """
     queryset = AccreditationCycle.objects.all()
     serializer_class = AccreditationCycleSerializer
+    self_study_sections = SELF_STUDY_SECTIONS
 
 
 class ChecklistItemViewSet(viewsets.ModelViewSet):
@@ -3604,6 +3873,22 @@ class ChecklistItemViewSet(viewsets.ModelViewSet):
     queryset = ChecklistItem.objects.all()
     serializer_class = ChecklistItemSerializer
 
+    def perform_create(self, serializer):
+        item = serializer.save()
+        _refresh_cycle_progress(item.checklist_id)
+
+    def perform_update(self, serializer):
+        previous_checklist_id = serializer.instance.checklist_id
+        item = serializer.save()
+        _refresh_cycle_progress(item.checklist_id)
+        if previous_checklist_id != item.checklist_id:
+            _refresh_cycle_progress(previous_checklist_id)
+
+    def perform_destroy(self, instance):
+        checklist_id = instance.checklist_id
+        instance.delete()
+        _refresh_cycle_progress(checklist_id)
+
 
 class FacultyMemberViewSet(viewsets.ModelViewSet):
     """
@@ -3612,6 +3897,14 @@ class FacultyMemberViewSet(viewsets.ModelViewSet):
     queryset = FacultyMember.objects.all()
     serializer_class = FacultyMemberSerializer
 
+    def perform_update(self, serializer):
+        super().perform_update(serializer)
+        touch_faculty_sections(serializer.instance.faculty_id)
+
+    def perform_destroy(self, instance):
+        touch_faculty_sections(instance.faculty_id)
+        super().perform_destroy(instance)
+
 
 def _ensure_criterion6_for_cycle(cycle_id):
     criterion6 = Criterion6Faculty.objects.filter(cycle_id=cycle_id).order_by('-criterion6_id').first()
@@ -3698,6 +3991,12 @@ def _renumber_program_peos(program_id):
             row.save(update_fields=['peo_code'])
 
 
+def _runtime_table_exists(table_name):
+    # Readers only check for the table, so self-study builders run no DDL;
+    # writers create it with the _ensure_*_table helpers.
+    return table_name in connection.introspection.table_names()
+
+
 def _ensure_supports_peo_table():
     with connection.cursor() as cursor:
         cursor.execute(
@@ -3714,7 +4013,8 @@ def _ensure_supports_peo_table():
 
 
 def _program_so_peo_mappings(program_id):
-    _ensure_supports_peo_table()
+    if not _runtime_table_exists('SUPPORTS_PEO'):
+        return []
     with connection.cursor() as cursor:
         cursor.execute(
             '''
@@ -3837,16 +4137,37 @@ def _course_sections_rows(course_id):
             [course_id]
         )
         rows = cursor.fetchall()
-    return [
-        {
-            'id': int(row[0]),
-            'syllabus_id': int(row[0]),
-            'term': row[1] or '',
-            'faculty_id': int(row[2]) if row[2] is not None and int(row[2]) > 0 else None,
-            'faculty_name': (row[3] or '') if row[2] is not None and int(row[2]) > 0 else '',
-        }
-        for row in rows
-    ]
+    return [_serialize_section_row(row) for row in rows]
+
+
+def _cycle_sections_by_course(cycle_id):
+    with connection.cursor() as cursor:
+        cursor.execute(
+            '''
+            SELECT s.Course_ID, s.syllabus_id, s.term, s.Faculty_ID, COALESCE(f.Full_Name, '')
+            FROM INSTRUCTOR_SYLLABUS s
+            JOIN COURSE c ON c.Course_ID = s.Course_ID
+            LEFT JOIN FACULTY_MEMBER f ON f.Faculty_ID = s.Faculty_ID
+            WHERE c.Cycle_ID = %s
+            ORDER BY s.term, s.syllabus_id
+            ''',
+            [cycle_id]
+        )
+        rows = cursor.fetchall()
+    sections_by_course = {}
+    for row in rows:
+        sections_by_course.setdefault(int(row[0]), []).append(_serialize_section_row(row[1:]))
+    return sections_by_course
+
+
+def _serialize_section_row(row):
+    return {
+        'id': int(row[0]),
+        'syllabus_id': int(row[0]),
+        'term': row[1] or '',
+        'faculty_id': int(row[2]) if row[2] is not None and int(row[2]) > 0 else None,
+        'faculty_name': (row[3] or '') if row[2] is not None and int(row[2]) > 0 else '',
+    }
 
 
 COURSE_TITLE_MAP = {
@@ -3861,7 +4182,7 @@ def _course_display_name(course_code):
     return COURSE_TITLE_MAP.get(normalized, normalized or course_code or '')
 
 
-def _serialize_course_row(row):
+def _serialize_course_row(row, sections=None):
     course_id = int(row[0])
     course_code = row[1] or ''
     return {
@@ -3872,7 +4193,7 @@ def _serialize_course_row(row):
         'credits': int(row[2] or 0),
         'contact_hours': int(row[3] or 0),
         'course_type': row[4] or 'Required',
-        'sections': _course_sections_rows(course_id),
+        'sections': _course_sections_rows(course_id) if sections is None else sections,
     }
 
 
@@ -3976,6 +4297,7 @@ def program_student_outcomes(request, program_id):
         so_discription=description,
         program_id=program_id,
     )
+    touch_program_sections([program_id], 'student_outcomes')
     return Response(_serialize_so(so_row), status=status.HTTP_201_CREATED)
 
 
@@ -3988,6 +4310,7 @@ def program_student_outcome_detail(request, program_id, so_id):
 
     if request.method == 'DELETE':
         so_row.delete()
+        touch_program_sections([program_id], 'student_outcomes')
         return Response({'detail': 'Student outcome deleted successfully.'}, status=status.HTTP_200_OK)
 
     description = f'{request.data.get("so_discription", "")}'.strip()
@@ -3996,6 +4319,7 @@ def program_student_outcome_detail(request, program_id, so_id):
 
     so_row.so_discription = description
     so_row.save(update_fields=['so_discription'])
+    touch_program_sections([program_id], 'student_outcomes')
     return Response(_serialize_so(so_row))
 
 
@@ -4056,6 +4380,7 @@ def program_so_peo_mappings(request, program_id):
             for so_id, peo_id in deduped_pairs:
                 cursor.execute('INSERT INTO SUPPORTS_PEO (so_id, peo_id) VALUES (%s, %s)', [so_id, peo_id])
 
+    touch_program_sections([program_id], 'peos')
     return Response({
         'detail': 'SO-PEO mappings saved successfully.',
         'student_outcomes': [_serialize_so(row) for row in so_rows],
@@ -4075,6 +4400,12 @@ def program_so_course_links(request, program_id):
     if cycle_error:
         return cycle_error
 
+    # The links are the criterion 3 so_course_links of this cycle.
+    validators = _cycle_validators(cycle, ['criterion3'], 'so-course-links')
+    not_modified = _not_modified_response(request, validators)
+    if not_modified is not None:
+        return not_modified
+
     so_payload = []
     so_lookup = {}
     for so_row in _program_so_rows(program_id):
@@ -4171,7 +4502,7 @@ def program_so_course_links(request, program_id):
         del so_entry['_course_map']
         del so_entry['_clo_map']
 
-    return Response({'student_outcomes': so_payload})
+    return _with_validators(Response({'student_outcomes': so_payload}), validators)
 
 
 @api_view(['GET', 'POST'])
@@ -4202,6 +4533,7 @@ def program_peos(request, program_id):
     )
     _renumber_program_peos(program_id)
     peo_row.refresh_from_db()
+    touch_program_sections([program_id], 'peos')
     return Response(_serialize_peo(peo_row), status=status.HTTP_201_CREATED)
 
 
@@ -4215,6 +4547,7 @@ def program_peo_detail(request, program_id, peo_id):
     if request.method == 'DELETE':
         peo_row.delete()
         _renumber_program_peos(program_id)
+        touch_program_sections([program_id], 'peos')
         return Response({'detail': 'PEO deleted successfully.'}, status=status.HTTP_200_OK)
 
     description = f'{request.data.get("peo_description", "")}'.strip()
@@ -4223,6 +4556,7 @@ def program_peo_detail(request, program_id, peo_id):
 
     peo_row.peo_description = description
     peo_row.save(update_fields=['peo_description'])
+    touch_program_sections([program_id], 'peos')
     return Response(_serialize_peo(peo_row))
 
 
@@ -4255,6 +4589,7 @@ def program_clos(request, program_id):
             _renumber_program_clos(program_id)
 
     refreshed_row = next((item for item in _program_clo_rows(program_id) if int(item.get('clo_id') or 0) == next_clo_id), None)
+    touch_program_sections([program_id], 'clos')
     return Response(
         _serialize_clo(refreshed_row or {'clo_id': next_clo_id, 'description': description, 'level': stored_code}),
         status=status.HTTP_201_CREATED
@@ -4280,6 +4615,7 @@ def program_clo_detail(request, program_id, clo_id):
                 cursor.execute('DELETE FROM MAPS_TO WHERE clo_id = %s', [clo_id])
                 cursor.execute('DELETE FROM CLO WHERE clo_id = %s', [clo_id])
                 _renumber_program_clos(program_id)
+        touch_program_sections([program_id], 'clos')
         return Response({'detail': 'CLO deleted successfully.'}, status=status.HTTP_200_OK)
 
     description = f'{request.data.get("description", "")}'.strip()
@@ -4290,6 +4626,7 @@ def program_clo_detail(request, program_id, clo_id):
         with connection.cursor() as cursor:
             cursor.execute('UPDATE CLO SET description = %s WHERE clo_id = %s', [description, clo_id])
 
+    touch_program_sections([program_id], 'clos')
     return Response(_serialize_clo({'clo_id': clo_id, 'description': description, 'level': row.get('level')}))
 
 
@@ -4356,6 +4693,7 @@ def program_courses(request, program_id):
                 [course_id, course_code, credits, contact_hours, course_type, cycle.cycle_id, unified_id, None, None]
             )
 
+    touch_program_sections([program_id], 'courses')
     return Response(
         {
             'id': course_id,
@@ -4397,23 +4735,8 @@ def program_course_detail(request, program_id, course_id):
 
     if request.method == 'DELETE':
         with transaction.atomic():
-            with connection.cursor() as cursor:
-                cursor.execute('SELECT syllabus_id FROM INSTRUCTOR_SYLLABUS WHERE Course_ID = %s', [course_id])
-                syllabus_ids = [int(row[0]) for row in cursor.fetchall()]
-
-            for syllabus_row_id in syllabus_ids:
-                _delete_syllabus_children(syllabus_row_id)
-
-            with connection.cursor() as cursor:
-                cursor.execute('DELETE FROM TEACHES WHERE Course_ID = %s', [course_id])
-                cursor.execute('DELETE FROM COURSE WHERE Course_ID = %s', [course_id])
-                unified_id = int(course_row[5])
-                cursor.execute('SELECT COUNT(*) FROM COURSE WHERE unified_syllabus_id = %s', [unified_id])
-                course_count = int(cursor.fetchone()[0] or 0)
-                cursor.execute('SELECT COUNT(*) FROM INSTRUCTOR_SYLLABUS WHERE unified_syllabus_id = %s', [unified_id])
-                section_count = int(cursor.fetchone()[0] or 0)
-                if course_count == 0 and section_count == 0:
-                    cursor.execute('DELETE FROM UNIFIED_SYLLABUS WHERE unified_syllabus_id = %s', [unified_id])
+            delete_courses([course_id])
+        touch_program_sections([program_id], 'courses')
         return Response({'detail': 'Course deleted successfully.'}, status=status.HTTP_200_OK)
 
     next_code = f'{request.data.get("course_code", course_row[1])}'.strip().upper()
@@ -4450,6 +4773,7 @@ def program_course_detail(request, program_id, course_id):
                 [next_code, next_credits, next_contact_hours, next_type, course_id]
             )
 
+    touch_program_sections([program_id], 'courses')
     return Response(
         {
             'id': int(course_id),
@@ -4550,6 +4874,7 @@ def program_course_sections(request, program_id, course_id):
                 cursor.execute('SELECT COALESCE(Full_Name, \'\') FROM FACULTY_MEMBER WHERE Faculty_ID = %s', [faculty_id])
                 faculty_name = (cursor.fetchone() or [''])[0]
 
+    touch_program_sections([program_id], 'courses')
     return Response(
         {
             'id': syllabus_row_id,
@@ -4590,6 +4915,7 @@ def program_course_section_detail(request, program_id, course_id, syllabus_id):
     if request.method == 'DELETE':
         with transaction.atomic():
             _delete_syllabus_children(syllabus_id)
+        touch_program_sections([program_id], 'courses')
         return Response({'detail': 'Section deleted successfully.'}, status=status.HTTP_200_OK)
 
     term = f'{request.data.get("term", section_row[1])}'.strip()
@@ -4636,6 +4962,7 @@ def program_course_section_detail(request, program_id, course_id, syllabus_id):
                 cursor.execute('SELECT COALESCE(Full_Name, \'\') FROM FACULTY_MEMBER WHERE Faculty_ID = %s', [faculty_id])
                 faculty_name = (cursor.fetchone() or [''])[0]
 
+    touch_program_sections([program_id], 'courses')
     return Response(
         {
             'id': int(syllabus_id),
@@ -4647,10 +4974,36 @@ def program_course_section_detail(request, program_id, course_id, syllabus_id):
     )
 
 
-def _load_syllabus_payload(program_id, cycle_id, course_id, syllabus_id):
+def _values_by_id(cursor, table, id_column, columns, ids):
+    ids = sorted({int(value) for value in ids})
+    cursor.execute(
+        f'SELECT {id_column}, {columns} FROM {table} WHERE {id_column} IN ({", ".join(["%s"] * len(ids))})',
+        ids
+    )
+    return {int(row[0]): row[1:] for row in cursor.fetchall()}
+
+
+def _rows_by_syllabus(cursor, sql, syllabus_ids):
+    placeholders = ', '.join(['%s'] * len(syllabus_ids))
+    cursor.execute(sql.format(syllabus_ids=placeholders), syllabus_ids)
+    grouped = {}
+    for row in cursor.fetchall():
+        grouped.setdefault(int(row[0]), []).append(row[1:])
+    return grouped
+
+
+def _load_syllabus_payloads(program_id, cycle_id, syllabus_ids, course_id=None):
+    """Load syllabus payloads for many sections of a cycle, one query per table."""
+    syllabus_ids = [int(syllabus_id) for syllabus_id in syllabus_ids]
+    if not syllabus_ids:
+        return {}
+    placeholders = ', '.join(['%s'] * len(syllabus_ids))
+    course_filter = ' AND s.Course_ID = %s' if course_id is not None else ''
+    course_params = [course_id] if course_id is not None else []
+
     with connection.cursor() as cursor:
         cursor.execute(
-            '''
+            f'''
             SELECT
               s.syllabus_id,
               s.term,
@@ -4667,92 +5020,85 @@ def _load_syllabus_payload(program_id, cycle_id, course_id, syllabus_id):
             FROM INSTRUCTOR_SYLLABUS s
             JOIN COURSE c ON c.Course_ID = s.Course_ID
             LEFT JOIN FACULTY_MEMBER f ON f.Faculty_ID = s.Faculty_ID
-            WHERE s.syllabus_id = %s AND s.Course_ID = %s AND c.Cycle_ID = %s
+            WHERE s.syllabus_id IN ({placeholders}){course_filter} AND c.Cycle_ID = %s
             ''',
-            [syllabus_id, course_id, cycle_id]
+            [*syllabus_ids, *course_params, cycle_id]
         )
-        row = cursor.fetchone()
-        if not row:
-            return None
-
-        desc_id = int(row[4])
-        outline_id = int(row[5])
-        addl_id = int(row[6])
-
-        cursor.execute('SELECT catalog_description FROM COURSE_DISCRIPTION WHERE description_id = %s', [desc_id])
-        catalog_description = (cursor.fetchone() or [''])[0] or ''
-        cursor.execute('SELECT topics_description FROM WEEKLY_TOPIC_OUTLINE WHERE outline_id = %s', [outline_id])
-        weekly_topics = (cursor.fetchone() or [''])[0] or ''
-        cursor.execute(
-            'SELECT design_content_percentage, software_or_labs_tools_used FROM ADDITIONAL_INFORMATION WHERE additional_info_id = %s',
-            [addl_id]
+        section_rows = cursor.fetchall()
+        if not section_rows:
+            return {}
+        syllabus_ids = [int(row[0]) for row in section_rows]
+
+        descriptions = _values_by_id(cursor, 'COURSE_DISCRIPTION', 'description_id', 'catalog_description', [row[4] for row in section_rows])
+        outlines = _values_by_id(cursor, 'WEEKLY_TOPIC_OUTLINE', 'outline_id', 'topics_description', [row[5] for row in section_rows])
+        additional_info = _values_by_id(
+            cursor,
+            'ADDITIONAL_INFORMATION',
+            'additional_info_id',
+            'design_content_percentage, software_or_labs_tools_used',
+            [row[6] for row in section_rows],
         )
-        addl_row = cursor.fetchone() or [0, '']
-        design_content_percentage = float(addl_row[0] or 0)
-        software_tools = addl_row[1] or ''
-
-        cursor.execute('SELECT textbook_id, title_author_year, Attribute FROM TEXTBOOK WHERE syllabus_id = %s ORDER BY textbook_id', [syllabus_id])
-        textbooks = [
-            {'id': int(item[0]), 'title_author_year': item[1] or '', 'attribute': item[2] or ''}
-            for item in cursor.fetchall()
-        ]
 
-        cursor.execute('SELECT material_id, material_discription FROM SUPPLEMENT_MATERIAL WHERE syllabus_id = %s ORDER BY material_id', [syllabus_id])
-        supplements = [
-            {'id': int(item[0]), 'material_discription': item[1] or ''}
-            for item in cursor.fetchall()
-        ]
-
-        cursor.execute('SELECT prerequisite_id, course_code FROM PREREQUISITE WHERE syllabus_id = %s ORDER BY prerequisite_id', [syllabus_id])
-        prerequisites = [
-            {'id': int(item[0]), 'course_code': item[1] or ''}
-            for item in cursor.fetchall()
-        ]
-
-        cursor.execute('SELECT corequisite_id, course_code FROM COREQUISITE WHERE syllabus_id = %s ORDER BY corequisite_id', [syllabus_id])
-        corequisites = [
-            {'id': int(item[0]), 'course_code': item[1] or ''}
-            for item in cursor.fetchall()
-        ]
-
-        cursor.execute('SELECT assessment_id, assesment_type, weight_percentage FROM ASSESMENT WHERE syllabus_id = %s ORDER BY assessment_id', [syllabus_id])
-        assessments = [
-            {'id': int(item[0]), 'assessment_type': item[1] or '', 'weight_percentage': float(item[2] or 0)}
-            for item in cursor.fetchall()
-        ]
-
-        cursor.execute('SELECT clo_id FROM HAS_CLO WHERE syllabus_id = %s ORDER BY clo_id', [syllabus_id])
-        clo_ids = [int(item[0]) for item in cursor.fetchall()]
-
-        _ensure_syllabus_clo_so_map_table()
-        cursor.execute(
-            'SELECT clo_id, so_id FROM SYLLABUS_CLO_SO_MAP WHERE syllabus_id = %s ORDER BY clo_id, so_id',
-            [syllabus_id]
+        textbooks = _rows_by_syllabus(
+            cursor,
+            'SELECT syllabus_id, textbook_id, title_author_year, Attribute FROM TEXTBOOK '
+            'WHERE syllabus_id IN ({syllabus_ids}) ORDER BY textbook_id',
+            syllabus_ids,
+        )
+        supplements = _rows_by_syllabus(
+            cursor,
+            'SELECT syllabus_id, material_id, material_discription FROM SUPPLEMENT_MATERIAL '
+            'WHERE syllabus_id IN ({syllabus_ids}) ORDER BY material_id',
+            syllabus_ids,
+        )
+        prerequisites = _rows_by_syllabus(
+            cursor,
+            'SELECT syllabus_id, prerequisite_id, course_code FROM PREREQUISITE '
+            'WHERE syllabus_id IN ({syllabus_ids}) ORDER BY prerequisite_id',
+            syllabus_ids,
+        )
+        corequisites = _rows_by_syllabus(
+            cursor,
+            'SELECT syllabus_id, corequisite_id, course_code FROM COREQUISITE '
+            'WHERE syllabus_id IN ({syllabus_ids}) ORDER BY corequisite_id',
+            syllabus_ids,
+        )
+        assessments = _rows_by_syllabus(
+            cursor,
+            'SELECT syllabus_id, assessment_id, assesment_type, weight_percentage FROM ASSESMENT '
+            'WHERE syllabus_id IN ({syllabus_ids}) ORDER BY assessment_id',
+            syllabus_ids,
+        )
+        clo_ids = _rows_by_syllabus(
+            cursor,
+            'SELECT syllabus_id, clo_id FROM HAS_CLO WHERE syllabus_id IN ({syllabus_ids}) ORDER BY clo_id',
+            syllabus_ids,
         )
-        saved_pairs = [(int(item[0]), int(item[1])) for item in cursor.fetchall()]
 
-        clo_mappings = []
-        if saved_pairs:
-            mapping_by_clo = {}
-            for clo_id, so_id in saved_pairs:
-                mapping_by_clo.setdefault(clo_id, set()).add(so_id)
-            for clo_id in clo_ids:
-                so_ids = sorted(mapping_by_clo.get(clo_id, set()))
-                if so_ids:
-                    for so_id in so_ids:
-                        clo_mappings.append({'clo_id': clo_id, 'so_id': so_id})
-                else:
-                    clo_mappings.append({'clo_id': clo_id, 'so_id': None})
-        else:
-            # Backward-compatibility for legacy data saved before SYLLABUS_CLO_SO_MAP.
-            for clo_id in clo_ids:
-                cursor.execute('SELECT so_id FROM MAPS_TO WHERE clo_id = %s ORDER BY so_id', [clo_id])
-                so_rows = [int(item[0]) for item in cursor.fetchall()]
-                if so_rows:
-                    for so_id in so_rows:
-                        clo_mappings.append({'clo_id': clo_id, 'so_id': so_id})
-                else:
-                    clo_mappings.append({'clo_id': clo_id, 'so_id': None})
+        saved_pairs = {}
+        if _runtime_table_exists('SYLLABUS_CLO_SO_MAP'):
+            saved_pairs = _rows_by_syllabus(
+                cursor,
+                'SELECT syllabus_id, clo_id, so_id FROM SYLLABUS_CLO_SO_MAP '
+                'WHERE syllabus_id IN ({syllabus_ids}) ORDER BY clo_id, so_id',
+                syllabus_ids,
+            )
+
+        # Backward-compatibility for legacy data saved before SYLLABUS_CLO_SO_MAP.
+        legacy_clo_ids = sorted({
+            int(clo_row[0])
+            for syllabus_id in syllabus_ids
+            if syllabus_id not in saved_pairs
+            for clo_row in clo_ids.get(syllabus_id, [])
+        })
+        legacy_so_ids = {}
+        if legacy_clo_ids:
+            cursor.execute(
+                f'SELECT clo_id, so_id FROM MAPS_TO WHERE clo_id IN ({", ".join(["%s"] * len(legacy_clo_ids))}) ORDER BY so_id',
+                legacy_clo_ids
+            )
+            for clo_id, so_id in cursor.fetchall():
+                legacy_so_ids.setdefault(int(clo_id), []).append(int(so_id))
 
         cursor.execute(
             '''
@@ -4765,41 +5111,85 @@ def _load_syllabus_payload(program_id, cycle_id, course_id, syllabus_id):
             ''',
             [program_id]
         )
-        faculty_options = [
-            {'faculty_id': int(item[0]), 'full_name': item[1] or ''}
-            for item in cursor.fetchall()
-        ]
+        faculty_rows = cursor.fetchall()
 
-    return {
-        'course': {
-            'course_id': int(row[7]),
-            'course_code': row[8] or '',
-            'credits': int(row[9] or 0),
-            'contact_hours': int(row[10] or 0),
-            'course_type': row[11] or 'Required',
-        },
-        'section': {
-            'syllabus_id': int(row[0]),
-            'term': row[1] or '',
-            'faculty_id': int(row[2]) if row[2] is not None and int(row[2]) > 0 else None,
-            'faculty_name': (row[3] or '') if row[2] is not None and int(row[2]) > 0 else '',
-        },
-        'syllabus': {
-            'catalog_description': catalog_description,
-            'weekly_topics': weekly_topics,
-            'design_content_percentage': design_content_percentage,
-            'software_or_labs_tools_used': software_tools,
-            'textbooks': textbooks,
-            'supplements': supplements,
-            'prerequisites': prerequisites,
-            'corequisites': corequisites,
-            'assessments': assessments,
-            'clo_mappings': clo_mappings,
-        },
-        'available_sos': [_serialize_so(item) for item in _program_so_rows(program_id)],
-        'available_clos': [_serialize_clo(item) for item in _program_clo_rows(program_id)],
-        'faculty_options': faculty_options,
-    }
+    so_rows = [_serialize_so(item) for item in _program_so_rows(program_id)]
+    clo_rows = [_serialize_clo(item) for item in _program_clo_rows(program_id)]
+
+    payloads = {}
+    for row in section_rows:
+        syllabus_id = int(row[0])
+        section_clo_ids = [int(item[0]) for item in clo_ids.get(syllabus_id, [])]
+        clo_mappings = []
+        if syllabus_id in saved_pairs:
+            mapping_by_clo = {}
+            for clo_id, so_id in saved_pairs[syllabus_id]:
+                mapping_by_clo.setdefault(int(clo_id), set()).add(int(so_id))
+            so_ids_by_clo = {clo_id: sorted(so_ids) for clo_id, so_ids in mapping_by_clo.items()}
+        else:
+            so_ids_by_clo = legacy_so_ids
+        for clo_id in section_clo_ids:
+            so_ids = so_ids_by_clo.get(clo_id, [])
+            if so_ids:
+                for so_id in so_ids:
+                    clo_mappings.append({'clo_id': clo_id, 'so_id': so_id})
+            else:
+                clo_mappings.append({'clo_id': clo_id, 'so_id': None})
+
+        addl_row = additional_info.get(int(row[6])) or [0, '']
+        payloads[syllabus_id] = {
+            'course': {
+                'course_id': int(row[7]),
+                'course_code': row[8] or '',
+                'credits': int(row[9] or 0),
+                'contact_hours': int(row[10] or 0),
+                'course_type': row[11] or 'Required',
+            },
+            'section': {
+                'syllabus_id': syllabus_id,
+                'term': row[1] or '',
+                'faculty_id': int(row[2]) if row[2] is not None and int(row[2]) > 0 else None,
+                'faculty_name': (row[3] or '') if row[2] is not None and int(row[2]) > 0 else '',
+            },
+            'syllabus': {
+                'catalog_description': (descriptions.get(int(row[4])) or [''])[0] or '',
+                'weekly_topics': (outlines.get(int(row[5])) or [''])[0] or '',
+                'design_content_percentage': float(addl_row[0] or 0),
+                'software_or_labs_tools_used': addl_row[1] or '',
+                'textbooks': [
+                    {'id': int(item[0]), 'title_author_year': item[1] or '', 'attribute': item[2] or ''}
+                    for item in textbooks.get(syllabus_id, [])
+                ],
+                'supplements': [
+                    {'id': int(item[0]), 'material_discription': item[1] or ''}
+                    for item in supplements.get(syllabus_id, [])
+                ],
+                'prerequisites': [
+                    {'id': int(item[0]), 'course_code': item[1] or ''}
+                    for item in prerequisites.get(syllabus_id, [])
+                ],
+                'corequisites': [
+                    {'id': int(item[0]), 'course_code': item[1] or ''}
+                    for item in corequisites.get(syllabus_id, [])
+                ],
+                'assessments': [
+                    {'id': int(item[0]), 'assessment_type': item[1] or '', 'weight_percentage': float(item[2] or 0)}
+                    for item in assessments.get(syllabus_id, [])
+                ],
+                'clo_mappings': clo_mappings,
+            },
+            'available_sos': [dict(item) for item in so_rows],
+            'available_clos': [dict(item) for item in clo_rows],
+            'faculty_options': [
+                {'faculty_id': int(item[0]), 'full_name': item[1] or ''}
+                for item in faculty_rows
+            ],
+        }
+    return payloads
+
+
+def _load_syllabus_payload(program_id, cycle_id, course_id, syllabus_id):
+    return _load_syllabus_payloads(program_id, cycle_id, [syllabus_id], course_id=course_id).get(int(syllabus_id))
 
 
 @api_view(['GET', 'PUT'])
@@ -5038,6 +5428,7 @@ def program_syllabus_detail(request, program_id, course_id, syllabus_id):
                     )
 
     refreshed = _load_syllabus_payload(program_id, cycle.cycle_id, course_id, syllabus_id)
+    touch_program_sections([program_id], 'courses')
     return Response(refreshed)
 
 
@@ -5082,6 +5473,7 @@ def program_faculty_members(request, program_id):
                 'INSERT INTO ASSIGNED_TO (program_id, Faculty_ID) VALUES (%s, %s)',
                 [program_id, faculty_id]
             )
+    touch_program_sections([program_id], 'faculty')
     return Response({'detail': 'Faculty assigned successfully.'}, status=status.HTTP_201_CREATED)
 
 
@@ -5127,6 +5519,7 @@ def program_faculty_member_delete(request, program_id, faculty_id):
 
               cursor.execute('DELETE FROM FACULTY_MEMBER WHERE Faculty_ID = %s', [faculty_id])
 
+    touch_program_sections([program_id], 'faculty', 'courses')
     return Response({'detail': 'Faculty member deleted successfully.'}, status=status.HTTP_200_OK)
 
 
@@ -5146,36 +5539,7 @@ def faculty_member_profile(request, faculty_id):
             return Response({'detail': 'cycle_id must be an integer.'}, status=status.HTTP_400_BAD_REQUEST)
 
     if request.method == 'GET':
-        qualification = Qualification.objects.filter(faculty_id=faculty_id).order_by('-qualification_id').first()
-        profile_payload = {
-            'qualification': {
-                'degree_field': qualification.degree_field if qualification else '',
-                'degree_institution': qualification.degree_institution if qualification else '',
-                'degree_year': qualification.degree_year if qualification else '',
-                'years_industry_government': qualification.years_industry_government if qualification else '',
-                'years_at_institution': qualification.years_at_institution if qualification else '',
-            },
-            'certifications': list(Certification.objects.filter(faculty_id=faculty_id).order_by('certification_id').values_list('certification_title', flat=True)),
-            'memberships': list(ProfessionalMembership.objects.filter(faculty_id=faculty_id).order_by('membership_id').values_list('membership_description', flat=True)),
-            'industry_experience': list(IndustryExperience.objects.filter(faculty_id=faculty_id).order_by('experience_id').values_list('experience_discription', flat=True)),
-            'honors': list(HonorAward.objects.filter(faculty_id=faculty_id).order_by('award_id').values_list('award_discription', flat=True)),
-            'services': list(ServiceActivity.objects.filter(faculty_id=faculty_id).order_by('service_id').values_list('service_description', flat=True)),
-            'publications': list(Publication.objects.filter(faculty_id=faculty_id).order_by('publication_id').values_list('publication_discription', flat=True)),
-        }
-        if cycle_id:
-            criterion6 = Criterion6Faculty.objects.filter(cycle_id=cycle_id).order_by('-criterion6_id').first()
-            if criterion6:
-                profile_payload['development_activities'] = list(
-                    ProfessionalDevelopment.objects.filter(faculty_id=faculty_id, criterion6_id=criterion6.criterion6_id)
-                    .order_by('development_id')
-                    .values_list('activity_description', flat=True)
-                )
-            else:
-                profile_payload['development_activities'] = []
-        else:
-            profile_payload['development_activities'] = list(
-                ProfessionalDevelopment.objects.filter(faculty_id=faculty_id).order_by('development_id').values_list('activity_description', flat=True)
-            )
+        profile_payload = _serialize_faculty_profile_payload(faculty.faculty_id, cycle_id)
         return Response(profile_payload)
 
     def _next_id(model_cls, field_name):
@@ -5264,4 +5628,7 @@ def faculty_member_profile(request, faculty_id):
             for index, value in enumerate(development_activities)
         ])
 
+    touch_faculty_sections(faculty_id)
+    if cycle_id:
+        touch_cycle_sections([cycle_id], ['criterion6', 'appendixB'])
     return Response({'detail': 'Faculty profile saved successfully.'})
@@ -0,0 +1,62 @@
+"""Time clone_cycle on a large seeded cycle in a throwaway SQLite database.
+
+The cycle is seeded like benchmark_self_study_parallel.py: one section and a
+full syllabus per course. Each round clones the source cycle inside a
+transaction that is rolled back, so every round copies the same rows.
+
+    python scripts/benchmark_cycle_clone.py --courses 200 --rounds 5
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "backend.settings")
+
+import django
+from django.conf import settings
+
+from benchmark_self_study_parallel import create_schema, seed
+
+
+def time_clones(cycle, rounds):
+    from django.db import transaction
+    from abet_criteria.cycle_graph import clone_cycle
+
+    timings = []
+    for _ in range(rounds):
+        with transaction.atomic():
+            started = time.perf_counter()
+            clone_cycle(cycle.cycle_id, cycle.end_year, cycle.end_year + 2)
+            timings.append(time.perf_counter() - started)
+            transaction.set_rollback(True)
+    return min(timings), sum(timings) / len(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--courses", type=int, default=200)
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        settings.DATABASES["default"]["NAME"] = os.path.join(directory, "benchmark.sqlite3")
+        settings.ALLOWED_HOSTS = [*settings.ALLOWED_HOSTS, "testserver"]
+        django.setup()
+
+        from django.test import Client
+
+        create_schema()
+        cycle = seed(Client(), args.courses, 0)
+        print(f"seeded cycle {cycle.cycle_id}: {args.courses} courses")
+
+        best, mean = time_clones(cycle, args.rounds)
+        print(f"{'clone':>12}: best {best * 1000:8.1f} ms   mean {mean * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
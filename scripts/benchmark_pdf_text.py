@@ -0,0 +1,288 @@
+"""Compare the object-level PDF text extractor with the regex extractor it
+replaced, on generated text and scanned-style PDFs plus any PDFs given on the
+command line.
+
+Scanned-style PDFs carry one large incompressible image per page and a thin
+text layer, like OCR output from a copier; --scan-mb sets their size.
+
+    python scripts/benchmark_pdf_text.py --scan-mb 20 50 /path/to/sample.pdf
+"""
+import argparse
+import os
+import random
+import re
+import sys
+import time
+import tracemalloc
+import zlib
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from abet_criteria.textbox_ai import _clean_text, _dedupe_and_limit_chunks, _extract_text_from_pdf_bytes
+
+
+# Regex extractor from abet_criteria/textbox_ai.py before the object-level engine.
+
+def _decode_pdf_text_bytes(raw_bytes):
+    if not raw_bytes:
+        return ''
+    candidate = bytes(raw_bytes)
+    if candidate.startswith(b'\xfe\xff') or candidate.startswith(b'\xff\xfe'):
+        for encoding in ('utf-16', 'utf-16-be', 'utf-16-le'):
+            try:
+                return _clean_text(candidate.decode(encoding))
+            except UnicodeDecodeError:
+                continue
+    if candidate.count(b'\x00') > max(1, len(candidate) // 8):
+        for encoding in ('utf-16-be', 'utf-16-le'):
+            try:
+                return _clean_text(candidate.decode(encoding))
+            except UnicodeDecodeError:
+                continue
+    for encoding in ('utf-8', 'latin-1'):
+        try:
+            return _clean_text(candidate.decode(encoding))
+        except UnicodeDecodeError:
+            continue
+    return ''
+
+
+def _decode_pdf_literal_string(raw_bytes):
+    decoded = bytearray()
+    index = 0
+    escape_map = {
+        ord('n'): b'\n',
+        ord('r'): b'\r',
+        ord('t'): b'\t',
+        ord('b'): b'\b',
+        ord('f'): b'\f',
+        ord('('): b'(',
+        ord(')'): b')',
+        ord('\\'): b'\\',
+    }
+
+    while index < len(raw_bytes):
+        byte = raw_bytes[index]
+        if byte != 92:  # backslash
+            decoded.append(byte)
+            index += 1
+            continue
+
+        index += 1
+        if index >= len(raw_bytes):
+            break
+        escaped = raw_bytes[index]
+
+        if escaped in escape_map:
+            decoded.extend(escape_map[escaped])
+            index += 1
+            continue
+
+        if escaped in (10, 13):
+            if escaped == 13 and index + 1 < len(raw_bytes) and raw_bytes[index + 1] == 10:
+                index += 1
+            index += 1
+            continue
+
+        if 48 <= escaped <= 55:
+            octal_digits = bytes([escaped])
+            extra_index = index + 1
+            while extra_index < len(raw_bytes) and len(octal_digits) < 3 and 48 <= raw_bytes[extra_index] <= 55:
+                octal_digits += bytes([raw_bytes[extra_index]])
+                extra_index += 1
+            decoded.append(int(octal_digits, 8))
+            index = extra_index
+            continue
+
+        decoded.append(escaped)
+        index += 1
+
+    return _decode_pdf_text_bytes(bytes(decoded))
+
+
+def _decode_pdf_hex_string(raw_bytes):
+    hex_text = re.sub(rb'[^0-9A-Fa-f]', b'', raw_bytes or b'')
+    if not hex_text:
+        return ''
+    if len(hex_text) % 2 == 1:
+        hex_text += b'0'
+    try:
+        decoded = bytes.fromhex(hex_text.decode('ascii'))
+    except ValueError:
+        return ''
+    return _decode_pdf_text_bytes(decoded)
+
+
+def _extract_pdf_text_chunks_from_stream(stream_bytes):
+    chunks = []
+    stream_candidates = []
+    seen_candidates = set()
+
+    for candidate in (stream_bytes,):
+        if candidate not in seen_candidates:
+            seen_candidates.add(candidate)
+            stream_candidates.append(candidate)
+        for wbits in (zlib.MAX_WBITS, -zlib.MAX_WBITS):
+            try:
+                inflated = zlib.decompress(candidate, wbits)
+            except Exception:
+                continue
+            if inflated not in seen_candidates:
+                seen_candidates.add(inflated)
+                stream_candidates.append(inflated)
+
+    for candidate in stream_candidates:
+        for text_block in re.findall(rb'BT(.*?)ET', candidate, flags=re.DOTALL):
+            for array_match in re.finditer(rb'\[(.*?)\]\s*TJ', text_block, flags=re.DOTALL):
+                array_text = array_match.group(1)
+                for literal in re.finditer(rb'\((.*?)(?<!\\)\)', array_text, flags=re.DOTALL):
+                    decoded = _decode_pdf_literal_string(literal.group(1))
+                    if decoded:
+                        chunks.append(decoded)
+                for hex_match in re.finditer(rb'<([0-9A-Fa-f\s]+)>', array_text):
+                    decoded = _decode_pdf_hex_string(hex_match.group(1))
+                    if decoded:
+                        chunks.append(decoded)
+
+            for literal in re.finditer(rb'\((.*?)(?<!\\)\)\s*(?:Tj|\'|")', text_block, flags=re.DOTALL):
+                decoded = _decode_pdf_literal_string(literal.group(1))
+                if decoded:
+                    chunks.append(decoded)
+            for hex_match in re.finditer(rb'<([0-9A-Fa-f\s]+)>\s*Tj', text_block, flags=re.DOTALL):
+                decoded = _decode_pdf_hex_string(hex_match.group(1))
+                if decoded:
+                    chunks.append(decoded)
+
+    return chunks
+
+
+def legacy_extract_text_from_pdf_bytes(file_bytes):
+    chunks = []
+    for stream_bytes in re.findall(rb'stream\s*(.*?)\s*endstream', file_bytes, flags=re.DOTALL):
+        chunks.extend(_extract_pdf_text_chunks_from_stream(stream_bytes))
+
+    if not chunks:
+        for match in re.findall(rb'\((.*?)(?<!\\)\)', file_bytes, flags=re.DOTALL):
+            decoded = _decode_pdf_literal_string(match)
+            if decoded:
+                chunks.append(decoded)
+
+    return _dedupe_and_limit_chunks(chunks, max_chunks=80, max_total_chars=16000)
+
+
+def build_pdf(pages):
+    """Return PDF bytes with an xref table for [(content stream bytes, image bytes or None)]."""
+    objects = []
+
+    def add(body):
+        objects.append(body)
+        return len(objects)
+
+    page_ids = []
+    pages_id = add(None)
+    for content, image in pages:
+        resources = b'/Font << /F1 << /Type /Font /Subtype /Type1 /BaseFont /Helvetica >> >>'
+        if image is not None:
+            image_id = add(
+                b'<< /Type /XObject /Subtype /Image /Width 2480 /Height 3508 /ColorSpace /DeviceGray'
+                b' /BitsPerComponent 8 /Filter /DCTDecode /Length ' + str(len(image)).encode() + b' >>\nstream\n'
+                + image + b'\nendstream'
+            )
+            resources += b' /XObject << /Im1 ' + str(image_id).encode() + b' 0 R >>'
+            content = b'q 595 0 0 842 0 0 cm /Im1 Do Q\n' + content
+        compressed = zlib.compress(content)
+        content_id = add(b'<< /Length ' + str(len(compressed)).encode() + b' /Filter /FlateDecode >>\nstream\n' + compressed + b'\nendstream')
+        page_ids.append(add(
+            b'<< /Type /Page /Parent ' + str(pages_id).encode() + b' 0 R /MediaBox [0 0 595 842]'
+            b' /Resources << ' + resources + b' >> /Contents ' + str(content_id).encode() + b' 0 R >>'
+        ))
+    kids = b' '.join(str(page_id).encode() + b' 0 R' for page_id in page_ids)
+    objects[pages_id - 1] = b'<< /Type /Pages /Kids [' + kids + b'] /Count ' + str(len(page_ids)).encode() + b' >>'
+    catalog_id = add(b'<< /Type /Catalog /Pages ' + str(pages_id).encode() + b' 0 R >>')
+
+    output = bytearray(b'%PDF-1.4\n%\xe2\xe3\xcf\xd3\n')
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(output))
+        output += str(number).encode() + b' 0 obj\n' + body + b'\nendobj\n'
+    xref_at = len(output)
+    output += b'xref\n0 ' + str(len(objects) + 1).encode() + b'\n0000000000 65535 f \n'
+    for offset in offsets:
+        output += b'%010d 00000 n \n' % offset
+    output += (
+        b'trailer\n<< /Size ' + str(len(objects) + 1).encode() + b' /Root ' + str(catalog_id).encode()
+        + b' 0 R >>\nstartxref\n' + str(xref_at).encode() + b'\n%%EOF\n'
+    )
+    return bytes(output)
+
+
+WORDS = (
+    'assessment curriculum outcome faculty committee review program students course design laboratory '
+    'evaluation criteria improvement objectives survey alumni industry advisory capstone engineering'
+).split()
+
+
+def page_text(rng, lines):
+    rows = [b'BT /F1 11 Tf 72 770 Td 14 TL']
+    for _ in range(lines):
+        words = ' '.join(rng.choice(WORDS) for _ in range(12))
+        rows.append(b'(' + words.encode('ascii') + b") '")
+    rows.append(b'ET')
+    return b'\n'.join(rows)
+
+
+def generated_corpus(scan_sizes):
+    rng = random.Random(7)
+    corpus = [('text, 40 pages', build_pdf([(page_text(rng, 45), None) for _ in range(40)]))]
+    for size_mb in scan_sizes:
+        page_count = max(1, int(size_mb))
+        image_size = int(size_mb * 1024 * 1024 / page_count)
+        pages = [(page_text(rng, 3), rng.randbytes(image_size)) for _ in range(page_count)]
+        corpus.append((f'scanned, {size_mb:g} MB', build_pdf(pages)))
+    return corpus
+
+
+def measure(extract, data, rounds):
+    timings = []
+    for _ in range(rounds):
+        started = time.perf_counter()
+        try:
+            text = extract(data)
+        except Exception as exc:
+            return None, None, f'{type(exc).__name__}: {exc}'
+        timings.append(time.perf_counter() - started)
+    tracemalloc.start()
+    extract(data)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return min(timings), peak, text
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("paths", nargs="*", help="extra PDF files to include")
+    parser.add_argument("--scan-mb", type=float, nargs="*", default=[20, 50])
+    parser.add_argument("--rounds", type=int, default=1)
+    args = parser.parse_args()
+
+    corpus = generated_corpus(args.scan_mb)
+    corpus.extend((os.path.basename(path), Path(path).read_bytes()) for path in args.paths)
+
+    print(f"{'file':<28}{'size':>9}{'regex ms':>11}{'object ms':>11}{'speedup':>9}{'regex peak':>12}{'object peak':>13}{'chars':>13}")
+    for label, data in corpus:
+        old_time, old_peak, old_text = measure(legacy_extract_text_from_pdf_bytes, data, args.rounds)
+        new_time, new_peak, new_text = measure(_extract_text_from_pdf_bytes, data, args.rounds)
+        if old_time is None:
+            print(f"{label[:27]:<28}{len(data) / 1048576:>7.1f}MB  regex extractor failed ({old_text}); object {new_time * 1000:.1f} ms, {len(new_text)} chars")
+            continue
+        print(
+            f"{label[:27]:<28}{len(data) / 1048576:>7.1f}MB{old_time * 1000:>11.1f}{new_time * 1000:>11.1f}"
+            f"{old_time / max(new_time, 1e-9):>8.1f}x{old_peak / 1048576:>10.1f}MB{new_peak / 1048576:>11.1f}MB"
+            f"{len(old_text):>6}/{len(new_text):<6}"
+        )
+
+
+if __name__ == "__main__":
+    main()
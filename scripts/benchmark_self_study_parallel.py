@@ -0,0 +1,182 @@
+"""Time a cold self-study build with sections built sequentially and on the
+section thread pool. Seeds a large cycle into a throwaway SQLite database.
+
+SQLite answers in-process, so by itself it hides the round trips a database
+server adds to every query. --latency-ms sleeps that long per query to model
+one (about 1 ms on the same host, more across hosts).
+
+    python scripts/benchmark_self_study_parallel.py --courses 120 --faculty 60 --workers 4 --latency-ms 1
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "backend.settings")
+
+import django
+from django.conf import settings
+
+
+def seed(client, courses, faculty):
+    from abet_criteria.models import AccreditationCycle, FacultyMember, Program
+
+    program = Program.objects.create(program_name="Benchmark Program", program_level="Undergraduate")
+    response = client.post(
+        f"/api/programs/{program.program_id}/cycles/",
+        {"start_year": 2022, "end_year": 2024},
+        content_type="application/json",
+    )
+    cycle = AccreditationCycle.objects.get(pk=response.json()["id"])
+    base = f"/api/programs/{program.program_id}"
+
+    so_ids = [
+        client.post(f"{base}/student-outcomes/", {"so_discription": f"Outcome {index}"}, content_type="application/json").json()["so_id"]
+        for index in range(1, 8)
+    ]
+    for index in range(courses):
+        code = f"EECE {200 + index}"
+        course = client.post(
+            f"{base}/courses/?cycle_id={cycle.cycle_id}",
+            {"course_code": code, "credits": 3, "contact_hours": 3},
+            content_type="application/json",
+        ).json()
+        section = client.post(
+            f"{base}/courses/{course['id']}/sections/?cycle_id={cycle.cycle_id}",
+            {"term": "Fall 2023"},
+            content_type="application/json",
+        ).json()
+        clo = client.post(f"{base}/clos/", {"description": f"CLO for {code}"}, content_type="application/json").json()
+        client.put(
+            f"{base}/courses/{course['id']}/sections/{section['id']}/syllabus/?cycle_id={cycle.cycle_id}",
+            {
+                "syllabus": {
+                    "catalog_description": f"{code} catalog description " * 10,
+                    "weekly_topics": "\n".join(f"Week {week}: topic" for week in range(1, 15)),
+                    "design_content_percentage": 25,
+                    "textbooks": [{"title_author_year": "Circuits, 2020", "attribute": "Required"}],
+                    "prerequisites": [{"course_code": "MATH 201"}],
+                    "assessments": [{"assessment_type": "Final", "weight_percentage": 40}],
+                    "clo_mappings": [{"clo_id": clo["clo_id"], "so_id": so_ids[index % len(so_ids)]}],
+                },
+            },
+            content_type="application/json",
+        )
+
+    for index in range(faculty):
+        faculty_id = 10000 + index
+        FacultyMember.objects.create(
+            faculty_id=faculty_id,
+            full_name=f"Faculty {index}",
+            academic_rank="Professor",
+            appointment_type="FT",
+            email=f"faculty{index}@example.edu",
+        )
+        client.post(f"{base}/faculty-members/", {"faculty_id": faculty_id}, content_type="application/json")
+        client.put(
+            f"/api/faculty-members/{faculty_id}/profile/?cycle_id={cycle.cycle_id}",
+            {
+                "qualification": {"degree_field": "EE", "degree_institution": "AUB", "degree_year": 2010},
+                "certifications": [f"Certification {n}" for n in range(3)],
+                "publications": [f"Publication {n}" for n in range(8)],
+                "development_activities": [f"Workshop {n}" for n in range(4)],
+            },
+            content_type="application/json",
+        )
+    return cycle
+
+
+def create_schema():
+    from django.core.management import call_command
+    from django.db import connection
+    from abet_criteria.db_setup import ensure_local_schema
+
+    call_command("migrate", verbosity=0)
+    # Legacy tables come from the deployed schema (composite join-table keys,
+    # nullable COURSE foreign keys); ensure_local_schema fills in the rest.
+    with connection.cursor() as cursor:
+        for statement in (ROOT / "sql" / "manual_schema_additions.sql").read_text().split(";"):
+            if statement.strip():
+                cursor.execute(statement)
+    ensure_local_schema()
+
+
+def simulated_round_trip(latency):
+    def wrapper(execute, sql, params, many, context):
+        time.sleep(latency)
+        return execute(sql, params, many, context)
+    return wrapper
+
+
+def install_latency(latency):
+    from django.db.backends.signals import connection_created
+
+    def on_connection(sender, connection, **kwargs):
+        # The wrapper list outlives reconnects of the same thread's connection.
+        if not getattr(connection, "benchmark_latency", False):
+            connection.execute_wrappers.append(simulated_round_trip(latency))
+            connection.benchmark_latency = True
+
+    # Pool threads open their own connections, so wrap every new one.
+    connection_created.connect(on_connection, weak=False)
+
+
+def time_builds(cycle_id, rounds):
+    from django.core.cache import cache
+    from django.db import connection
+    from abet_criteria.models import AccreditationCycle
+    from abet_criteria.views import _build_self_study_payload
+
+    timings = []
+    for _ in range(rounds):
+        cache.clear()
+        connection.close()
+        cycle = AccreditationCycle.objects.get(pk=cycle_id)
+        started = time.perf_counter()
+        _build_self_study_payload(cycle)
+        timings.append(time.perf_counter() - started)
+    return min(timings), sum(timings) / len(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--courses", type=int, default=120)
+    parser.add_argument("--faculty", type=int, default=60)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        settings.DATABASES["default"]["NAME"] = os.path.join(directory, "benchmark.sqlite3")
+        settings.ALLOWED_HOSTS = [*settings.ALLOWED_HOSTS, "testserver"]
+        django.setup()
+
+        from django.test import Client
+        from abet_criteria import self_study_cache
+
+        create_schema()
+        cycle = seed(Client(), args.courses, args.faculty)
+        print(f"seeded cycle {cycle.cycle_id}: {args.courses} courses, {args.faculty} faculty")
+        if args.latency_ms:
+            install_latency(args.latency_ms / 1000)
+            print(f"simulating {args.latency_ms:g} ms per query")
+
+        results = {}
+        for workers in (0, args.workers):
+            self_study_cache.SELF_STUDY_PARALLEL_WORKERS = workers
+            results[workers] = time_builds(cycle.cycle_id, args.rounds)
+            best, mean = results[workers]
+            label = "sequential" if workers == 0 else f"{workers} workers"
+            print(f"{label:>12}: best {best * 1000:8.1f} ms   mean {mean * 1000:8.1f} ms")
+
+        speedup = results[0][0] / results[args.workers][0]
+        print(f"{'speedup':>12}: {speedup:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -10,6 +10,10 @@ import { buildTextboxAiStatus, extractTextboxSectionWithLocalAi } from '../utils
 
 const BG_DOCS_DB_NAME = 'abet-background-documents';
 const BG_DOCS_STORE = 'documents';
+const AI_DRAFT_POLL_INTERVAL_MS = 1500;
+// A queued job nobody picks up usually means the run_ai_draft_worker process is not running.
+const AI_DRAFT_MAX_QUEUED_MS = 2 * 60 * 1000;
+const AI_DRAFT_MAX_WAIT_MS = 15 * 60 * 1000;
 
 const openBackgroundDocsDb = () => new Promise((resolve, reject) => {
   const request = window.indexedDB.open(BG_DOCS_DB_NAME, 1);
@@ -276,10 +280,26 @@ const BACKGROUND_TEXTBOX_SECTION_FIELDS = {
           return { sectionId, fieldKey };
         });
 
-        const result = await apiRequest(`/cycles/${cycleId}/self-study/ai-draft/`, {
+        let job = await apiRequest(`/cycles/${cycleId}/self-study/ai-draft/`, {
           method: 'POST',
           body: JSON.stringify({ selectedFields, saveToBackend: true })
         });
+        const pollStartedAt = Date.now();
+        while (job?.status === 'queued' || job?.status === 'running') {
+          const waitedMs = Date.now() - pollStartedAt;
+          if (job.status === 'queued' && waitedMs > AI_DRAFT_MAX_QUEUED_MS) {
+            throw new Error('The AI drafting job was not picked up. Check that the AI draft worker is running, then try again.');
+          }
+          if (waitedMs > AI_DRAFT_MAX_WAIT_MS) {
+            throw new Error('AI drafting is taking longer than expected. Try again later with fewer fields.');
+          }
+          await new Promise((resolve) => setTimeout(resolve, AI_DRAFT_POLL_INTERVAL_MS));
+          job = await apiRequest(`/cycles/${cycleId}/self-study/ai-draft/${job.job_id}/`);
+        }
+        if (job?.status !== 'succeeded') {
+          throw new Error(job?.detail || 'AI drafting did not finish.');
+        }
+        const result = job.result;
 
         if (!result?.payload) {
           throw new Error('The AI drafting response did not include a report payload.');